@@ -0,0 +1,4 @@
+"""Performance benchmarks.
+
+Run with `python -m benchmarks --help` to see options.
+"""
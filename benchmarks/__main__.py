@@ -0,0 +1,121 @@
+"""Benchmarks command line interface.
+
+Examples:
+    python -m benchmarks --output results.json
+    python -m benchmarks --cases find_articles --sizes 10 1000
+    python -m benchmarks --baseline results.json
+"""
+
+
+import asyncio
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.cases import CASES
+from benchmarks.runner import BenchmarkReport, compare_reports, run_benchmarks
+
+# Datasets sizes used by default
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+# Number of measured runs by default
+DEFAULT_REPEAT = 3
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    cases_names = [case.name for case in CASES]
+    parser = ArgumentParser(
+        prog='python -m benchmarks',
+        description='Measure pricing, conversion and report pipeline.',
+    )
+    parser.add_argument(
+        '--cases',
+        nargs='+',
+        choices=cases_names,
+        default=cases_names,
+        help='Cases to run. All by default.',
+    )
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=DEFAULT_SIZES,
+        help='Datasets sizes.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=DEFAULT_REPEAT,
+        help='Number of measured runs of each case.',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help='File to save results as JSON.',
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        help='JSON results of previous run to compare with.',
+    )
+    return parser.parse_args()
+
+
+def print_results(
+    report: BenchmarkReport,
+    baseline: Optional[BenchmarkReport],
+) -> None:
+    """Print results table.
+
+    Args:
+        report: Current results.
+        baseline: Previous results to compare with.
+    """
+    comparison = compare_reports(
+        baseline or BenchmarkReport(
+            commit=None,
+            python='',
+            created_at='',
+            cases_results=[],
+        ),
+        report,
+    )
+    for benchmark_result, ratio in comparison:
+        line = '{name:<28} {size:>8} {median:>12.6f}s {calls:>8.1f} calls'
+        if ratio is not None:
+            line = '{line} {ratio:>7.2f}x'.format(line=line, ratio=ratio)
+
+        print(line.format(  # noqa: WPS421
+            name=benchmark_result.name,
+            size=benchmark_result.size,
+            median=benchmark_result.median_time,
+            calls=benchmark_result.calls,
+        ))
+
+
+def main() -> None:
+    """Run benchmarks, print and save results."""
+    args = parse_args()
+    baseline = None
+    if args.baseline is not None:
+        baseline = BenchmarkReport.model_validate_json(
+            args.baseline.read_text(),
+        )
+
+    report = asyncio.run(run_benchmarks(
+        [case for case in CASES if case.name in args.cases],
+        args.sizes,
+        args.repeat,
+    ))
+    print_results(report, baseline)
+    if args.output is not None:
+        args.output.write_text(report.model_dump_json(indent=2))
+
+
+if __name__ == '__main__':
+    main()
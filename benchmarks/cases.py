@@ -0,0 +1,208 @@
+"""Benchmark cases.
+
+Each case prepares data of requested size in `setup`,
+then `run` is measured. Preparation time is not measured.
+"""
+
+
+from decimal import Decimal
+from typing import Optional
+
+from benchmarks.datasets import (
+    generate_articles,
+    generate_articles_items,
+    generate_calculations_results,
+)
+from benchmarks.stubs import LocalDeta, LocalFixerService
+from chip_logistics.bot.views.calcs.article_select import (
+    ARTICLES_SELECT_PAGE_SIZE,
+    build_article_select_kb,
+)
+from chip_logistics.core.articles.articles import calculate_articles_price
+from chip_logistics.core.articles.cache import CachedArticlesRepo, CatalogCache
+from chip_logistics.core.articles.calcs import calculate_article_price
+from chip_logistics.core.articles.models import ArticlesPage
+from chip_logistics.core.articles.report import create_calculations_report
+from chip_logistics.deta.articles.repo import DetaArticlesRepo
+from chip_logistics.utils.closing import AClosing
+
+# Query used to search articles
+SEARCH_QUERY = 'chip'
+
+
+class BenchmarkCase(AClosing):
+    """Benchmark case interface."""
+
+    # Case name used in results
+    name = ''
+
+    # Max dataset size, that case can be measured on in reasonable time
+    max_size: Optional[int] = None
+
+    async def setup(self, size: int) -> None:
+        """Prepare dataset.
+
+        Args:
+            size: Dataset size.
+        """
+
+    async def run(self) -> None:
+        """Run measured code."""
+
+    def count_calls(self) -> int:
+        """Count calls of external services stand-ins.
+
+        Returns:
+            Number of calls since setup.
+        """
+        return 0
+
+
+class ArticlePriceCase(BenchmarkCase):
+    """Calculate prices of items one by one."""
+
+    name = 'calculate_article_price'
+
+    async def setup(self, size: int) -> None:
+        """Generate items.
+
+        Args:
+            size: Number of items.
+        """
+        self._articles_items = generate_articles_items(size)
+
+    async def run(self) -> None:
+        """Calculate prices."""
+        for article_item in self._articles_items:
+            calculate_article_price(article_item)
+
+
+class ArticlesPriceCase(BenchmarkCase):
+    """Convert items prices with cached rates and calculate prices."""
+
+    name = 'calculate_articles_price'
+
+    async def setup(self, size: int) -> None:
+        """Generate items and warm up rates cache.
+
+        Args:
+            size: Number of items.
+        """
+        self._articles_items = generate_articles_items(size)
+        self._currencies_service = LocalFixerService()
+        await self.run()
+        self._currencies_service.api_calls = 0
+
+    async def run(self) -> None:
+        """Convert and calculate prices."""
+        await calculate_articles_price(
+            self._currencies_service,
+            self._articles_items,
+        )
+
+    async def aclose(self) -> None:
+        """Close currencies service."""
+        await self._currencies_service.aclose()
+
+    def count_calls(self) -> int:
+        """Count Fixer API calls.
+
+        Returns:
+            Number of calls since setup.
+        """
+        return self._currencies_service.api_calls
+
+
+class CalculationsReportCase(BenchmarkCase):
+    """Generate Excel report."""
+
+    name = 'create_calculations_report'
+
+    async def setup(self, size: int) -> None:
+        """Generate items with prices.
+
+        Args:
+            size: Number of items.
+        """
+        self._calculations_results = generate_calculations_results(size)
+        self._total_price = sum(
+            (price for _, price in self._calculations_results),
+            Decimal(0),
+        )
+
+    async def run(self) -> None:
+        """Generate report."""
+        create_calculations_report(
+            self._calculations_results,
+            self._total_price,
+            'Customer',
+        )
+
+
+class ArticleSelectKbCase(BenchmarkCase):
+    """Build articles select keyboard for the first page."""
+
+    name = 'build_article_select_kb'
+
+    async def setup(self, size: int) -> None:
+        """Generate articles page.
+
+        Args:
+            size: Number of articles in catalog.
+        """
+        articles = generate_articles(size)
+        self._page = ArticlesPage(
+            articles=articles[:ARTICLES_SELECT_PAGE_SIZE],
+            has_previous=False,
+            has_next=size > ARTICLES_SELECT_PAGE_SIZE,
+        )
+
+    async def run(self) -> None:
+        """Build keyboard."""
+        build_article_select_kb(self._page)
+
+
+class FindArticlesCase(BenchmarkCase):
+    """Search articles by name in cached Deta Base stand-in catalog."""
+
+    name = 'find_articles'
+
+    async def setup(self, size: int) -> None:
+        """Fill base with articles and load them to the cache.
+
+        Args:
+            size: Number of articles.
+        """
+        self._deta = LocalDeta()
+        self._repo = CachedArticlesRepo(
+            DetaArticlesRepo(self._deta),  # type: ignore
+            CatalogCache(),
+        )
+        await self._repo.put_articles(generate_articles(size))
+        await self._repo.get_articles()
+        self._setup_calls = self._deta.calls
+
+    async def run(self) -> None:
+        """Find articles."""
+        await self._repo.find_articles(SEARCH_QUERY)
+
+    async def aclose(self) -> None:
+        """Close repository."""
+        await self._repo.aclose()
+
+    def count_calls(self) -> int:
+        """Count Deta Base calls.
+
+        Returns:
+            Number of calls since setup.
+        """
+        return self._deta.calls - self._setup_calls
+
+
+CASES: tuple[type[BenchmarkCase], ...] = (
+    ArticlePriceCase,
+    ArticlesPriceCase,
+    CalculationsReportCase,
+    ArticleSelectKbCase,
+    FindArticlesCase,
+)
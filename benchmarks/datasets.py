@@ -0,0 +1,121 @@
+"""Synthetic datasets for benchmarks.
+
+Datasets are generated with fixed seed, so runs are comparable.
+"""
+
+
+from decimal import Decimal
+from random import Random
+
+from chip_logistics.core.articles.calcs import calculate_article_price
+from chip_logistics.core.articles.models import (
+    ArticleInfo,
+    ArticleItem,
+    Currency,
+)
+
+# Upper bounds of random items values
+MAX_COUNT = 5000
+MAX_UNIT_WEIGHT_GRAMS = 100000
+MAX_UNIT_PRICE_CENTS = 100000
+MAX_DUTY_FEE_PERCENTS = 200
+
+# Words to compose articles names
+NAME_WORDS = (
+    'resistor',
+    'capacitor',
+    'diode',
+    'transistor',
+    'chip',
+    'relay',
+    'fuse',
+    'inductor',
+)
+
+
+def generate_article_name(random: Random, number: int) -> str:
+    """Generate article name of two words and number.
+
+    Args:
+        random: Random generator.
+        number: Article number.
+
+    Returns:
+        Article name.
+    """
+    return '{first} {second} {number}'.format(
+        first=random.choice(NAME_WORDS).capitalize(),  # noqa: S311
+        second=random.choice(NAME_WORDS),  # noqa: S311
+        number=number,
+    )
+
+
+def generate_articles(size: int) -> list[ArticleInfo]:
+    """Generate articles catalog.
+
+    Args:
+        size: Number of articles.
+
+    Returns:
+        Articles with unique ids.
+    """
+    random = Random(size)  # noqa: S311
+    return [
+        ArticleInfo(
+            id='article-{number:08d}'.format(number=number),
+            name=generate_article_name(random, number),
+            duty_fee_ratio=Decimal(
+                random.randint(100, MAX_DUTY_FEE_PERCENTS),  # noqa: S311
+            ) / 100,
+        )
+        for number in range(size)
+    ]
+
+
+def generate_articles_items(size: int) -> list[ArticleItem]:
+    """Generate items for price calculation.
+
+    Half of items prices are in CNY.
+
+    Args:
+        size: Number of items.
+
+    Returns:
+        Articles items.
+    """
+    random = Random(size)  # noqa: S311
+    currencies = (Currency.usd, Currency.cyn)
+    return [
+        ArticleItem(
+            name=generate_article_name(random, number),
+            count=random.randint(0, MAX_COUNT),  # noqa: S311
+            unit_weight=Decimal(
+                random.randint(0, MAX_UNIT_WEIGHT_GRAMS),  # noqa: S311
+            ) / 1000,
+            unit_price=Decimal(
+                random.randint(1, MAX_UNIT_PRICE_CENTS),  # noqa: S311
+            ) / 100,
+            price_currency=currencies[number % len(currencies)],
+            duty_fee_ratio=Decimal(
+                random.randint(100, MAX_DUTY_FEE_PERCENTS),  # noqa: S311
+            ) / 100,
+        )
+        for number in range(size)
+    ]
+
+
+def generate_calculations_results(
+    size: int,
+) -> list[tuple[ArticleItem, Decimal]]:
+    """Generate items with calculated prices.
+
+    Args:
+        size: Number of items.
+
+    Returns:
+        Items and their prices.
+    """
+    return [
+        (article_item, calculate_article_price(article_item))
+        for article_item in generate_articles_items(size)
+    ]
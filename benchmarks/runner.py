@@ -0,0 +1,175 @@
+"""Benchmarks running and results comparison."""
+
+
+import platform
+import subprocess  # noqa: S404
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Iterable, Optional
+
+from pydantic import BaseModel
+
+from benchmarks.cases import BenchmarkCase
+
+
+class BenchmarkResult(BaseModel):
+    """Timings of one case on dataset of one size."""
+
+    # Case name
+    name: str
+
+    # Dataset size
+    size: int
+
+    # Measured runs times in seconds
+    times: list[float]
+
+    # Fastest run time in seconds
+    min_time: float
+
+    # Median run time in seconds
+    median_time: float
+
+    # External services stand-ins calls per run
+    calls: float
+
+
+class BenchmarkReport(BaseModel):
+    """Results of benchmarks run."""
+
+    # Git commit of measured code
+    commit: Optional[str]
+
+    # Python version
+    python: str
+
+    # Run start time in ISO format
+    created_at: str
+
+    # Results of all cases and sizes
+    cases_results: list[BenchmarkResult]
+
+
+# Result and ratio of its median time to baseline one
+ResultComparison = tuple[BenchmarkResult, Optional[float]]
+
+
+async def run_case(
+    case: BenchmarkCase,
+    size: int,
+    repeat: int,
+) -> BenchmarkResult:
+    """Measure case on dataset of given size.
+
+    First run is a warm up and is not counted.
+
+    Args:
+        case: Benchmark case.
+        size: Dataset size.
+        repeat: Number of measured runs.
+
+    Returns:
+        Case timings.
+    """
+    async with case:
+        await case.setup(size)
+        await case.run()
+        calls_before = case.count_calls()
+        times: list[float] = []
+        for _ in range(repeat):
+            start_time = perf_counter()
+            await case.run()
+            times.append(perf_counter() - start_time)
+
+        return BenchmarkResult(
+            name=case.name,
+            size=size,
+            times=times,
+            min_time=min(times),
+            median_time=median(times),
+            calls=(case.count_calls() - calls_before) / repeat,
+        )
+
+
+async def run_benchmarks(
+    cases: Iterable[type[BenchmarkCase]],
+    sizes: Iterable[int],
+    repeat: int,
+) -> BenchmarkReport:
+    """Measure cases on datasets of all sizes.
+
+    Sizes greater than case `max_size` are skipped.
+
+    Args:
+        cases: Benchmark cases classes.
+        sizes: Datasets sizes.
+        repeat: Number of measured runs.
+
+    Returns:
+        Benchmarks report.
+    """
+    created_at = datetime.now(timezone.utc).isoformat()
+    cases_results = [
+        await run_case(case(), size, repeat)
+        for case in cases
+        for size in sizes
+        if case.max_size is None or size <= case.max_size
+    ]
+    return BenchmarkReport(
+        commit=get_commit(),
+        python=platform.python_version(),
+        created_at=created_at,
+        cases_results=cases_results,
+    )
+
+
+def compare_reports(
+    baseline: BenchmarkReport,
+    report: BenchmarkReport,
+) -> list[ResultComparison]:
+    """Compare results with baseline ones.
+
+    Args:
+        baseline: Report of previous run.
+        report: Report of current run.
+
+    Returns:
+        Current results with ratio of median times to baseline ones. \
+        Ratio is None if case is missed in baseline.
+    """
+    baseline_results = {
+        (baseline_result.name, baseline_result.size): baseline_result
+        for baseline_result in baseline.cases_results
+    }
+    comparison: list[ResultComparison] = []
+    for benchmark_result in report.cases_results:
+        baseline_result = baseline_results.get(
+            (benchmark_result.name, benchmark_result.size),
+        )
+        ratio = None
+        if baseline_result is not None and baseline_result.median_time:
+            ratio = benchmark_result.median_time / baseline_result.median_time
+
+        comparison.append((benchmark_result, ratio))
+
+    return comparison
+
+
+def get_commit() -> Optional[str]:
+    """Get current git commit hash.
+
+    Returns:
+        Commit hash. None if it cannot be got.
+    """
+    try:
+        git_output = subprocess.run(  # noqa: S603, S607
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return git_output.stdout.strip()
@@ -0,0 +1,384 @@
+"""Local stand-ins for external services.
+
+Stand-ins keep data in memory and emulate network round trip
+with configurable latency, so benchmarks do not depend on network.
+"""
+
+
+import asyncio
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from chip_logistics.core.articles.currencies import (
+    CurrenciesService,
+    RatesCache,
+)
+from chip_logistics.core.articles.models import Currency
+
+# Exchange rates from USD
+USD_RATES = MappingProxyType({
+    Currency.usd: Decimal(1),
+    Currency.cyn: Decimal('7.3'),
+})
+
+# Max number of items returned by one Deta Base fetch
+FETCH_LIMIT = 1000
+
+# Key field of Deta Base records
+KEY_FIELD = 'key'
+
+# Condition of key prefix, which is answered without full scan
+KEY_PREFIX_CONDITION = 'key?pfx'
+
+# Max number of records put at once
+PUT_MANY_LIMIT = 25
+
+# Deta Base record
+Record = dict[str, Any]
+
+# Fields conditions joined by AND
+Conditions = dict[str, Any]
+
+# Deta Base query: conditions or list of them joined by OR
+DetaQuery = Union[Conditions, list[Conditions]]
+
+
+class LocalFixerService(CurrenciesService):
+    """Currencies service with local Fixer API stand-in."""
+
+    def __init__(self, latency: float = 0) -> None:
+        """Initialize service with fresh rates cache.
+
+        Args:
+            latency: Emulated API call time in seconds.
+        """
+        super().__init__('fixer-api-key', RatesCache())
+        self.latency = latency
+        self.api_calls = 0
+
+    async def _fetch_rates(
+        self,
+        base_currency: Currency,
+        currencies: list[Currency],
+    ) -> dict[Currency, Decimal]:
+        """Return rates derived from USD rates.
+
+        Args:
+            base_currency: Base currency.
+            currencies: Target currencies.
+
+        Returns:
+            Exchange rates.
+        """
+        self.api_calls += 1
+        await asyncio.sleep(self.latency)
+        rates: dict[Currency, Decimal] = {}
+        for currency in currencies:
+            rates[currency] = USD_RATES[currency] / USD_RATES[base_currency]
+            self._update_cached_rate(base_currency, currency, rates[currency])
+
+        return rates
+
+
+class FetchResponse(BaseModel):
+    """Deta Base fetch response."""
+
+    # Number of items in page
+    count: int
+
+    # Key of last item, if there are more pages
+    last: Optional[str]
+
+    # Page records
+    items: list[Record]  # noqa: WPS110
+
+
+class Records(dict[str, Record]):  # noqa: WPS600
+    """Base records by keys with cached keys order."""
+
+    def __init__(self) -> None:
+        """Initialize empty records."""
+        super().__init__()
+        self._sorted_keys: Optional[list[str]] = None
+
+    def __setitem__(self, key: str, record: Record) -> None:
+        """Save record and reset keys order, if key is new.
+
+        Args:
+            key: Record key.
+            record: Record data.
+        """
+        if key not in self:
+            self._sorted_keys = None
+
+        super().__setitem__(key, record)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove record and reset keys order.
+
+        Args:
+            key: Record key.
+            default: Value returned for missed key.
+
+        Returns:
+            Removed record or default.
+        """
+        self._sorted_keys = None
+        return super().pop(key, default)
+
+    def get_sorted_keys(self) -> list[str]:
+        """Get records keys in ascending order.
+
+        Returns:
+            Sorted keys.
+        """
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self)
+
+        return self._sorted_keys
+
+
+class LocalBase(object):  # noqa: WPS214
+    """In-memory Deta Base stand-in.
+
+    Supports subset of AsyncBase API used by repositories.
+    """
+
+    def __init__(self, records: Records, latency: float) -> None:
+        """Initialize base.
+
+        Args:
+            records: Base records by keys. Shared by bases with same name.
+            latency: Emulated call time in seconds.
+        """
+        self._records = records
+        self.latency = latency
+        self.calls = 0
+
+    async def put(
+        self,
+        data: Record,  # noqa: WPS110
+        key: Optional[str] = None,
+    ) -> Record:
+        """Put record.
+
+        Args:
+            data: Record data.
+            key: Record key. Taken from data by default.
+
+        Returns:
+            Saved record.
+        """
+        await self._call()
+        record = deepcopy(data)
+        record[KEY_FIELD] = key or record[KEY_FIELD]
+        self._records[record[KEY_FIELD]] = record
+        return deepcopy(record)
+
+    async def put_many(
+        self,
+        items: list[Record],  # noqa: WPS110
+    ) -> dict[str, Any]:
+        """Put several records at once.
+
+        Args:
+            items: Records with keys.
+
+        Returns:
+            Processed records.
+
+        Raises:
+            ValueError: If too many records passed.
+        """
+        if len(items) > PUT_MANY_LIMIT:
+            raise ValueError('Too many records')
+
+        await self._call()
+        for record in items:
+            self._records[record[KEY_FIELD]] = deepcopy(record)
+
+        return {'processed': {'items': deepcopy(items)}}
+
+    async def get(self, key: str) -> Optional[Record]:
+        """Get record by key.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Record or None.
+        """
+        await self._call()
+        return deepcopy(self._records.get(key))
+
+    async def delete(self, key: str) -> None:
+        """Delete record by key.
+
+        Args:
+            key: Record key.
+        """
+        await self._call()
+        self._records.pop(key, None)
+
+    async def fetch(
+        self,
+        query: Optional[DetaQuery] = None,
+        limit: int = FETCH_LIMIT,
+        last: Optional[str] = None,
+    ) -> FetchResponse:
+        """Fetch page of records matching query.
+
+        Only equality, `?contains` and `?pfx` conditions are supported.
+
+        Args:
+            query: Records query.
+            limit: Max page size.
+            last: Key of last record of previous page.
+
+        Returns:
+            Page of records ordered by keys.
+        """
+        await self._call()
+        page_size = min(limit, FETCH_LIMIT)
+        page: list[Record] = []
+        for record in self._iter_matched(query, last):
+            page.append(deepcopy(record))
+            if len(page) == page_size:
+                break
+
+        return FetchResponse(
+            count=len(page),
+            last=page[-1][KEY_FIELD] if len(page) == page_size else None,
+            items=page,
+        )
+
+    async def close(self) -> None:
+        """Close base."""
+
+    def _iter_matched(
+        self,
+        query: Optional[DetaQuery],
+        last: Optional[str],
+    ) -> Iterator[Record]:
+        """Iterate records matching query after last key.
+
+        Args:
+            query: Records query.
+            last: Key of last record of previous page.
+
+        Key prefix condition is answered with binary search.
+
+        Yields:
+            Matched records ordered by keys.
+        """
+        keys = self._records.get_sorted_keys()
+        start = 0 if last is None else bisect_right(keys, last)
+        key_prefix = ''
+        if isinstance(query, dict):
+            key_prefix = query.get(KEY_PREFIX_CONDITION, '')
+            start = max(start, bisect_left(keys, key_prefix))
+
+        for key in keys[start:]:
+            if not key.startswith(key_prefix):
+                return
+
+            if _match(self._records[key], query):
+                yield self._records[key]
+
+    async def _call(self) -> None:
+        """Count call and wait for emulated round trip."""
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+
+class LocalDeta(object):
+    """In-memory Deta stand-in."""
+
+    def __init__(self, latency: float = 0) -> None:
+        """Initialize empty bases.
+
+        Args:
+            latency: Emulated call time in seconds.
+        """
+        self.latency = latency
+        self.bases: list[LocalBase] = []
+        self._bases_records: dict[str, Records] = {}
+
+    def AsyncBase(self, name: str) -> LocalBase:  # noqa: N802
+        """Connect base.
+
+        Args:
+            name: Base name.
+
+        Returns:
+            Base stand-in.
+        """
+        base = LocalBase(
+            self._bases_records.setdefault(name, Records()),
+            self.latency,
+        )
+        self.bases.append(base)
+        return base
+
+    @property
+    def calls(self) -> int:
+        """Count calls of all connected bases.
+
+        Returns:
+            Number of calls.
+        """
+        return sum(base.calls for base in self.bases)
+
+
+def _match(record: Record, query: Optional[DetaQuery]) -> bool:
+    """Check that record matches Deta query.
+
+    Args:
+        record: Base record.
+        query: Deta query.
+
+    Returns:
+        True if record matches any of query conditions sets.
+    """
+    if query is None:
+        return True
+
+    conditions_sets = query if isinstance(query, list) else [query]
+    return any(
+        all(
+            _match_condition(record, field, condition_value)
+            for field, condition_value in conditions.items()
+        )
+        for conditions in conditions_sets
+    )
+
+
+def _match_condition(
+    record: Record,
+    field: str,
+    condition_value: Any,
+) -> bool:
+    """Check that record field matches condition.
+
+    Args:
+        record: Base record.
+        field: Field name with optional operator suffix.
+        condition_value: Value to compare with.
+
+    Returns:
+        True if condition matches.
+    """
+    field_name, _, operator = field.partition('?')
+    field_value = record.get(field_name)
+    if operator == 'contains':
+        return condition_value in (field_value or [])
+
+    if operator == 'pfx':
+        return str(field_value or '').startswith(condition_value)
+
+    return bool(field_value == condition_value)
@@ -1,9 +1,68 @@
 """FastAPI application factory."""
 
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI
 
 from chip_logistics.api.routers.amocrm.root import router as amocrm_router
+from chip_logistics.api.routers.bot.deps import (
+    close_dispatcher_storage,
+    wait_rates_requests,
+)
 from chip_logistics.api.routers.bot.root import router as bot_router
+from chip_logistics.api.routers.metrics import router as metrics_router
+from chip_logistics.bot.session import TelegramSession
+from chip_logistics.config import (
+    get_slow_request_seconds,
+    get_webhook_queue_size,
+    get_webhook_workers,
+)
+from chip_logistics.utils.sessions import SessionsPool
+from chip_logistics.utils.tracing import create_trace_config
+from chip_logistics.utils.workers import KeyedWorkersPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Open application-wide resources and close them on shutdown.
+
+    Args:
+        app: Application instance.
+
+    Yields:
+        Nothing, resources are stored in the application state.
+    """
+    # All outbound requests are traced by the same config
+    trace_configs = [create_trace_config(get_slow_request_seconds())]
+    async with AsyncExitStack() as resources:
+        app.state.sessions_pool = await resources.enter_async_context(
+            SessionsPool(trace_configs),
+        )
+
+        # Bot is created on the first update with the shared session
+        app.state.bot = None
+        app.state.bot_session = await resources.enter_async_context(
+            TelegramSession(trace_configs),
+        )
+
+        # FSM storage is closed after workers are stopped
+        resources.push_async_callback(close_dispatcher_storage)
+
+        # Background rates updates outlive updates processing,
+        # so they are awaited before sessions are closed.
+        resources.push_async_callback(wait_rates_requests)
+
+        # Workers are stopped first, so pending updates
+        # are processed with opened sessions.
+        app.state.updates_workers = None
+        workers_count = get_webhook_workers()
+        if workers_count > 0:
+            app.state.updates_workers = await resources.enter_async_context(
+                KeyedWorkersPool(workers_count, get_webhook_queue_size()),
+            )
+
+        yield
 
 
 def init_app() -> FastAPI:
@@ -14,7 +73,8 @@ def init_app() -> FastAPI:
     Returns:
         Application instance.
     """
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(amocrm_router)
     app.include_router(bot_router)
+    app.include_router(metrics_router)
     return app
@@ -9,7 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from chip_logistics.api.routers.deps import get_amocrm_client
-from chip_logistics.core.amocrm.api import authorize, refresh_access_token
+from chip_logistics.core.amocrm.auth import authorize, refresh_access_token
 from chip_logistics.core.amocrm.client import AmoCRMClient
 
 router = APIRouter(prefix='/auth')
@@ -1,32 +1,63 @@
 """Aiogram routers dependencies."""
 
 
-from typing import Annotated, AsyncGenerator, Optional
+from typing import Annotated, Optional
 
 from aiogram import Bot, Dispatcher
 from deta import Deta
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from chip_logistics.api.routers.deps import (
+    CredentialsCacheDep,
+    get_sessions_pool,
+    open_amocrm_client,
+)
 from chip_logistics.bot.factory import init_bot, init_dispatcher
-from chip_logistics.config import get_bot_token, get_fixer_api_key
-from chip_logistics.core.articles.currencies import CurrenciesService
+from chip_logistics.bot.fsm.factory import init_fsm_storage
+from chip_logistics.config import (
+    get_articles_catalog_ttl,
+    get_bot_token,
+    get_fixer_api_key,
+    get_fixer_rates_ttl,
+    get_fsm_sqlite_path,
+    get_fsm_storage_type,
+)
+from chip_logistics.core.articles.cache import CachedArticlesRepo, CatalogCache
+from chip_logistics.core.articles.currencies import (
+    FIXER_API_URL,
+    CurrenciesService,
+    RatesCache,
+)
 from chip_logistics.core.articles.repo import ArticlesRepo
 from chip_logistics.deta.articles.repo import DetaArticlesRepo
 from chip_logistics.deta.deta import get_deta
+from chip_logistics.utils.lazy import LazyServices
+from chip_logistics.utils.sessions import SessionsPool
+from chip_logistics.utils.workers import KeyedWorkersPool
 
 
 async def get_bot(
+    request: Request,
     token: Annotated[str, Depends(get_bot_token)],
 ) -> Bot:
     """Get aiogram bot instance.
 
+    Bot is a singleton using Telegram session of the application,
+    so connections to Bot API are reused between updates.
+    Session is opened on application startup. See `api/factory.py`.
+
     Args:
+        request: Current request.
         token: Telegram bot token.
 
     Returns:
         Aiogram bot.
     """
-    return init_bot(token)
+    app_state = request.app.state
+    if app_state.bot is None:
+        app_state.bot = init_bot(token, app_state.bot_session)
+
+    return app_state.bot  # type: ignore
 
 
 dispatcher: Optional[Dispatcher] = None
@@ -34,6 +65,8 @@ dispatcher: Optional[Dispatcher] = None
 
 async def get_dispatcher(
     deta: Annotated[Deta, Depends(get_deta)],
+    fsm_storage_type: Annotated[str, Depends(get_fsm_storage_type)],
+    fsm_sqlite_path: Annotated[str, Depends(get_fsm_sqlite_path)],
 ) -> Dispatcher:
     """Get dispatcher instance.
 
@@ -48,48 +81,166 @@ async def get_dispatcher(
 
     Args:
         deta: Deta API.
+        fsm_storage_type: FSM records storage type.
+        fsm_sqlite_path: SQLite database path for `sqlite` FSM storage.
 
     Returns:
         Aiogram dispatcher instance.
     """
     global dispatcher  # noqa: WPS420
     if dispatcher is None:
-        dispatcher = init_dispatcher(deta)  # noqa: WPS442
+        fsm_storage = init_fsm_storage(
+            deta,
+            fsm_storage_type,
+            fsm_sqlite_path,
+        )
+        dispatcher = init_dispatcher(fsm_storage)  # noqa: WPS442
 
     return dispatcher
 
 
-async def get_articles_repo(
-    deta: Annotated[Deta, Depends(get_deta)],
-) -> AsyncGenerator[ArticlesRepo, None]:
-    """Get articles repository instance.
+async def close_dispatcher_storage() -> None:
+    """Close FSM storage of dispatcher, if dispatcher was created.
+
+    Called on application shutdown. See `api/factory.py`.
+    """
+    if dispatcher is not None:
+        await dispatcher.storage.close()
+
+
+articles_catalog_cache: Optional[CatalogCache] = None
+
+
+async def get_catalog_cache(
+    catalog_ttl: Annotated[int, Depends(get_articles_catalog_ttl)],
+) -> CatalogCache:
+    """Get articles catalog cache.
+
+    Cache is a singleton, so catalog is reused between updates.
+
+    Args:
+        catalog_ttl: Time in seconds while cached catalog \
+            is used without version check.
+
+    Returns:
+        Articles catalog cache.
+    """
+    global articles_catalog_cache  # noqa: WPS420
+    if articles_catalog_cache is None:
+        articles_catalog_cache = CatalogCache(  # noqa: WPS442
+            ttl=catalog_ttl,
+        )
+
+    return articles_catalog_cache
+
+
+CatalogCacheDep = Annotated[CatalogCache, Depends(get_catalog_cache)]
+
+
+def open_articles_repo(
+    deta: Deta,
+    catalog_cache: CatalogCache,
+) -> ArticlesRepo:
+    """Open articles repository based on Deta Base with catalog cache.
 
     Args:
         deta: Deta API.
+        catalog_cache: Shared catalog cache.
 
-    Yields:
+    Returns:
         Articles repository.
     """
-    async with DetaArticlesRepo(deta) as repo:
-        yield repo
+    return CachedArticlesRepo(DetaArticlesRepo(deta), catalog_cache)
+
+
+exchange_rates_cache: Optional[RatesCache] = None
+
+
+async def get_rates_cache(
+    rates_ttl: Annotated[int, Depends(get_fixer_rates_ttl)],
+) -> RatesCache:
+    """Get exchange rates cache.
+
+    Cache is a singleton, so rates are reused between updates.
+
+    Args:
+        rates_ttl: Lifetime of cached rates in seconds.
+
+    Returns:
+        Exchange rates cache.
+    """
+    global exchange_rates_cache  # noqa: WPS420
+    if exchange_rates_cache is None:
+        exchange_rates_cache = RatesCache(ttl=rates_ttl)  # noqa: WPS442
+
+    return exchange_rates_cache
+
+
+async def wait_rates_requests() -> None:
+    """Wait for background exchange rates updates, if cache was created.
+
+    Called on application shutdown before sessions are closed.
+    See `api/factory.py`.
+    """
+    if exchange_rates_cache is not None:
+        await exchange_rates_cache.wait_pending()
 
 
-async def get_currencies_service(
+async def get_lazy_services(  # noqa: WPS211
+    deta: Annotated[Deta, Depends(get_deta)],
+    catalog_cache: CatalogCacheDep,
     fixer_api_key: Annotated[str, Depends(get_fixer_api_key)],
-) -> AsyncGenerator[CurrenciesService, None]:
-    """Get currencies service instance.
+    rates_cache: Annotated[RatesCache, Depends(get_rates_cache)],
+    credentials_cache: CredentialsCacheDep,
+    sessions_pool: Annotated[SessionsPool, Depends(get_sessions_pool)],
+) -> LazyServices:
+    """Get services passed to bot handlers with each update.
+
+    Services are opened only by handlers, that require them.
 
     Args:
+        deta: Deta API.
+        catalog_cache: Shared articles catalog cache.
         fixer_api_key: Fixer API key.
+        rates_cache: Shared exchange rates cache.
+        credentials_cache: Shared AmoCRM credentials cache.
+        sessions_pool: Shared HTTP sessions.
+
+    Returns:
+        Services factories.
+    """
+    return LazyServices({
+        'articles_repo': lambda: open_articles_repo(deta, catalog_cache),
+        'currencies_service': lambda: CurrenciesService(
+            fixer_api_key,
+            rates_cache,
+            sessions_pool.get_session(FIXER_API_URL),
+        ),
+        'amocrm_client': lambda: open_amocrm_client(
+            deta,
+            credentials_cache,
+            sessions_pool,
+        ),
+    })
+
+
+async def get_updates_workers(request: Request) -> Optional[KeyedWorkersPool]:
+    """Get workers processing updates in background.
+
+    Workers are started on application startup. See `api/factory.py`.
+
+    Args:
+        request: Current request.
 
-    Yields:
-        Currencies service.
+    Returns:
+        Updates workers. None, if updates are processed by webhook requests.
     """
-    async with CurrenciesService(fixer_api_key) as service:
-        yield service
+    return request.app.state.updates_workers  # type: ignore
 
 
-CurrenciesServiceDep = Annotated[
-    CurrenciesService,
-    Depends(get_currencies_service),
+LazyServicesDep = Annotated[LazyServices, Depends(get_lazy_services)]
+
+UpdatesWorkersDep = Annotated[
+    Optional[KeyedWorkersPool],
+    Depends(get_updates_workers),
 ]
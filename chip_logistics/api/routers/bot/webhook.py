@@ -1,6 +1,8 @@
 """Telegram webhook router."""
 
 
+import asyncio
+from functools import partial
 from typing import Annotated
 
 from aiogram import Bot, Dispatcher
@@ -9,17 +11,14 @@ from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import SecretStr
 
 from chip_logistics.api.routers.bot.deps import (
-    get_articles_repo,
+    LazyServicesDep,
+    UpdatesWorkersDep,
     get_bot,
-    get_currencies_service,
     get_dispatcher,
 )
-from chip_logistics.api.routers.deps import get_amocrm_client
-from chip_logistics.bot.handler_result import HandlerResult
+from chip_logistics.bot.handler_result import HandlerResult, Ok
+from chip_logistics.bot.updates import get_update_chat_id, process_update
 from chip_logistics.config import get_bot_secret
-from chip_logistics.core.amocrm.client import AmoCRMClient
-from chip_logistics.core.articles.currencies import CurrenciesService
-from chip_logistics.core.articles.repo import ArticlesRepo
 
 router = APIRouter(prefix='/webhook')
 
@@ -27,14 +26,6 @@ router = APIRouter(prefix='/webhook')
 SecretHeader = Header(alias='X-Telegram-Bot-Api-Secret-Token')
 
 
-ArticlesRepoDep = Annotated[ArticlesRepo, Depends(get_articles_repo)]
-CurrenciesServiceDep = Annotated[
-    CurrenciesService,
-    Depends(get_currencies_service),
-]
-AmoCRMServiceDep = Annotated[AmoCRMClient, Depends(get_amocrm_client)]
-
-
 @router.post('')
 async def handle_update(  # noqa: WPS211
     update: Update,
@@ -42,9 +33,8 @@ async def handle_update(  # noqa: WPS211
     bot: Annotated[Bot, Depends(get_bot)],
     dispatcher: Annotated[Dispatcher, Depends(get_dispatcher)],
     expected_secret: Annotated[str, Depends(get_bot_secret)],
-    articles_repo: ArticlesRepoDep,
-    currencies_service: CurrenciesServiceDep,
-    amocrm_client: AmoCRMServiceDep,
+    services: LazyServicesDep,
+    updates_workers: UpdatesWorkersDep,
 ) -> HandlerResult:
     """Handle telegram update and propagate to aiogram dispatcher.
 
@@ -52,21 +42,29 @@ async def handle_update(  # noqa: WPS211
     and https://docs.aiogram.dev/en/latest/dispatcher/index.html
     for details about update.
 
+    Services are passed as lazy providers and opened only
+    by handlers, that require them.
+
+    If background workers are enabled, update is queued and
+    response is sent immediately. Updates of the same chat
+    are processed in order of receiving.
+
     Args:
         update: Telegram event update.
         bot: Aiogram Bot instance.
         dispatcher: Aiogram dispatcher instance.
         expected_secret: Secret for request verification. See `config.py`.
         secret: Request secret.
-        articles_repo: Articles storage.
-        currencies_service: Currencies operations provider.
-        amocrm_client: AmoCRM client.
+        services: Services passed to handlers.
+        updates_workers: Background updates workers. \
+            None, if update should be processed before response.
 
     Raises:
-        HTTPException: 401 if secret is invalid.
+        HTTPException: 401 if secret is invalid. \
+            503 if too many updates of the chat are pending.
 
     Returns:
-        Result of update processing.
+        Result of update processing. Empty success, if update is queued.
     """
     if secret.get_secret_value() != expected_secret:
         raise HTTPException(
@@ -74,10 +72,19 @@ async def handle_update(  # noqa: WPS211
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
 
-    return await dispatcher.feed_update(  # type: ignore
-        bot,
-        update=update,
-        articles_repo=articles_repo,
-        currencies_service=currencies_service,
-        amocrm_client=amocrm_client,
-    )
+    if updates_workers is None:
+        return await process_update(bot, dispatcher, update, services)
+
+    try:
+        updates_workers.submit(
+            get_update_chat_id(update),
+            partial(process_update, bot, dispatcher, update, services),
+        )
+    except asyncio.QueueFull:
+        # Telegram repeats delivery later
+        raise HTTPException(
+            detail='Too many pending updates',
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    return Ok()
@@ -1,42 +1,133 @@
-"""AmoCRM dependencies."""
+"""AmoCRM and shared application dependencies."""
 
 
-from typing import Annotated, AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncGenerator, Optional
 
 from deta import Deta
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from chip_logistics.config import get_amocrm_credentials_ttl
+from chip_logistics.core.amocrm.cache import CachedAmoCRMRepo, CredentialsCache
 from chip_logistics.core.amocrm.client import AmoCRMClient, init_client
 from chip_logistics.core.amocrm.repo import AmoCRMRepo
 from chip_logistics.deta.amocrm.repo import DetaAmoCRMRepo
 from chip_logistics.deta.deta import get_deta
+from chip_logistics.utils.sessions import SessionsPool
+
+
+async def get_sessions_pool(request: Request) -> SessionsPool:
+    """Get HTTP sessions shared by the whole application.
+
+    Pool is opened on application startup. See `api/factory.py`.
+
+    Args:
+        request: Current request.
+
+    Returns:
+        Shared HTTP sessions.
+    """
+    return request.app.state.sessions_pool  # type: ignore
+
+
+amocrm_credentials_cache: Optional[CredentialsCache] = None
+
+
+async def get_credentials_cache(
+    credentials_ttl: Annotated[int, Depends(get_amocrm_credentials_ttl)],
+) -> CredentialsCache:
+    """Get AmoCRM credentials cache.
+
+    Cache is a singleton, so credentials are reused between requests.
+
+    Args:
+        credentials_ttl: Time in seconds while cached credentials \
+            are used without version check.
+
+    Returns:
+        AmoCRM credentials cache.
+    """
+    global amocrm_credentials_cache  # noqa: WPS420
+    if amocrm_credentials_cache is None:
+        amocrm_credentials_cache = CredentialsCache(  # noqa: WPS442
+            ttl=credentials_ttl,
+        )
+
+    return amocrm_credentials_cache
+
+
+CredentialsCacheDep = Annotated[
+    CredentialsCache,
+    Depends(get_credentials_cache),
+]
+
+
+def open_amocrm_repo(
+    deta: Deta,
+    credentials_cache: CredentialsCache,
+) -> AmoCRMRepo:
+    """Open AmoCRM repository based on Deta Base with credentials cache.
+
+    Args:
+        deta: Deta API.
+        credentials_cache: Shared credentials cache.
+
+    Returns:
+        AmoCRM repository.
+    """
+    return CachedAmoCRMRepo(DetaAmoCRMRepo(deta), credentials_cache)
 
 
 async def get_amocrm_repo(
     deta: Annotated[Deta, Depends(get_deta)],
+    credentials_cache: CredentialsCacheDep,
 ) -> AsyncGenerator[AmoCRMRepo, None]:
     """Get AmoCRM repository based on Deta Base.
 
     Args:
         deta: Deta API.
+        credentials_cache: Shared credentials cache.
 
     Yields:
         AmoCRMRepo
     """
-    async with DetaAmoCRMRepo(deta) as repo:
+    async with open_amocrm_repo(deta, credentials_cache) as repo:
         yield repo
 
 
 async def get_amocrm_client(
     repo: Annotated[AmoCRMRepo, Depends(get_amocrm_repo)],
+    sessions_pool: Annotated[SessionsPool, Depends(get_sessions_pool)],
 ) -> AsyncGenerator[AmoCRMClient, None]:
     """Get AmoCRMClient instance.
 
     Args:
         repo: AmoCRM repository
+        sessions_pool: Shared HTTP sessions.
 
     Yields:
         AsyncGenerator[AmoCRMClient, None]: AMOCrm client.
     """
-    async with init_client(repo) as service:
+    async with init_client(repo, sessions_pool) as service:
         yield service
+
+
+@asynccontextmanager
+async def open_amocrm_client(
+    deta: Deta,
+    credentials_cache: CredentialsCache,
+    sessions_pool: SessionsPool,
+) -> AsyncGenerator[AmoCRMClient, None]:
+    """Open AmoCRM repository and client based on it.
+
+    Args:
+        deta: Deta API.
+        credentials_cache: Shared credentials cache.
+        sessions_pool: Shared HTTP sessions.
+
+    Yields:
+        AmoCRM client.
+    """
+    async with open_amocrm_repo(deta, credentials_cache) as repo:
+        async with init_client(repo, sessions_pool) as client:
+            yield client
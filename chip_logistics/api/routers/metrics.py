@@ -0,0 +1,25 @@
+"""Application metrics router."""
+
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from chip_logistics.utils.metrics import metrics_registry
+
+router = APIRouter(tags=['Metrics'])
+
+# Content type of Prometheus text format
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Get application metrics in Prometheus text format.
+
+    Returns:
+        Metrics of the current process.
+    """
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type=METRICS_CONTENT_TYPE,
+    )
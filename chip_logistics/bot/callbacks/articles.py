@@ -1,5 +1,7 @@
 """Articles management callbacks."""
 
+from typing import Optional
+
 from aiogram.filters.callback_data import CallbackData
 
 
@@ -11,6 +13,16 @@ class OpenArticlesListCallback(CallbackData, prefix='articles/list/open'):
     """Open articles list."""
 
 
+class ArticlesListPageCallback(CallbackData, prefix='articles/list/page'):
+    """Open articles list page."""
+
+    # Id of the last article of the previous page
+    after: Optional[str] = None
+
+    # Id of the first article of the next page
+    before: Optional[str] = None
+
+
 class CreateArticleCallback(CallbackData, prefix='articles/create'):
     """Start creating of the new article."""
 
@@ -1,5 +1,7 @@
 """Calculations callbacks."""
 
+from typing import Optional
+
 from aiogram.filters.callback_data import CallbackData
 
 from chip_logistics.core.articles.models import Currency
@@ -25,6 +27,16 @@ class SelectArticleCallback(CallbackData, prefix='calcs/article/select'):
     article_id: str
 
 
+class ArticleSelectPageCallback(CallbackData, prefix='calcs/article/page'):
+    """Open page of articles to select."""
+
+    # Id of the last article of the previous page
+    after: Optional[str] = None
+
+    # Id of the first article of the next page
+    before: Optional[str] = None
+
+
 class ManualArticleCallback(CallbackData, prefix='calcs/article/manual'):
     """Start manual input of article data."""
 
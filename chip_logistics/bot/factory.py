@@ -1,44 +1,64 @@
 """Bot and dispatcher factories."""
 
 
+from typing import Optional
+
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.base import BaseSession
 from aiogram.utils.callback_answer import CallbackAnswerMiddleware
-from aiogram_deta import create_dispatcher
-from deta import Deta
 
-from chip_logistics.bot.routers.articles.root import router as articles_router
-from chip_logistics.bot.routers.calcs.root import router as calcs_router
-from chip_logistics.bot.routers.menu import router as menu_router
-from chip_logistics.bot.routers.start import router as start_router
+from chip_logistics.bot.fsm.storage import CoalescingStorage
+from chip_logistics.bot.middlewares.coalescing import FSMCoalescingMiddleware
+from chip_logistics.bot.middlewares.lazy import LazyDependenciesMiddleware
+from chip_logistics.bot.middlewares.metrics import (
+    HandlerMetricsMiddleware,
+    UpdateMetricsMiddleware,
+)
 
 
-def init_bot(token: str) -> Bot:
+def init_bot(token: str, session: Optional[BaseSession] = None) -> Bot:
     """Initialize aiogram bot.
 
     Args:
         token: Telegram bot token.
+        session: Bot API HTTP session. Bot creates own session by default.
 
     Returns:
         Bot instance.
     """
-    return Bot(token=token, parse_mode='HTML')
+    return Bot(token=token, session=session, parse_mode='HTML')
+
+
+def init_dispatcher(storage: CoalescingStorage) -> Dispatcher:
+    """Initialize dispatcher with FSM storage.
 
+    FSM changes are written once per update.
+    Lazy dependencies are opened only for handlers, that require them.
+    Updates durations and outbound calls are measured by handlers.
 
-def init_dispatcher(deta: Deta) -> Dispatcher:
-    """Initialize dispatcher with Deta FSM storage.
+    Routers are imported here, so handlers modules and their
+    dependencies are loaded on the first update, not on startup.
 
     Args:
-        deta: Deta instance.
+        storage: FSM storage.
 
     Returns:
         Dispatcher instance.
     """
-    dispatcher: Dispatcher = create_dispatcher(deta=deta)
-    dispatcher.include_routers(
-        start_router,
-        menu_router,
-        articles_router,
-        calcs_router,
-    )
+    from chip_logistics.bot.routers import root  # noqa: WPS433
+
+    # Metrics middleware is the first one, so FSM writes are measured.
+    # FSM middleware is registered after the coalescing one,
+    # so state read by FSM middleware is reused by handlers.
+    dispatcher = Dispatcher(storage=storage, disable_fsm=True)
+    dispatcher.update.outer_middleware(UpdateMetricsMiddleware())
+    dispatcher.update.outer_middleware(FSMCoalescingMiddleware(storage))
+    dispatcher.update.outer_middleware(dispatcher.fsm)
+    dispatcher.include_router(root.router)
     dispatcher.callback_query.middleware(CallbackAnswerMiddleware(pre=True))
+    for observer_name, observer in dispatcher.observers.items():
+        if observer_name != 'update':
+            observer.middleware(HandlerMetricsMiddleware())
+            observer.middleware(LazyDependenciesMiddleware())
+
     return dispatcher
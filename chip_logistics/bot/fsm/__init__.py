@@ -0,0 +1 @@
+"""FSM storage with pluggable records repositories."""
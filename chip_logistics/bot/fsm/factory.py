@@ -0,0 +1,47 @@
+"""FSM storage factory."""
+
+
+from enum import Enum
+
+from deta import Deta
+
+from chip_logistics.bot.fsm.memory import MemoryFSMRecordsRepo
+from chip_logistics.bot.fsm.repo import FSMRecordsRepo
+from chip_logistics.bot.fsm.sqlite import SQLiteFSMRecordsRepo
+from chip_logistics.bot.fsm.storage import CoalescingStorage
+from chip_logistics.deta.fsm.repo import DetaFSMRecordsRepo
+
+
+class FSMStorageType(str, Enum):  # noqa: WPS600
+    """Supported FSM records storages."""
+
+    deta = 'deta'
+    sqlite = 'sqlite'
+    memory = 'memory'
+
+
+def init_fsm_storage(
+    deta: Deta,
+    storage_type: str,
+    sqlite_path: str,
+) -> CoalescingStorage:
+    """Initialize FSM storage.
+
+    Args:
+        deta: Deta instance.
+        storage_type: FSM records storage type.
+        sqlite_path: SQLite database path for `sqlite` storage.
+
+    Returns:
+        FSM storage.
+    """
+    fsm_storage_type = FSMStorageType(storage_type)
+    records_repo: FSMRecordsRepo
+    if fsm_storage_type == FSMStorageType.sqlite:
+        records_repo = SQLiteFSMRecordsRepo(sqlite_path)
+    elif fsm_storage_type == FSMStorageType.memory:
+        records_repo = MemoryFSMRecordsRepo()
+    else:
+        records_repo = DetaFSMRecordsRepo(deta)
+
+    return CoalescingStorage(records_repo)
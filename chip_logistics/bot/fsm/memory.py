@@ -0,0 +1,46 @@
+"""FSMRecordsRepo implementation in process memory."""
+
+
+from typing import Optional
+
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.bot.fsm.repo import FSMRecordsRepo
+
+
+class MemoryFSMRecordsRepo(FSMRecordsRepo):
+    """FSM records repository in process memory.
+
+    Records are lost on restart. Suitable for development and tests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty repository."""
+        super().__init__()
+        self._records: dict[str, FSMRecord] = {}
+
+    async def get_record(self, key: str) -> Optional[FSMRecord]:
+        """Get copy of FSM record.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Found record or None.
+        """
+        record = self._records.get(key)
+        if record is None:
+            return None
+
+        return record.model_copy(deep=True)
+
+    async def apply_changes(self, key: str, changes: FSMRecordChanges) -> None:
+        """Save copy of changed record.
+
+        Args:
+            key: Record key.
+            changes: Record changes.
+        """
+        self._records[key] = changes.record.model_copy(deep=True)
+
+    async def aclose(self) -> None:
+        """Nothing to close, records are kept until restart."""
@@ -0,0 +1,51 @@
+"""FSM records models."""
+
+
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class FSMRecord(BaseModel):
+    """State and data of one FSM context."""
+
+    # State name
+    state: Optional[str] = None
+
+    # Context data
+    data: dict[str, Any] = Field(default_factory=dict)  # noqa: WPS110
+
+
+class FSMRecordChanges(BaseModel):
+    """FSM record changes made during one update."""
+
+    # Record with all changes applied
+    record: FSMRecord
+
+    # Record is not stored yet
+    is_new: bool = False
+
+    # Record data is replaced entirely
+    is_replaced: bool = False
+
+    # Record state is changed
+    is_state_changed: bool = False
+
+    # New values of changed data fields
+    fields: dict[str, Any] = Field(default_factory=dict)
+
+    # Values appended to lists in data fields
+    appends: dict[str, list[Any]] = Field(default_factory=dict)
+
+    def is_changed(self) -> bool:
+        """Check that there are changes to write.
+
+        Returns:
+            True if record is changed.
+        """
+        return any((
+            self.is_replaced,
+            self.is_state_changed,
+            self.fields,
+            self.appends,
+        ))
@@ -0,0 +1,37 @@
+"""FSM records repository interface."""
+
+
+from typing import Optional, Protocol, runtime_checkable
+
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.utils.closing import AClosing
+
+
+@runtime_checkable
+class FSMRecordsRepo(AClosing, Protocol):
+    """FSM records repository interface.
+
+    Each FSM context is stored as a single record,
+    so state and data are written by one request.
+    """
+
+    async def get_record(self, key: str) -> Optional[FSMRecord]:
+        """Get FSM record.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Found record or None.
+        """
+
+    async def apply_changes(self, key: str, changes: FSMRecordChanges) -> None:
+        """Write FSM record changes.
+
+        Repository can write whole changed record
+        or only changed fields and appended values.
+
+        Args:
+            key: Record key.
+            changes: Record changes.
+        """
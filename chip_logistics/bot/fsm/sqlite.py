@@ -0,0 +1,108 @@
+"""FSMRecordsRepo implementation based on SQLite."""
+
+
+import asyncio
+import sqlite3
+from threading import Lock
+from typing import Optional
+
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.bot.fsm.repo import FSMRecordsRepo
+
+CREATE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS fsm_records (
+    key TEXT PRIMARY KEY,
+    record TEXT NOT NULL
+)
+"""
+
+SELECT_RECORD_QUERY = 'SELECT record FROM fsm_records WHERE key = ?'
+
+UPSERT_RECORD_QUERY = (
+    'INSERT OR REPLACE INTO fsm_records (key, record) VALUES (?, ?)'
+)
+
+
+class SQLiteFSMRecordsRepo(FSMRecordsRepo):
+    """FSM records repository based on local SQLite database.
+
+    Records are stored as JSON. Queries are executed in threads,
+    so event loop is not blocked by disk operations.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open database and create records table.
+
+        Args:
+            path: Database file path.
+        """
+        super().__init__()
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(CREATE_TABLE_QUERY)
+
+    async def get_record(self, key: str) -> Optional[FSMRecord]:
+        """Get FSM record.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Found record or None.
+        """
+        record_json = await asyncio.to_thread(self._select_record, key)
+        if record_json is None:
+            return None
+
+        return FSMRecord.model_validate_json(record_json)
+
+    async def apply_changes(self, key: str, changes: FSMRecordChanges) -> None:
+        """Save changed record.
+
+        Args:
+            key: Record key.
+            changes: Record changes.
+        """
+        record_json = changes.record.model_dump_json()
+        await asyncio.to_thread(self._upsert_record, key, record_json)
+
+    async def aclose(self) -> None:
+        """Close database connection."""
+        await asyncio.to_thread(self._close)
+
+    def _select_record(self, key: str) -> Optional[str]:
+        """Select record JSON.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Record JSON or None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                SELECT_RECORD_QUERY,
+                (key,),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def _upsert_record(self, key: str, record_json: str) -> None:
+        """Insert or replace record JSON.
+
+        Args:
+            key: Record key.
+            record_json: Record JSON.
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    UPSERT_RECORD_QUERY,
+                    (key, record_json),
+                )
+
+    def _close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            self._connection.close()
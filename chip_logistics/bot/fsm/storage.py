@@ -0,0 +1,223 @@
+"""FSM storage with coalesced writes."""
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.bot.fsm.repo import FSMRecordsRepo
+
+# Pending records changes by records keys
+PendingChanges = dict[str, FSMRecordChanges]
+
+
+def get_record_key(key: StorageKey) -> str:
+    """Get FSM record key for storage key.
+
+    Args:
+        key: Storage key.
+
+    Returns:
+        Record key.
+    """
+    return ':'.join(
+        '' if key_part is None else str(key_part)
+        for key_part in (
+            key.bot_id,
+            key.chat_id,
+            key.user_id,
+            key.thread_id,
+            key.destiny,
+        )
+    )
+
+
+class CoalescingStorage(BaseStorage):  # noqa: WPS214
+    """FSM storage, that writes all changes of one update at once.
+
+    Records are read once and changed in memory inside `coalesce` block.
+    Changes are written on exit from the block, one write per record.
+    Outside the block each operation is written immediately.
+    """
+
+    def __init__(self, repo: FSMRecordsRepo) -> None:
+        """Initialize storage.
+
+        Args:
+            repo: FSM records repository.
+        """
+        self._repo = repo
+        self._pending: ContextVar[Optional[PendingChanges]] = ContextVar(
+            'pending_fsm_changes',
+            default=None,
+        )
+
+    @asynccontextmanager
+    async def coalesce(self) -> AsyncIterator[None]:
+        """Collect changes and write them on exit.
+
+        Nested blocks are joined with the outer one.
+
+        Yields:
+            Nothing.
+        """
+        if self._pending.get() is not None:
+            yield
+            return
+
+        pending_changes: PendingChanges = {}
+        token = self._pending.set(pending_changes)
+        try:
+            yield
+        finally:
+            self._pending.reset(token)
+            await asyncio.gather(*(
+                self._repo.apply_changes(record_key, changes)
+                for record_key, changes in pending_changes.items()
+                if changes.is_changed()
+            ))
+
+    async def set_state(
+        self,
+        key: StorageKey,
+        state: StateType = None,
+    ) -> None:
+        """Set state.
+
+        Args:
+            key: Storage key.
+            state: New state.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            changes.record.state = (
+                state.state if isinstance(state, State) else state
+            )
+            changes.is_state_changed = True
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        """Get state.
+
+        Args:
+            key: Storage key.
+
+        Returns:
+            Current state.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            return changes.record.state
+
+    async def set_data(
+        self,
+        key: StorageKey,
+        data: dict[str, Any],  # noqa: WPS110
+    ) -> None:
+        """Replace data.
+
+        Args:
+            key: Storage key.
+            data: New data.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            changes.record.data = data.copy()
+            changes.is_replaced = True
+            changes.fields.clear()
+            changes.appends.clear()
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        """Get data.
+
+        Args:
+            key: Storage key.
+
+        Returns:
+            Copy of current data.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            return changes.record.data.copy()
+
+    async def update_data(
+        self,
+        key: StorageKey,
+        data: dict[str, Any],  # noqa: WPS110
+    ) -> dict[str, Any]:
+        """Update data fields.
+
+        Args:
+            key: Storage key.
+            data: New values of fields.
+
+        Returns:
+            Copy of updated data.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            changes.record.data.update(data)
+            if not changes.is_replaced:
+                changes.fields.update(data)
+                for field in data:
+                    changes.appends.pop(field, None)
+
+            return changes.record.data.copy()
+
+    async def append_data(
+        self,
+        key: StorageKey,
+        field: str,
+        field_value: Any,
+    ) -> None:
+        """Append value to list in data field.
+
+        Args:
+            key: Storage key.
+            field: Data field with list. Missed field is created.
+            field_value: Value to append.
+        """
+        async with self.coalesce():
+            changes = await self._get_changes(key)
+            field_values = [*changes.record.data.get(field, []), field_value]
+            changes.record.data[field] = field_values
+            if changes.is_replaced or field in changes.fields:
+                changes.fields[field] = field_values
+            else:
+                changes.appends.setdefault(field, []).append(field_value)
+
+    async def close(self) -> None:
+        """Close records repository."""
+        await self._repo.aclose()
+
+    async def _get_changes(self, key: StorageKey) -> FSMRecordChanges:
+        """Get pending changes of record, reading record if necessary.
+
+        Should be called inside `coalesce` block.
+
+        Args:
+            key: Storage key.
+
+        Returns:
+            Record changes.
+
+        Raises:
+            RuntimeError: If called outside `coalesce` block.
+        """
+        pending_changes = self._pending.get()
+        if pending_changes is None:
+            raise RuntimeError('FSM record is accessed outside of coalesce')
+
+        record_key = get_record_key(key)
+        if record_key not in pending_changes:
+            record = await self._repo.get_record(record_key)
+            pending_changes[record_key] = FSMRecordChanges(
+                record=record or FSMRecord(),
+                is_new=record is None,
+            )
+
+        return pending_changes[record_key]
@@ -0,0 +1,51 @@
+"""Middleware for coalescing FSM storage writes.
+
+All FSM changes made while update is handled
+are written once, when handling is finished.
+"""
+
+
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from chip_logistics.bot.fsm.storage import CoalescingStorage
+
+HandlerData = dict[str, Any]
+NextHandler = Callable[[TelegramObject, HandlerData], Awaitable[Any]]
+
+
+class FSMCoalescingMiddleware(BaseMiddleware):
+    """Handle update inside storage `coalesce` block.
+
+    Should be registered as update outer middleware before FSM middleware,
+    so current state, read for filters, is reused by handlers.
+    """
+
+    def __init__(self, storage: CoalescingStorage) -> None:
+        """Initialize middleware.
+
+        Args:
+            storage: FSM storage.
+        """
+        self._storage = storage
+
+    async def __call__(
+        self,
+        next_handler: NextHandler,
+        event: TelegramObject,
+        handler_data: HandlerData,
+    ) -> Any:
+        """Handle update and write FSM changes.
+
+        Args:
+            next_handler: Next handler in the middlewares chain.
+            event: Telegram update.
+            handler_data: Handler parameters.
+
+        Returns:
+            Handler result.
+        """
+        async with self._storage.coalesce():
+            return await next_handler(event, handler_data)
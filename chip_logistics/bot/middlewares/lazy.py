@@ -0,0 +1,51 @@
+"""Middleware for lazy dependencies resolving.
+
+Dependencies passed to the dispatcher as `Lazy` providers
+are opened only if matched handler requests them by parameter name.
+So updates, that do not use some service, do not pay for its initialization.
+"""
+
+
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import TelegramObject
+
+from chip_logistics.utils.lazy import Lazy
+
+HandlerData = dict[str, Any]
+NextHandler = Callable[[TelegramObject, HandlerData], Awaitable[Any]]
+
+
+class LazyDependenciesMiddleware(BaseMiddleware):
+    """Replace lazy providers with resources required by handler.
+
+    Should be registered as inner middleware,
+    so handler is already selected by filters.
+    """
+
+    async def __call__(
+        self,
+        next_handler: NextHandler,
+        event: TelegramObject,
+        handler_data: HandlerData,
+    ) -> Any:
+        """Open lazy dependencies of the handler and call it.
+
+        Args:
+            next_handler: Next handler in the middlewares chain.
+            event: Telegram event.
+            handler_data: Handler parameters.
+
+        Returns:
+            Handler result.
+        """
+        handler_object = handler_data.get('handler')
+        if isinstance(handler_object, HandlerObject):
+            for name in handler_object.params:
+                dependency = handler_data.get(name)
+                if isinstance(dependency, Lazy):
+                    handler_data[name] = await dependency.get()
+
+        return await next_handler(event, handler_data)
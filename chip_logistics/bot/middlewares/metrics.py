@@ -0,0 +1,214 @@
+"""Middlewares measuring updates processing.
+
+Updates durations and outbound calls are recorded
+by handler, which processed the update, and its result.
+"""
+
+
+from time import perf_counter
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import TelegramObject
+
+from chip_logistics.bot.handler_result import Err, Ok
+from chip_logistics.bot.middlewares.lazy import HandlerData, NextHandler
+from chip_logistics.utils.metrics import metrics_registry
+from chip_logistics.utils.outbound import OutboundCalls, collect_outbound_calls
+
+# Handler and result label of updates without matched handler
+UNHANDLED = 'unhandled'
+
+# Handlers modules prefix, which is omitted in labels
+ROUTERS_MODULE_PREFIX = 'chip_logistics.bot.routers.'
+
+# Handler data key of current update metrics
+UPDATE_METRICS_KEY = 'update_metrics'
+
+# Labels of updates metrics
+UPDATE_LABELS = ('handler', 'result')
+
+# Labels of updates outbound calls metrics
+CALLS_LABELS = ('handler', 'service')
+
+# Histogram buckets for number of outbound calls per update
+CALLS_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+update_seconds = metrics_registry.histogram(
+    'bot_update_duration_seconds',
+    'Duration of updates processing including FSM writes',
+    labels=UPDATE_LABELS,
+)
+
+update_calls = metrics_registry.histogram(
+    'bot_update_outbound_calls',
+    'Number of outbound calls per update',
+    labels=CALLS_LABELS,
+    buckets=CALLS_BUCKETS,
+)
+
+update_calls_seconds = metrics_registry.histogram(
+    'bot_update_outbound_duration_seconds',
+    'Total duration of outbound calls per update',
+    labels=CALLS_LABELS,
+)
+
+handler_results = metrics_registry.counter(
+    'bot_handler_results_total',
+    'Number of processed updates by handlers results',
+    labels=UPDATE_LABELS,
+)
+
+
+class UpdateMetrics(object):
+    """Labels of processing update."""
+
+    def __init__(self) -> None:
+        """Initialize labels of unhandled update."""
+        self.handler_name = UNHANDLED
+        self.result_name = UNHANDLED
+
+    def record(self, duration: float, outbound_calls: OutboundCalls) -> None:
+        """Record processed update.
+
+        Args:
+            duration: Processing duration in seconds.
+            outbound_calls: Outbound calls made during processing.
+        """
+        update_seconds.observe(
+            duration,
+            handler=self.handler_name,
+            result=self.result_name,
+        )
+        handler_results.inc(
+            handler=self.handler_name,
+            result=self.result_name,
+        )
+        for service, calls_count in outbound_calls.counts.items():
+            update_calls.observe(
+                calls_count,
+                handler=self.handler_name,
+                service=service,
+            )
+            update_calls_seconds.observe(
+                outbound_calls.durations[service],
+                handler=self.handler_name,
+                service=service,
+            )
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """Measure update processing.
+
+    Should be registered as the first outer update middleware,
+    so FSM writes after handler are measured too.
+    """
+
+    async def __call__(
+        self,
+        next_handler: NextHandler,
+        event: TelegramObject,
+        handler_data: HandlerData,
+    ) -> Any:
+        """Process update and record its metrics.
+
+        Args:
+            next_handler: Next handler in the middlewares chain.
+            event: Telegram update.
+            handler_data: Handler parameters.
+
+        Returns:
+            Handler result.
+
+        Raises:
+            Exception: Processing error is re-raised after recording.
+        """
+        update_metrics = UpdateMetrics()
+        handler_data[UPDATE_METRICS_KEY] = update_metrics
+        started_at = perf_counter()
+        with collect_outbound_calls() as outbound_calls:
+            try:
+                return await next_handler(event, handler_data)
+            except Exception:
+                update_metrics.result_name = 'exception'
+                raise
+            finally:
+                update_metrics.record(
+                    perf_counter() - started_at,
+                    outbound_calls,
+                )
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """Label update metrics with matched handler and its result.
+
+    Should be registered as inner middleware,
+    so handler is already selected by filters.
+    """
+
+    async def __call__(
+        self,
+        next_handler: NextHandler,
+        event: TelegramObject,
+        handler_data: HandlerData,
+    ) -> Any:
+        """Call handler and save its name and result.
+
+        Args:
+            next_handler: Next handler in the middlewares chain.
+            event: Telegram event.
+            handler_data: Handler parameters.
+
+        Returns:
+            Handler result.
+        """
+        handler_object = handler_data.get('handler')
+        update_metrics = handler_data.get(UPDATE_METRICS_KEY)
+        if not isinstance(update_metrics, UpdateMetrics):
+            return await next_handler(event, handler_data)
+
+        if isinstance(handler_object, HandlerObject):
+            update_metrics.handler_name = get_handler_name(handler_object)
+
+        handler_result = await next_handler(event, handler_data)
+        update_metrics.result_name = get_result_name(handler_result)
+        return handler_result
+
+
+def get_handler_name(handler_object: HandlerObject) -> str:
+    """Get handler label from its module and function names.
+
+    Args:
+        handler_object: Matched handler.
+
+    Returns:
+        Handler module path in routers and function name.
+    """
+    callback = handler_object.callback
+    module_name: str = getattr(callback, '__module__', '')
+    if module_name.startswith(ROUTERS_MODULE_PREFIX):
+        module_name = module_name[len(ROUTERS_MODULE_PREFIX):]
+
+    return '{module_name}:{function_name}'.format(
+        module_name=module_name,
+        function_name=getattr(callback, '__name__', type(callback).__name__),
+    )
+
+
+def get_result_name(handler_result: Any) -> str:
+    """Get result label of handler.
+
+    Args:
+        handler_result: Value returned by handler.
+
+    Returns:
+        `ok` or `err` for handlers results, `none` for other values.
+    """
+    if isinstance(handler_result, Ok):
+        return 'ok'
+
+    if isinstance(handler_result, Err):
+        return 'err'
+
+    return 'none'
@@ -4,11 +4,18 @@
 from aiogram import Router
 from aiogram.types import CallbackQuery, Message
 
-from chip_logistics.bot.callbacks.articles import OpenArticlesListCallback
+from chip_logistics.bot.callbacks.articles import (
+    ArticlesListPageCallback,
+    OpenArticlesListCallback,
+)
 from chip_logistics.bot.filters.extract_message import ExtractMessage
 from chip_logistics.bot.handler_result import HandlerResult, Ok
-from chip_logistics.bot.views.articles.articles_list import send_articles_list
-from chip_logistics.core.articles.articles import find_articles
+from chip_logistics.bot.views.articles.articles_list import (
+    ARTICLES_LIST_PAGE_SIZE,
+    send_articles_list,
+    show_articles_list_page,
+)
+from chip_logistics.core.articles.pages import get_articles_page
 from chip_logistics.core.articles.repo import ArticlesRepo
 
 router = Router(name='articles/list')
@@ -33,6 +40,37 @@ async def open_articles_list(
     Returns:
         Always success.
     """
-    articles = await find_articles(articles_repo)
-    await send_articles_list(message, articles)
+    page = await get_articles_page(articles_repo, ARTICLES_LIST_PAGE_SIZE)
+    await send_articles_list(message, page)
+    return Ok()
+
+
+@router.callback_query(
+    ArticlesListPageCallback.filter(),
+    ExtractMessage,
+)
+async def open_articles_list_page(
+    callback_query: CallbackQuery,
+    message: Message,
+    callback_data: ArticlesListPageCallback,
+    articles_repo: ArticlesRepo,
+) -> HandlerResult:
+    """Show previous or next page of articles list.
+
+    Args:
+        callback_query: Open page query.
+        message: Message where query from.
+        callback_data: Callback data with page cursors.
+        articles_repo: Articles storage.
+
+    Returns:
+        Always success.
+    """
+    page = await get_articles_page(
+        articles_repo,
+        ARTICLES_LIST_PAGE_SIZE,
+        after=callback_data.after,
+        before=callback_data.before,
+    )
+    await show_articles_list_page(message, page)
     return Ok()
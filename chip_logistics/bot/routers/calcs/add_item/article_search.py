@@ -0,0 +1,96 @@
+"""Articles inline search routes."""
+
+
+from aiogram import F, Router
+from aiogram.fsm.context import FSMContext
+from aiogram.types import InlineQuery, Message
+
+from chip_logistics.bot.filters.text_message import TextMessage
+from chip_logistics.bot.handler_result import Err, HandlerResult, Ok
+from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.views.calcs.add_item import send_item_count_request
+from chip_logistics.bot.views.calcs.article_search import (
+    SEARCH_RESULTS_LIMIT,
+    answer_articles_search,
+    send_article_not_found,
+)
+from chip_logistics.core.articles.articles import find_articles
+from chip_logistics.core.articles.repo import ArticlesRepo
+from chip_logistics.core.articles.search import normalize_name
+
+router = Router(name='calcs/add_item/article_search')
+
+
+@router.inline_query()
+async def search_articles(
+    inline_query: InlineQuery,
+    articles_repo: ArticlesRepo,
+) -> HandlerResult:
+    """Answer with page of articles found by query.
+
+    Offset of the page is the number of previously sent results.
+
+    Args:
+        inline_query: Search query.
+        articles_repo: Articles storage.
+
+    Returns:
+        Always success.
+    """
+    offset = int(inline_query.offset) if inline_query.offset.isdigit() else 0
+    articles = await find_articles(articles_repo, inline_query.query or None)
+    next_offset = offset + SEARCH_RESULTS_LIMIT
+    await answer_articles_search(
+        inline_query,
+        articles[offset:next_offset],
+        str(next_offset) if next_offset < len(articles) else '',
+    )
+    return Ok(extra={'query': inline_query.query, 'offset': offset})
+
+
+@router.message(
+    CalculationsState.wait_item_name,
+    F.via_bot,
+    TextMessage,
+)
+async def handle_found_article(
+    message: Message,
+    text: str,
+    articles_repo: ArticlesRepo,
+    state: FSMContext,
+) -> HandlerResult:
+    """Save article selected in search results and ask for item count.
+
+    Args:
+        message: Message sent by selected search result.
+        text: Article name.
+        articles_repo: Articles storage.
+        state: Current FSM state.
+
+    Returns:
+        Ok - article data successfully taken.
+        Err - article not found.
+    """
+    normalized_name = normalize_name(text)
+    found_articles = [
+        article
+        for article in await find_articles(articles_repo, text)
+        if normalize_name(article.name) == normalized_name
+    ]
+    if not found_articles:
+        await send_article_not_found(message)
+        return Err(
+            message='Article {name} not found'.format(name=text),
+        )
+
+    article = found_articles[0]
+    await state.update_data(
+        name=article.name,
+        duty_fee_ratio=str(article.duty_fee_ratio),
+    )
+    await state.set_state(CalculationsState.wait_item_count)
+    await send_item_count_request(message)
+    return Ok(extra={
+        'name': article.name,
+        'duty_fee_ratio': article.duty_fee_ratio,
+    })
@@ -4,6 +4,7 @@
 from aiogram import Router
 
 from chip_logistics.bot.routers.calcs.add_item import (
+    article_search,
     count,
     name,
     start,
@@ -14,6 +15,7 @@ from chip_logistics.bot.routers.calcs.add_item import (
 router = Router(name='calcs/add_item')
 router.include_routers(
     start.router,
+    article_search.router,
     name.router,
     count.router,
     unit_weight.router,
@@ -13,8 +13,14 @@ from chip_logistics.bot.filters.extract_message import ExtractMessage
 from chip_logistics.bot.filters.text_message import TextMessage
 from chip_logistics.bot.handler_result import Err, HandlerResult, Ok
 from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.states.calcs_context import (
+    CalculationsContext,
+    append_item,
+    get_calculations_context,
+)
 from chip_logistics.bot.views.calcs.add_item import (
     send_bad_item_unit_price,
+    send_item_name_request,
     send_item_price_currency_request,
     send_item_unit_price_request,
     send_item_unit_weight_request,
@@ -23,7 +29,6 @@ from chip_logistics.bot.views.calcs.continuation_menu import (
     send_continuation_menu,
 )
 from chip_logistics.core.articles.models import ArticleItem
-from chip_logistics.deta.models import model_dump
 from chip_logistics.utils.decimal import parse_decimal
 
 router = Router(name='calcs/add_item/unit_price')
@@ -102,7 +107,7 @@ async def handle_item_unit_price(
 
     Returns:
         Ok - item unit price save successfully.
-        Err - incorrect price format.
+        Err - incorrect price format or item data is incomplete.
     """
     try:
         unit_price = parse_decimal(text)
@@ -119,18 +124,51 @@ async def handle_item_unit_price(
             message='Incorrect item unit price format.',
         )
 
-    context = await state.update_data(unit_price=str(unit_price))
+    context = await get_calculations_context(state)
+    article_item = context.build_item(unit_price)
+    if article_item is None:
+        return await restart_item_input(message, state)
+
+    return await add_item(article_item, context, message, state)
+
+
+async def restart_item_input(
+    message: Message,
+    state: FSMContext,
+) -> HandlerResult:
+    """Ask item data again from the item name request.
+
+    Args:
+        message: Message where query from.
+        state: Current FSM state.
+
+    Returns:
+        Always error, item data in state is incomplete.
+    """
+    await send_item_name_request(message)
+    await state.set_state(CalculationsState.wait_item_name)
+    return Err(message='Item data is incomplete, item is entered again.')
+
 
-    article_item = ArticleItem(**context)
-    context.setdefault('items', []).append(model_dump(article_item))
+async def add_item(
+    article_item: ArticleItem,
+    context: CalculationsContext,
+    message: Message,
+    state: FSMContext,
+) -> HandlerResult:
+    """Add item to the items list and show continuation menu.
 
-    articles_items = [
-        ArticleItem(**article_item_data)
-        for article_item_data in context.get('items', [])
-    ]
-    await send_continuation_menu(message, articles_items)
+    Args:
+        article_item: Entered item.
+        context: Calculations data from state.
+        message: Message where query from.
+        state: Current FSM state.
 
-    await state.set_data(context)
+    Returns:
+        Always success.
+    """
+    await append_item(state, context, article_item)
+    await send_continuation_menu(message, context.get_items())
     await state.set_state(CalculationsState.wait_continuation)
     return Ok(extra={'item': article_item})
 
@@ -9,6 +9,7 @@ from aiogram.types import CallbackQuery, Message
 
 from chip_logistics.bot.callbacks.calcs import (
     AddItemCallback,
+    ArticleSelectPageCallback,
     ManualArticleCallback,
     SelectArticleCallback,
 )
@@ -18,13 +19,16 @@ from chip_logistics.bot.handler_result import Err, HandlerResult, Ok
 from chip_logistics.bot.states.calcs import CalculationsState
 from chip_logistics.bot.views.calcs.add_item import send_item_count_request
 from chip_logistics.bot.views.calcs.article_select import (
+    ARTICLES_SELECT_PAGE_SIZE,
     send_article_request,
     send_bad_duty_fee_ratio,
     send_duty_fee_ratio_request,
     send_name_request,
+    show_article_select_page,
 )
-from chip_logistics.core.articles.articles import find_articles, get_article
+from chip_logistics.core.articles.articles import get_article
 from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.pages import get_articles_page
 from chip_logistics.core.articles.repo import ArticlesRepo
 from chip_logistics.utils.decimal import parse_decimal
 
@@ -53,8 +57,40 @@ async def open_article_select(
         Always success.
     """
     await state.set_state(CalculationsState.wait_article)
-    articles = await find_articles(articles_repo)
-    await send_article_request(message, articles)
+    page = await get_articles_page(articles_repo, ARTICLES_SELECT_PAGE_SIZE)
+    await send_article_request(message, page)
+    return Ok()
+
+
+@router.callback_query(
+    ArticleSelectPageCallback.filter(),
+    CalculationsState.wait_article,
+    ExtractMessage,
+)
+async def open_article_select_page(
+    callback_query: CallbackQuery,
+    message: Message,
+    callback_data: ArticleSelectPageCallback,
+    articles_repo: ArticlesRepo,
+) -> HandlerResult:
+    """Show previous or next page of articles to select.
+
+    Args:
+        callback_query: Open page query.
+        message: Message where query from.
+        callback_data: Callback data with page cursors.
+        articles_repo: Articles storage.
+
+    Returns:
+        Always success.
+    """
+    page = await get_articles_page(
+        articles_repo,
+        ARTICLES_SELECT_PAGE_SIZE,
+        after=callback_data.after,
+        before=callback_data.before,
+    )
+    await show_article_select_page(message, page)
     return Ok()
 
 
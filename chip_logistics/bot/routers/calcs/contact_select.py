@@ -15,6 +15,7 @@ from chip_logistics.bot.filters.extract_message import ExtractMessage
 from chip_logistics.bot.filters.text_message import TextMessage
 from chip_logistics.bot.handler_result import HandlerResult, Ok
 from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.states.calcs_context import get_calculations_context
 from chip_logistics.bot.views.calcs.contact_select import (
     send_contact_select_menu,
     send_contact_selected,
@@ -26,7 +27,6 @@ from chip_logistics.bot.views.calcs.continuation_menu import (
 )
 from chip_logistics.core.amocrm.api import find_contacts
 from chip_logistics.core.amocrm.client import AmoCRMClient
-from chip_logistics.core.articles.models import ArticleItem
 
 router = Router(name='calcs/contacts')
 
@@ -161,11 +161,7 @@ async def back_to_continuation_menu(
     Returns:
         Always success.
     """
-    context = await state.get_data()
-    articles_items = [
-        ArticleItem(**article)
-        for article in context.get('items', [])
-    ]
-    await send_continuation_menu(message, articles_items)
+    context = await get_calculations_context(state)
+    await send_continuation_menu(message, context.get_items())
     await state.set_state(CalculationsState.wait_continuation)
     return Ok()
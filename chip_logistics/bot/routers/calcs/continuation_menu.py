@@ -1,7 +1,5 @@
 """Continuation menu routes."""
 
-from typing import Any
-
 from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
@@ -10,6 +8,11 @@ from chip_logistics.bot.callbacks.back import BackCallback
 from chip_logistics.bot.filters.extract_message import ExtractMessage
 from chip_logistics.bot.handler_result import HandlerResult, Ok
 from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.states.calcs_context import (
+    ITEMS_FIELD,
+    ItemRow,
+    get_calculations_context,
+)
 from chip_logistics.bot.views.calcs.add_item import (
     send_item_unit_price_request,
 )
@@ -42,14 +45,13 @@ async def back_to_previous_item(
     Returns:
         Always success.
     """
-    context = await state.get_data()
-    currency = context.get('price_currency')
-    articles_items_data = context.get('items', [])
-    if not articles_items_data or currency is None:
+    context = await get_calculations_context(state)
+    currency = context.price_currency
+    if not context.items or currency is None:
         return await back_to_the_beginning(message, state)
 
     return await back_to_item_unit_price(
-        articles_items_data,
+        context.items,
         currency,
         message,
         state,
@@ -76,7 +78,7 @@ async def back_to_the_beginning(
 
 
 async def back_to_item_unit_price(
-    articles_items_data: list[dict[str, Any]],
+    items_rows: list[ItemRow],
     currency: Currency,
     message: Message,
     state: FSMContext,
@@ -84,7 +86,7 @@ async def back_to_item_unit_price(
     """Go back to the item unit price request.
 
     Args:
-        articles_items_data: Data of previously entered items.
+        items_rows: Rows of previously entered items.
         currency: Previously entered currency.
         message: Message query from.
         state: Current FCM state.
@@ -92,8 +94,7 @@ async def back_to_item_unit_price(
     Returns:
         Always success.
     """
-    articles_items_data = articles_items_data[:-1]  # pop last item
-    await state.update_data(items=articles_items_data)
+    await state.update_data({ITEMS_FIELD: items_rows[:-1]})  # pop last item
     await send_item_unit_price_request(message, currency)
     await state.set_state(CalculationsState.wait_item_unit_price)
     return Ok()
@@ -1,8 +1,6 @@
 """Finish router."""
 
 
-from typing import Any
-
 from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
@@ -11,6 +9,7 @@ from chip_logistics.bot.callbacks.calcs import FinishCalcsCallback
 from chip_logistics.bot.filters.extract_message import ExtractMessage
 from chip_logistics.bot.handler_result import HandlerResult, Ok
 from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.states.calcs_context import get_calculations_context
 from chip_logistics.bot.views.calcs.finish import send_calcs_report
 from chip_logistics.core.amocrm.api import attach_file_to_contact, upload_file
 from chip_logistics.core.amocrm.client import AmoCRMClient
@@ -47,14 +46,14 @@ async def finish_calcs(
         Ok - report file successfully created.
         Err - file upload fails.
     """
-    context = await state.get_data()
+    context = await get_calculations_context(state)
     report_data, report_name = await get_report(
         currencies_service,
-        context.get('items', []),
-        context.get('customer_name', ''),
+        context.get_items(),
+        context.customer_name,
     )
 
-    contact_id = context.get('contact_id')
+    contact_id = context.contact_id
     if contact_id is not None:
         await upload_report_file_to_amocrm(
             report_data,
@@ -74,23 +73,19 @@ async def finish_calcs(
 
 async def get_report(
     currencies_service: CurrenciesService,
-    articles_data: list[dict[str, Any]],
+    articles_items: list[ArticleItem],
     customer_name: str,
-) -> tuple[bytes, str]:
+) -> tuple[memoryview, str]:
     """Calculate price and form report.
 
     Args:
         currencies_service: Currencies operations provider.
-        articles_data: Entered articles data from FSM context.
+        articles_items: Entered items from FSM context.
         customer_name: Entered customer_name from FSM context.
 
     Returns:
         Calculations report.
     """
-    articles_items = [
-        ArticleItem(**item_data)
-        for item_data in articles_data
-    ]
     calculations_results, total_price = await calculate_articles_price(
         currencies_service,
         articles_items,
@@ -103,7 +98,7 @@ async def get_report(
 
 
 async def upload_report_file_to_amocrm(
-    report_data: bytes,
+    report_data: memoryview,
     report_name: str,
     contact_id: int,
     amocrm_client: AmoCRMClient,
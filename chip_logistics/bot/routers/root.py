@@ -0,0 +1,15 @@
+"""Root bot router."""
+
+from aiogram import Router
+
+from chip_logistics.bot.routers import menu, start
+from chip_logistics.bot.routers.articles import root as articles
+from chip_logistics.bot.routers.calcs import root as calcs
+
+router = Router(name='root')
+router.include_routers(
+    start.router,
+    menu.router,
+    articles.router,
+    calcs.router,
+)
@@ -0,0 +1,52 @@
+"""Telegram Bot API HTTP session."""
+
+
+from typing import Sequence
+
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiohttp import ClientSession, TraceConfig
+
+from chip_logistics.utils.sessions import (
+    CONNECTIONS_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+)
+
+
+class TelegramSession(AiohttpSession):
+    """Aiogram session keeping connections to Bot API alive.
+
+    Session should be shared by all updates, so replies
+    reuse opened connections instead of new TLS handshakes.
+    Requests are traced by application trace configs.
+    """
+
+    def __init__(self, trace_configs: Sequence[TraceConfig] = ()) -> None:
+        """Initialize session with tuned connector.
+
+        Connector is created on the first request.
+
+        Args:
+            trace_configs: Trace configs of aiohttp session.
+        """
+        super().__init__()
+        # All requests go to the same host
+        self._connector_init.update(
+            limit=CONNECTIONS_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self._trace_configs = list(trace_configs)
+
+    async def create_session(self) -> ClientSession:
+        """Get aiohttp session, attaching trace configs to the new one.
+
+        Returns:
+            Opened aiohttp session.
+        """
+        session = await super().create_session()
+        for trace_config in self._trace_configs:
+            if trace_config not in session.trace_configs:
+                session.trace_configs.append(trace_config)
+
+        return session
@@ -0,0 +1,188 @@
+"""Calculations FSM context.
+
+Entered items are stored as compact rows with fixed fields order.
+Rows are validated once, when item is added, and are decoded
+without validation later. So, handlers do not repeat validation
+of all previously entered items on each message.
+"""
+
+
+from decimal import Decimal
+from typing import Any, Optional, Protocol, runtime_checkable
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from pydantic import BaseModel, Field
+
+from chip_logistics.core.articles.models import ArticleItem, Currency
+
+# Context field with entered items rows
+ITEMS_FIELD = 'items'
+
+# Compact item encoding: name, count, unit weight, unit price,
+# price currency and duty fee ratio. Decimals are stored as strings.
+ItemRow = list[Any]
+
+
+@runtime_checkable
+class AppendableStorage(Protocol):
+    """FSM storage, that can append value to list in data.
+
+    Storage writes only appended value,
+    instead of rewriting whole data.
+    """
+
+    async def append_data(
+        self,
+        key: StorageKey,
+        field: str,
+        field_value: Any,
+    ) -> None:
+        """Append value to list in data field.
+
+        Args:
+            key: Storage key.
+            field: Data field with list. Missed field is created.
+            field_value: Value to append.
+        """
+
+
+class CalculationsContext(BaseModel):
+    """Typed data of calculations FSM context."""
+
+    # Customer name
+    customer_name: str = ''
+
+    # AmoCRM contact to attach report to
+    contact_id: Optional[int] = None
+
+    # Name of entering item
+    name: Optional[str] = None
+
+    # Count of entering item
+    count: Optional[int] = None
+
+    # Weight per unit of entering item
+    unit_weight: Optional[Decimal] = None
+
+    # Currency of entering or last entered item price
+    price_currency: Optional[Currency] = None
+
+    # Duty fee ratio of entering item
+    duty_fee_ratio: Decimal = Decimal(1)
+
+    # Entered items rows. Items dicts are stored by previous versions.
+    items: list[Any] = Field(default_factory=list)  # noqa: WPS110
+
+    def build_item(self, unit_price: Decimal) -> Optional[ArticleItem]:
+        """Validate entering item.
+
+        Args:
+            unit_price: Entered item unit price.
+
+        Returns:
+            Validated item. None if some item fields were not entered.
+        """
+        if self.name is None or self.count is None:
+            return None
+
+        if self.unit_weight is None or self.price_currency is None:
+            return None
+
+        return ArticleItem(
+            name=self.name,
+            count=self.count,
+            unit_weight=self.unit_weight,
+            unit_price=unit_price,
+            price_currency=self.price_currency,
+            duty_fee_ratio=self.duty_fee_ratio,
+        )
+
+    def get_items(self) -> list[ArticleItem]:
+        """Decode entered items.
+
+        Returns:
+            Entered items.
+        """
+        return [decode_item(item_row) for item_row in self.items]
+
+
+def encode_item(article_item: ArticleItem) -> ItemRow:
+    """Encode item to compact row.
+
+    Args:
+        article_item: Validated item.
+
+    Returns:
+        Item row.
+    """
+    return [
+        article_item.name,
+        article_item.count,
+        str(article_item.unit_weight),
+        str(article_item.unit_price),
+        article_item.price_currency.value,
+        str(article_item.duty_fee_ratio),
+    ]
+
+
+def decode_item(item_row: Any) -> ArticleItem:
+    """Decode item from row without validation.
+
+    Items dicts, stored by previous versions, are validated.
+
+    Args:
+        item_row: Item row or item data dict.
+
+    Returns:
+        Item.
+    """
+    if isinstance(item_row, dict):
+        return ArticleItem.model_validate(item_row)
+
+    return ArticleItem.model_construct(
+        name=item_row[0],
+        count=item_row[1],
+        unit_weight=Decimal(item_row[2]),
+        unit_price=Decimal(item_row[3]),
+        price_currency=Currency(item_row[4]),
+        duty_fee_ratio=Decimal(item_row[5]),
+    )
+
+
+async def get_calculations_context(state: FSMContext) -> CalculationsContext:
+    """Get typed calculations context.
+
+    Items rows are not decoded.
+
+    Args:
+        state: Current FSM state.
+
+    Returns:
+        Calculations context.
+    """
+    return CalculationsContext.model_validate(await state.get_data())
+
+
+async def append_item(
+    state: FSMContext,
+    context: CalculationsContext,
+    article_item: ArticleItem,
+) -> None:
+    """Add item to context.
+
+    Only the new row is written, if storage supports appending.
+    Otherwise, whole data is updated.
+
+    Args:
+        state: Current FSM state.
+        context: Current context. Row is added to its items too.
+        article_item: Validated item.
+    """
+    item_row = encode_item(article_item)
+    context.items.append(item_row)
+    if isinstance(state.storage, AppendableStorage):
+        await state.storage.append_data(state.key, ITEMS_FIELD, item_row)
+        return
+
+    await state.update_data({ITEMS_FIELD: context.items})
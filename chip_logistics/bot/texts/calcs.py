@@ -19,7 +19,13 @@ ASK_DUTY_FEE_RATIO = 'Укажите пошлину на позицию (нап
 
 BAD_DUTY_FEE_RATIO = 'Неверный формат. Пошлина должна быть числом, например, например, "9.5" для наценки в 9.5%. Попробуйте снова'
 
-ASK_ITEM_NAME = 'Укажите наименование позиции:'
+ASK_ITEM_NAME = 'Укажите наименование позиции или найдите ее в каталоге:'
+
+SEARCH_ARTICLE_BTN = '🔍 Найти в каталоге'
+
+ARTICLE_SEARCH_RESULT = 'Пошлина: {duty_fee_ratio}'
+
+ARTICLE_NOT_FOUND = 'Позиция не найдена в каталоге. Укажите наименование позиции:'
 
 ASK_ITEM_COUNT = 'Укажите количество единиц позиции:'
 
@@ -0,0 +1,5 @@
+"""Pages navigation buttons texts."""
+
+PREVIOUS_PAGE_BTN = '◀️'
+
+NEXT_PAGE_BTN = '▶️'
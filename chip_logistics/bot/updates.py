@@ -0,0 +1,68 @@
+"""Telegram updates processing helpers."""
+
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiogram.types.update import UpdateTypeLookupError
+
+from chip_logistics.bot.handler_result import HandlerResult
+from chip_logistics.utils.lazy import LazyServices
+
+
+def get_update_chat_id(update: Update) -> int:
+    """Get id of chat, where update is from.
+
+    Updates of the same chat change the same FSM state,
+    so they should be processed in order. Chat and user
+    are read from the update event itself.
+
+    Args:
+        update: Telegram update.
+
+    Returns:
+        Chat id. User id, if update is not bound to chat. \
+        Update id, if update has neither chat nor user.
+    """
+    try:
+        event = update.event
+    except UpdateTypeLookupError:
+        return update.update_id
+
+    # Callback queries are bound to chat of their message
+    message = getattr(event, 'message', None)
+    chat = getattr(event, 'chat', None) or getattr(message, 'chat', None)
+    if chat is not None:
+        return int(chat.id)
+
+    user = getattr(event, 'from_user', None) or getattr(event, 'user', None)
+    if user is not None:
+        return int(user.id)
+
+    return update.update_id
+
+
+async def process_update(
+    bot: Bot,
+    dispatcher: Dispatcher,
+    update: Update,
+    services: LazyServices,
+) -> HandlerResult:
+    """Propagate update to dispatcher with lazy services.
+
+    Services opened by handlers are closed after update is processed.
+
+    Args:
+        bot: Aiogram Bot instance.
+        dispatcher: Aiogram dispatcher instance.
+        update: Telegram update.
+        services: Services passed to handlers.
+
+    Returns:
+        Result of update processing.
+    """
+    async with services.open() as lazy_services:
+        return await dispatcher.feed_update(  # type: ignore
+            bot,
+            update=update,
+            **lazy_services,
+        )
@@ -4,11 +4,16 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message
 
 from chip_logistics.bot.callbacks.articles import (
+    ArticlesListPageCallback,
     OpenArticleCallback,
     OpenArticlesMenuCallback,
 )
 from chip_logistics.bot.texts.articles import BACK_TO_ARTICLES_MENU, LIST_TITLE
-from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.bot.views.pages import build_page_btns
+from chip_logistics.core.articles.models import ArticlesPage
+
+# Max number of articles on the list page
+ARTICLES_LIST_PAGE_SIZE = 10
 
 back_to_articles_menu_kb = [
     [
@@ -20,44 +25,63 @@ back_to_articles_menu_kb = [
 ]
 
 
-def build_articles_list_kb(
-    articles: list[ArticleInfo],
-) -> InlineKeyboardMarkup:
-    """Create keyboard with articles buttons.
+def build_articles_list_kb(page: ArticlesPage) -> InlineKeyboardMarkup:
+    """Create keyboard with articles page buttons.
 
     Args:
-        articles: Articles info.
+        page: Articles page.
 
     Returns:
-        Inline keyboard with buttons for navigation to article menu.
+        Inline keyboard with buttons for navigation to article menu \
+        and to neighbour pages.
     """
+    articles_btns = [
+        [
+            InlineKeyboardButton(
+                text=article.name,
+                callback_data=OpenArticleCallback(
+                    article_id=article.id,
+                ).pack(),
+            ),
+        ]
+        for article in page.articles
+        if article.id is not None
+    ]
+    page_btns = build_page_btns(page, ArticlesListPageCallback)
+    if page_btns:
+        articles_btns.append(page_btns)
+
     return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=article.name,
-                    callback_data=OpenArticleCallback(
-                        article_id=article.id,
-                    ).pack(),
-                ),
-            ]
-            for article in articles
-            if article.id is not None
-        ] + back_to_articles_menu_kb,
+        inline_keyboard=articles_btns + back_to_articles_menu_kb,
     )
 
 
 async def send_articles_list(
     message: Message,
-    articles: list[ArticleInfo],
+    page: ArticlesPage,
 ) -> None:
-    """Send articles list.
+    """Send articles list page.
 
     Args:
         message: Message. Can be used to answer, modify or get user info.
-        articles: Articles list.
+        page: Articles page.
     """
     await message.answer(
         text=LIST_TITLE,
-        reply_markup=build_articles_list_kb(articles),
+        reply_markup=build_articles_list_kb(page),
+    )
+
+
+async def show_articles_list_page(
+    message: Message,
+    page: ArticlesPage,
+) -> None:
+    """Replace articles list kb with another page.
+
+    Args:
+        message: Message with articles list.
+        page: Articles page.
+    """
+    await message.edit_reply_markup(
+        reply_markup=build_articles_list_kb(page),
     )
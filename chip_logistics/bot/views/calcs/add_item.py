@@ -14,6 +14,7 @@ from chip_logistics.bot.texts.calcs import (
     BAD_ITEM_UNIT_WEIGHT,
 )
 from chip_logistics.bot.views.back import back_btns, back_kb
+from chip_logistics.bot.views.calcs.article_search import item_name_kb
 from chip_logistics.core.articles.models import Currency
 
 
@@ -25,7 +26,7 @@ async def send_item_name_request(
     Args:
         message: Message. Can be used to answer, modify or get user info.
     """
-    await message.answer(text=ASK_ITEM_NAME, reply_markup=back_kb)
+    await message.answer(text=ASK_ITEM_NAME, reply_markup=item_name_kb)
 
 
 async def send_item_count_request(
@@ -0,0 +1,102 @@
+"""Articles inline search views."""
+
+from html import escape
+from typing import Iterable
+
+from aiogram.types import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InlineQuery,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+    Message,
+)
+
+from chip_logistics.bot.texts.calcs import (
+    ARTICLE_NOT_FOUND,
+    ARTICLE_SEARCH_RESULT,
+    SEARCH_ARTICLE_BTN,
+)
+from chip_logistics.bot.views.back import back_btns
+from chip_logistics.bot.views.inline import InlineQueryResultUnion
+from chip_logistics.core.articles.models import ArticleInfo
+
+# Max number of results in one answer allowed by Telegram
+SEARCH_RESULTS_LIMIT = 50
+
+# Time in seconds while Telegram reuses answer for the same query
+SEARCH_CACHE_TIME = 300
+
+# Opens articles inline search in the current chat
+item_name_kb = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(
+                text=SEARCH_ARTICLE_BTN,
+                switch_inline_query_current_chat='',
+            ),
+        ],
+    ] + back_btns,
+)
+
+
+def build_search_results(
+    articles: Iterable[ArticleInfo],
+) -> list[InlineQueryResultUnion]:
+    """Build inline results of found articles.
+
+    Selected result sends article name to the chat.
+
+    Args:
+        articles: Found articles.
+
+    Returns:
+        Inline query results.
+    """
+    return [
+        InlineQueryResultArticle(
+            id=article.id,
+            title=article.name,
+            description=ARTICLE_SEARCH_RESULT.format(
+                duty_fee_ratio=article.duty_fee_ratio,
+            ),
+            input_message_content=InputTextMessageContent(
+                message_text=escape(article.name),
+            ),
+        )
+        for article in articles
+        if article.id is not None
+    ]
+
+
+async def answer_articles_search(
+    inline_query: InlineQuery,
+    articles: Iterable[ArticleInfo],
+    next_offset: str,
+) -> None:
+    """Answer inline query with found articles.
+
+    Answer is shared between users and cached by Telegram.
+
+    Args:
+        inline_query: Search query.
+        articles: Page of found articles.
+        next_offset: Offset of the next page. Empty, if it is the last one.
+    """
+    await inline_query.answer(
+        results=build_search_results(articles),
+        cache_time=SEARCH_CACHE_TIME,
+        is_personal=False,
+        next_offset=next_offset,
+    )
+
+
+async def send_article_not_found(
+    message: Message,
+) -> None:
+    """Warn that selected article is missed in the catalog.
+
+    Args:
+        message: Message. Can be used to answer, modify or get user info.
+    """
+    await message.answer(text=ARTICLE_NOT_FOUND, reply_markup=item_name_kb)
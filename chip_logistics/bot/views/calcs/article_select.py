@@ -1,9 +1,10 @@
 """Articles selection views."""
 
-from aiogram.types import InlineKeyboardMarkup, Message
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from chip_logistics.bot.callbacks.calcs import (
+    ArticleSelectPageCallback,
     ManualArticleCallback,
     SelectArticleCallback,
 )
@@ -14,22 +15,24 @@ from chip_logistics.bot.texts.calcs import (
     ASK_NAME,
     BAD_DUTY_FEE_RATIO,
 )
-from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.bot.views.pages import build_page_btns
+from chip_logistics.core.articles.models import ArticlesPage
 
+# Max number of articles on the select keyboard page
+ARTICLES_SELECT_PAGE_SIZE = 20
 
-def build_article_select_kb(
-    articles: list[ArticleInfo],
-) -> InlineKeyboardMarkup:
-    """Build kb with articles and manual input button.
+
+def build_article_select_kb(page: ArticlesPage) -> InlineKeyboardMarkup:
+    """Build kb with articles page, pages navigation and manual input button.
 
     Args:
-        articles: Articles to select.
+        page: Articles page to select.
 
     Returns:
         Articles select kb
     """
     builder = InlineKeyboardBuilder()
-    for article in articles:
+    for article in page.articles:
         if article.id is not None:
             builder.button(
                 text=article.name,
@@ -38,37 +41,48 @@ def build_article_select_kb(
                 ),
             )
 
-    builder.button(
-        text=ARTICLE_MANUAL_INPUT,
-        callback_data=ManualArticleCallback().pack(),
-    )
-
     # Articles aligned in two columns.
-    rows_sizes = [2 for _ in range(len(articles) // 2)]
-    # If article lost, single column used
-    if len(articles) % 2 == 1:
-        rows_sizes.append(1)
-
-    # Manual button aligned in separated row
-    rows_sizes.append(1)
-
-    builder.adjust(*rows_sizes)
+    builder.adjust(2)
+
+    # Navigation and manual buttons aligned in separated rows
+    builder.row(*build_page_btns(page, ArticleSelectPageCallback))
+    builder.row(
+        InlineKeyboardButton(
+            text=ARTICLE_MANUAL_INPUT,
+            callback_data=ManualArticleCallback().pack(),
+        ),
+    )
     return builder.as_markup()
 
 
 async def send_article_request(
     message: Message,
-    articles: list[ArticleInfo],
+    page: ArticlesPage,
 ) -> None:
-    """Send articles list and manual input buttons.
+    """Send articles page and manual input buttons.
 
     Args:
         message: Message. Can be used to answer, modify or get user info.
-        articles: Articles to select.
+        page: Articles page to select.
     """
     await message.answer(
         text=ARTICLE_SELECT,
-        reply_markup=build_article_select_kb(articles),
+        reply_markup=build_article_select_kb(page),
+    )
+
+
+async def show_article_select_page(
+    message: Message,
+    page: ArticlesPage,
+) -> None:
+    """Replace articles select kb with another page.
+
+    Args:
+        message: Message with articles select kb.
+        page: Articles page to select.
+    """
+    await message.edit_reply_markup(
+        reply_markup=build_article_select_kb(page),
     )
 
 
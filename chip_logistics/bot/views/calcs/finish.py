@@ -1,13 +1,46 @@
 """Finish calculations views."""
 
-from aiogram.types import BufferedInputFile, Message
+from typing import AsyncGenerator
+
+from aiogram import Bot
+from aiogram.types import InputFile, Message
 
 from chip_logistics.bot.texts.calcs import CALCS_RESULT
+from chip_logistics.utils.streams import iter_parts
+
+
+class ReportInputFile(InputFile):
+    """Report file uploaded from memory buffer.
+
+    Buffer is read by chunks without copying it at once.
+    """
+
+    def __init__(self, report_data: memoryview, report_name: str) -> None:
+        """Initialize file.
+
+        Args:
+            report_data: Report file data.
+            report_name: Report file name.
+        """
+        super().__init__(filename=report_name)
+        self.report_data = report_data
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        """Read report data by chunks.
+
+        Args:
+            bot: Bot uploading file.
+
+        Yields:
+            Report data chunks.
+        """
+        async for chunk in iter_parts(self.report_data, self.chunk_size):
+            yield bytes(chunk)
 
 
 async def send_calcs_report(
     message: Message,
-    report_data: bytes,
+    report_data: memoryview,
     report_name: str,
 ) -> None:
     """Send finish message with calculations results.
@@ -19,5 +52,5 @@ async def send_calcs_report(
     """
     await message.answer_document(
         caption=CALCS_RESULT,
-        document=BufferedInputFile(report_data, report_name),
+        document=ReportInputFile(report_data, report_name),
     )
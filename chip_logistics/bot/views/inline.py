@@ -0,0 +1,31 @@
+"""Inline query views types."""
+
+
+from typing import Union
+
+from aiogram import types
+
+# Inline query result of any type accepted by `InlineQuery.answer`.
+# Newer aiogram versions export the same union from `aiogram.types`.
+InlineQueryResultUnion = Union[
+    types.InlineQueryResultCachedAudio,
+    types.InlineQueryResultCachedDocument,
+    types.InlineQueryResultCachedGif,
+    types.InlineQueryResultCachedMpeg4Gif,
+    types.InlineQueryResultCachedPhoto,
+    types.InlineQueryResultCachedSticker,
+    types.InlineQueryResultCachedVideo,
+    types.InlineQueryResultCachedVoice,
+    types.InlineQueryResultArticle,
+    types.InlineQueryResultAudio,
+    types.InlineQueryResultContact,
+    types.InlineQueryResultGame,
+    types.InlineQueryResultDocument,
+    types.InlineQueryResultGif,
+    types.InlineQueryResultLocation,
+    types.InlineQueryResultMpeg4Gif,
+    types.InlineQueryResultPhoto,
+    types.InlineQueryResultVenue,
+    types.InlineQueryResultVideo,
+    types.InlineQueryResultVoice,
+]
@@ -0,0 +1,51 @@
+"""Pages navigation buttons."""
+
+
+from typing import Callable, Optional
+
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardButton
+
+from chip_logistics.bot.texts.pages import NEXT_PAGE_BTN, PREVIOUS_PAGE_BTN
+from chip_logistics.core.articles.models import ArticlesPage
+
+# Factory of page callback by cursors: `after` and `before` articles ids
+PageCallbackFactory = Callable[..., CallbackData]
+
+
+def build_page_btns(
+    page: ArticlesPage,
+    page_callback: PageCallbackFactory,
+) -> list[InlineKeyboardButton]:
+    """Build buttons for navigation to neighbour pages.
+
+    Args:
+        page: Current articles page.
+        page_callback: Factory of callback data with page cursors.
+
+    Returns:
+        Previous and next page buttons, if such pages exist.
+    """
+    if not page.articles:
+        return []
+
+    first_id: Optional[str] = page.articles[0].id
+    last_id: Optional[str] = page.articles[-1].id
+    page_btns = []
+    if page.has_previous:
+        page_btns.append(
+            InlineKeyboardButton(
+                text=PREVIOUS_PAGE_BTN,
+                callback_data=page_callback(before=first_id).pack(),
+            ),
+        )
+
+    if page.has_next:
+        page_btns.append(
+            InlineKeyboardButton(
+                text=NEXT_PAGE_BTN,
+                callback_data=page_callback(after=last_id).pack(),
+            ),
+        )
+
+    return page_btns
@@ -0,0 +1,141 @@
+"""Articles import, export and indexing command line interface.
+
+Articles are read from and written to Deta Base of the project
+set by DETA_PROJECT_KEY environment variable.
+
+Examples:
+    python -m chip_logistics.cli.articles import tariffs.xlsx
+    python -m chip_logistics.cli.articles export articles.csv
+    python -m chip_logistics.cli.articles reindex
+"""
+
+
+import asyncio
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from chip_logistics.core.articles.articles import import_articles
+from chip_logistics.core.articles.repo import (
+    ArticlesNotSavedError,
+    ArticlesRepo,
+)
+from chip_logistics.core.articles.tables import (
+    TableFormat,
+    read_articles_table,
+    write_articles_table,
+)
+from chip_logistics.deta.articles.repo import DetaArticlesRepo
+from chip_logistics.deta.deta import get_deta
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = ArgumentParser(
+        prog='python -m chip_logistics.cli.articles',
+        description='Manage articles tables and names index.',
+    )
+    parser.add_argument(
+        'command',
+        choices=['import', 'export', 'reindex'],
+        help='Import or export articles table, or rebuild names index.',
+    )
+    parser.add_argument(
+        'table',
+        type=Path,
+        nargs='?',
+        help='Table file. Format is defined by .csv or .xlsx extension.',
+    )
+    args = parser.parse_args()
+    if args.command != 'reindex' and args.table is None:
+        parser.error('table is required for {command}'.format(
+            command=args.command,
+        ))
+
+    return args
+
+
+def get_table_format(table_path: Path) -> TableFormat:
+    """Get table format by file extension.
+
+    Args:
+        table_path: Table file path.
+
+    Returns:
+        Table format.
+    """
+    return TableFormat(table_path.suffix.lstrip('.').lower())
+
+
+async def import_table(repo: ArticlesRepo, table_path: Path) -> int:
+    """Import articles from table.
+
+    Args:
+        repo: Articles storage.
+        table_path: Table file path.
+
+    Returns:
+        Number of created or updated articles.
+    """
+    with open(table_path, 'rb') as table_file:
+        articles = read_articles_table(
+            table_file,
+            get_table_format(table_path),
+        )
+
+    return len(await import_articles(repo, articles))
+
+
+async def export_table(repo: ArticlesRepo, table_path: Path) -> int:
+    """Export all articles to table.
+
+    Args:
+        repo: Articles storage.
+        table_path: Table file path.
+
+    Returns:
+        Number of exported articles.
+    """
+    articles = await repo.get_articles()
+    with open(table_path, 'wb') as table_file:
+        write_articles_table(
+            table_file,
+            articles,
+            get_table_format(table_path),
+        )
+
+    return len(articles)
+
+
+async def main() -> None:
+    """Run command."""
+    args = parse_args()
+    async with DetaArticlesRepo(await get_deta()) as repo:
+        if args.command == 'reindex':
+            await repo.rebuild_index()
+            print('Articles names index is rebuilt')  # noqa: WPS421
+        elif args.command == 'import':
+            try:
+                articles_count = await import_table(repo, args.table)
+            except ArticlesNotSavedError as error:
+                sys.exit('Imported {count} articles, {failed} failed'.format(
+                    count=len(error.saved_articles),
+                    failed=len(error.failed_articles),
+                ))
+
+            print('Imported {count} articles'.format(  # noqa: WPS421
+                count=articles_count,
+            ))
+        else:
+            articles_count = await export_table(repo, args.table)
+            print('Exported {count} articles'.format(  # noqa: WPS421
+                count=articles_count,
+            ))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -8,6 +8,7 @@ Configurations can bu used as dependencies.
 
 
 from os import environ
+from typing import Optional
 
 
 def get_bot_token() -> str:
@@ -41,3 +42,96 @@ def get_fixer_api_key() -> str:
         Fixer API key.
     """
     return environ['FIXER_API_KEY']
+
+
+def get_fixer_rates_ttl() -> int:
+    """Get lifetime of cached exchange rates in seconds from env vars.
+
+    See FIXER_RATES_TTL in Spacefile. One hour by default.
+
+    Returns:
+        Exchange rates cache TTL.
+    """
+    return int(environ.get('FIXER_RATES_TTL', 60 * 60))
+
+
+def get_amocrm_credentials_ttl() -> int:
+    """Get time while cached AmoCRM credentials are used without check.
+
+    See AMOCRM_CREDENTIALS_TTL in Spacefile. One minute by default.
+
+    Returns:
+        AmoCRM credentials cache TTL in seconds.
+    """
+    return int(environ.get('AMOCRM_CREDENTIALS_TTL', 60))
+
+
+def get_articles_catalog_ttl() -> int:
+    """Get time while cached articles catalog is used without check.
+
+    See ARTICLES_CATALOG_TTL in Spacefile. One minute by default.
+
+    Returns:
+        Articles catalog cache TTL in seconds.
+    """
+    return int(environ.get('ARTICLES_CATALOG_TTL', 60))
+
+
+def get_fsm_storage_type() -> str:
+    """Get type of FSM records storage from env vars.
+
+    See FSM_STORAGE in Spacefile. Deta Base by default.
+
+    Returns:
+        FSM storage type: `deta`, `sqlite` or `memory`.
+    """
+    return environ.get('FSM_STORAGE', 'deta')
+
+
+def get_fsm_sqlite_path() -> str:
+    """Get path of FSM records SQLite database from env vars.
+
+    See FSM_SQLITE_PATH in Spacefile.
+
+    Returns:
+        SQLite database file path.
+    """
+    return environ.get('FSM_SQLITE_PATH', '/tmp/fsm.sqlite3')  # noqa: S108
+
+
+def get_webhook_workers() -> int:
+    """Get number of workers processing updates in background.
+
+    See WEBHOOK_WORKERS in Spacefile. Zero by default, so updates
+    are processed before webhook response.
+
+    Returns:
+        Number of updates workers.
+    """
+    return int(environ.get('WEBHOOK_WORKERS', 0))
+
+
+def get_slow_request_seconds() -> Optional[float]:
+    """Get duration of outbound HTTP request, which is logged as slow.
+
+    See SLOW_REQUEST_SECONDS in Spacefile.
+
+    Returns:
+        Slow request duration in seconds. None if logging is disabled.
+    """
+    slow_request_seconds = float(environ.get('SLOW_REQUEST_SECONDS', 0))
+    if slow_request_seconds <= 0:
+        return None
+
+    return slow_request_seconds
+
+
+def get_webhook_queue_size() -> int:
+    """Get max number of pending updates of one worker.
+
+    See WEBHOOK_QUEUE_SIZE in Spacefile.
+
+    Returns:
+        Worker queue size.
+    """
+    return int(environ.get('WEBHOOK_QUEUE_SIZE', 100))
@@ -7,66 +7,21 @@ Encapsulate AmoCRM API calls.
 from http import HTTPStatus
 from typing import Optional, Union
 
-from chip_logistics.core.amocrm.client import AmoCRMClient, get_auth_headers
+from chip_logistics.core.amocrm.auth import authorized_request
+from chip_logistics.core.amocrm.client import AmoCRMClient
 from chip_logistics.core.amocrm.models import Contact
 from chip_logistics.core.amocrm.responses import (
-    AuthResponse,
     ContactsResponse,
     FileSessionResponse,
     FileUploadResponse,
     PartUploadResponse,
 )
-
-
-async def authorize(client: AmoCRMClient, auth_code: str) -> None:
-    """Authorize service in AmoCRM.
-
-    See https://www.amocrm.ru/developers/content/oauth/step-by-step
-
-    Args:
-        client: Client data for API access.
-        auth_code: Authorization code.
-    """
-    async with client.api_session.post(
-        '/oauth2/access_token',
-        json={
-            'grant_type': 'authorization_code',
-            'client_id': client.credentials.client_id,
-            'client_secret': client.credentials.client_secret,
-            'code': auth_code,
-            'redirect_uri': client.credentials.redirect_uri,
-        },
-    ) as response:
-        response.raise_for_status()
-        response_data = AuthResponse.from_json(await response.json())
-        client.credentials.access_token = response_data.access_token
-        client.credentials.refresh_token = response_data.refresh_token
-        await client.repo.save_credentials(client.credentials)
-
-
-async def refresh_access_token(client: AmoCRMClient) -> None:
-    """Update access token.
-
-    See https://www.amocrm.ru/developers/content/oauth/step-by-step#Получение-нового-access-token-по-его-истечении for details. # noqa: E501
-
-    Args:
-        client: Client data for API access.
-    """
-    async with client.api_session.post(
-        '/oauth2/access_token',
-        json={
-            'grant_type': 'refresh_token',
-            'client_id': client.credentials.client_id,
-            'client_secret': client.credentials.client_secret,
-            'refresh_token': client.credentials.refresh_token,
-            'redirect_uri': client.credentials.redirect_uri,
-        },
-    ) as response:
-        response.raise_for_status()
-        response_data = AuthResponse.from_json(await response.json())
-        client.credentials.access_token = response_data.access_token
-        client.credentials.refresh_token = response_data.refresh_token
-        await client.repo.save_credentials(client.credentials)
+from chip_logistics.utils.streams import (
+    BinaryData,
+    BinaryPart,
+    get_size,
+    iter_parts,
+)
 
 
 async def find_contacts(
@@ -82,10 +37,12 @@ async def find_contacts(
     Returns:
         List of found contacts.
     """
-    async with client.api_session.get(
+    async with authorized_request(
+        client,
+        client.api_session,
+        'GET',
         '/api/v4/contacts',
         params={'query': query},
-        headers=get_auth_headers(client),
     ) as response:
         response.raise_for_status()
         if response.status == HTTPStatus.OK:
@@ -110,12 +67,14 @@ async def attach_file_to_contact(
         contact_id: Contact identifier.
         file_uuid: File identifier.
     """
-    async with client.api_session.put(
+    async with authorized_request(
+        client,
+        client.api_session,
+        'PUT',
         '/api/v4/contacts/{contact_id}/files'.format(
             contact_id=contact_id,
         ),
         json=[{'file_uuid': file_uuid}],
-        headers=get_auth_headers(client),
     ) as response:
         response.raise_for_status()
 
@@ -142,7 +101,10 @@ async def _open_file_upload_session(
     Returns:
         File upload session data.
     """
-    async with client.drive_session.post(
+    async with authorized_request(
+        client,
+        client.drive_session,
+        'POST',
         '/v1.0/sessions',
         json={
             'file_name': file_name,
@@ -150,7 +112,6 @@ async def _open_file_upload_session(
             'file_uuid': file_uuid,
             'content_type': content_type,
         },
-        headers=get_auth_headers(client),
     ) as response:
         response.raise_for_status()
         return FileSessionResponse.from_json(await response.json())
@@ -159,7 +120,7 @@ async def _open_file_upload_session(
 async def _upload_file_part(
     client: AmoCRMClient,
     upload_url: str,
-    part_data: bytes,
+    part_data: BinaryPart,
 ) -> Union[PartUploadResponse, FileUploadResponse]:
     """Upload file part in terms of current file uploading session.
 
@@ -173,10 +134,12 @@ async def _upload_file_part(
         otherwise PartUploadResponse.
     """
     upload_url = upload_url.replace(client.credentials.drive_url, '')
-    async with client.drive_session.post(
+    async with authorized_request(
+        client,
+        client.drive_session,
+        'POST',
         upload_url,
         data=part_data,
-        headers=get_auth_headers(client),
     ) as response:
         response.raise_for_status()
         if response.status == HTTPStatus.ACCEPTED:
@@ -185,22 +148,30 @@ async def _upload_file_part(
         return FileUploadResponse.from_json(await response.json())
 
 
-async def upload_file(
+async def upload_file(  # noqa: WPS211
     client: AmoCRMClient,
     file_name: str,
-    file_data: bytes,
+    file_data: BinaryData,
     file_uuid: Optional[str] = None,
     content_type: Optional[str] = None,
+    file_size: Optional[int] = None,
 ) -> str:
     """Upload file to account drive.
 
+    File is sent by parts without copying of the whole content,
+    so bytes-like data is sliced by memory views
+    and file objects and async iterators are read part by part.
+
     Args:
         client: Client data for API access.
         file_name: File name
-        file_data: File content,
+        file_data: File content: bytes-like object, \
+            binary file object or async iterator of bytes.
         file_uuid: File identifier. \
             Corresponding file will be updated, if specified.
         content_type: MIME-type of file.
+        file_size: File size. Required for async iterators. \
+            Remaining size of file object by default.
 
     Returns:
         UUID of uploaded file.
@@ -211,14 +182,12 @@ async def upload_file(
     session_data = await _open_file_upload_session(
         client=client,
         file_name=file_name,
-        file_size=len(file_data),
+        file_size=get_size(file_data) if file_size is None else file_size,
         file_uuid=file_uuid,
         content_type=content_type,
     )
     upload_url = session_data.upload_url
-    while file_data:
-        part_data = file_data[:session_data.max_part_size]
-        file_data = file_data[session_data.max_part_size:]
+    async for part_data in iter_parts(file_data, session_data.max_part_size):
         upload_data = await _upload_file_part(
             client=client,
             upload_url=upload_url,
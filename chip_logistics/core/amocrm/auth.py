@@ -0,0 +1,144 @@
+"""AmoCRM authorization.
+
+Obtain and refresh access tokens,
+send requests authorized with them.
+"""
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import Any, AsyncGenerator, Optional
+
+from aiohttp import ClientResponse, ClientSession
+
+from chip_logistics.core.amocrm.client import AmoCRMClient, get_auth_headers
+from chip_logistics.core.amocrm.responses import AuthResponse
+
+# Tokens refreshing locks by integration id
+_refresh_locks: dict[str, asyncio.Lock] = {}
+
+
+async def authorize(client: AmoCRMClient, auth_code: str) -> None:
+    """Authorize service in AmoCRM.
+
+    See https://www.amocrm.ru/developers/content/oauth/step-by-step
+
+    Args:
+        client: Client data for API access.
+        auth_code: Authorization code.
+    """
+    async with client.api_session.post(
+        '/oauth2/access_token',
+        json={
+            'grant_type': 'authorization_code',
+            'client_id': client.credentials.client_id,
+            'client_secret': client.credentials.client_secret,
+            'code': auth_code,
+            'redirect_uri': client.credentials.redirect_uri,
+        },
+    ) as response:
+        response.raise_for_status()
+        response_data = AuthResponse.from_json(await response.json())
+        client.credentials.access_token = response_data.access_token
+        client.credentials.refresh_token = response_data.refresh_token
+        await client.repo.save_credentials(client.credentials)
+
+
+async def refresh_access_token(client: AmoCRMClient) -> None:
+    """Update access token.
+
+    See https://www.amocrm.ru/developers/content/oauth/step-by-step#Получение-нового-access-token-по-его-истечении for details. # noqa: E501
+
+    Args:
+        client: Client data for API access.
+    """
+    async with client.api_session.post(
+        '/oauth2/access_token',
+        json={
+            'grant_type': 'refresh_token',
+            'client_id': client.credentials.client_id,
+            'client_secret': client.credentials.client_secret,
+            'refresh_token': client.credentials.refresh_token,
+            'redirect_uri': client.credentials.redirect_uri,
+        },
+    ) as response:
+        response.raise_for_status()
+        response_data = AuthResponse.from_json(await response.json())
+        client.credentials.access_token = response_data.access_token
+        client.credentials.refresh_token = response_data.refresh_token
+        await client.repo.save_credentials(client.credentials)
+
+
+@asynccontextmanager
+async def authorized_request(  # noqa: WPS211
+    client: AmoCRMClient,
+    session: ClientSession,
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> AsyncGenerator[ClientResponse, None]:
+    """Send authorized request to AmoCRM.
+
+    If access token is expired, it is refreshed
+    and request is sent again once.
+
+    Args:
+        client: Client data for API access.
+        session: Client session, that request is sent with.
+        method: HTTP method.
+        url: Request URL.
+        kwargs: Other request parameters. Must be reusable for retry.
+
+    Yields:
+        Response of the last attempt.
+    """
+    access_token = client.credentials.access_token
+    response = await session.request(
+        method,
+        url,
+        headers=get_auth_headers(client),
+        **kwargs,
+    )
+    if response.status == HTTPStatus.UNAUTHORIZED:
+        response.release()
+        await refresh_expired_token(client, access_token)
+        response = await session.request(
+            method,
+            url,
+            headers=get_auth_headers(client),
+            **kwargs,
+        )
+
+    try:
+        yield response
+    finally:
+        response.release()
+
+
+async def refresh_expired_token(
+    client: AmoCRMClient,
+    expired_token: Optional[str],
+) -> None:
+    """Refresh expired access token once for concurrent requests.
+
+    Refreshing is performed under the lock of integration.
+    If token was already refreshed by another request,
+    client just takes saved credentials.
+
+    Args:
+        client: Client data for API access.
+        expired_token: Access token rejected by API.
+    """
+    client_id = client.credentials.client_id
+    refresh_lock = _refresh_locks.setdefault(client_id, asyncio.Lock())
+    async with refresh_lock:
+        if client.credentials.access_token != expired_token:
+            return
+
+        credentials = await client.repo.get_credentials()
+        if credentials.access_token != expired_token:
+            client.credentials = credentials
+            return
+
+        await refresh_access_token(client)
@@ -0,0 +1,151 @@
+"""AmoCRM credentials caching.
+
+Credentials are kept in memory of the process,
+so AmoCRM calls do not wait for the storage on each client init.
+"""
+
+
+from time import monotonic
+from typing import Optional
+
+from pydantic import BaseModel
+
+from chip_logistics.core.amocrm.models import Credentials
+from chip_logistics.core.amocrm.repo import AmoCRMRepo
+
+# Time in seconds while cached credentials are used without version check
+DEFAULT_CREDENTIALS_TTL = 60
+
+
+class CachedCredentials(BaseModel):
+    """Credentials saved in the cache."""
+
+    # AmoCRM integration credentials
+    credentials: Credentials
+
+    # Monotonic time when credentials version was checked
+    checked_at: float
+
+
+class CredentialsCache(object):
+    """AmoCRM credentials cache.
+
+    Cache should be shared between repositories
+    to reuse credentials loaded during previous requests.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CREDENTIALS_TTL) -> None:
+        """Initialize empty cache.
+
+        Args:
+            ttl: Time in seconds while credentials are used \
+                without version check.
+        """
+        self.ttl = ttl
+        self._cached: Optional[CachedCredentials] = None
+
+    def get(self) -> Optional[CachedCredentials]:
+        """Get cached credentials.
+
+        Returns:
+            Cached credentials. None if cache is empty.
+        """
+        return self._cached
+
+    def put(self, credentials: Credentials) -> None:
+        """Save copy of credentials.
+
+        Args:
+            credentials: AmoCRM integration credentials.
+        """
+        self._cached = CachedCredentials(
+            credentials=credentials.model_copy(),
+            checked_at=monotonic(),
+        )
+
+    def touch(self) -> None:
+        """Mark cached credentials as checked now."""
+        if self._cached is not None:
+            self._cached.checked_at = monotonic()
+
+    def is_fresh(self, cached: CachedCredentials) -> bool:
+        """Check that credentials can be used without version check.
+
+        Args:
+            cached: Credentials from the cache.
+
+        Returns:
+            True if credentials are checked recently.
+        """
+        return monotonic() - cached.checked_at < self.ttl
+
+    def clear(self) -> None:
+        """Remove cached credentials."""
+        self._cached = None
+
+
+class CachedAmoCRMRepo(AmoCRMRepo):
+    """AmoCRM repository with credentials cache in front of storage.
+
+    Saved credentials are written through the cache.
+    Credentials changed by other processes are detected
+    by version check after cache TTL is expired.
+    """
+
+    def __init__(self, repo: AmoCRMRepo, cache: CredentialsCache) -> None:
+        """Initialize repository.
+
+        Args:
+            repo: Credentials storage.
+            cache: Shared credentials cache.
+        """
+        super().__init__()
+        self._repo = repo
+        self._cache = cache
+
+    async def get_credentials(self) -> Credentials:
+        """Get AmoCRM integration credentials.
+
+        Returns:
+            Copy of cached credentials, if they are fresh \
+            or version is not changed. Otherwise, credentials from storage.
+        """
+        cached = self._cache.get()
+        if cached is not None:
+            if self._cache.is_fresh(cached):
+                return cached.credentials.model_copy()
+
+            version = await self._repo.get_credentials_version(
+                cached.credentials.client_id,
+            )
+            if version is not None and version == cached.credentials.version:
+                self._cache.touch()
+                return cached.credentials.model_copy()
+
+        credentials = await self._repo.get_credentials()
+        self._cache.put(credentials)
+        return credentials.model_copy()
+
+    async def save_credentials(self, credentials: Credentials) -> None:
+        """Save AmoCRM integration credentials to storage and cache.
+
+        Args:
+            credentials: AmoCRM integration credentials.
+        """
+        await self._repo.save_credentials(credentials)
+        self._cache.put(credentials)
+
+    async def get_credentials_version(self, client_id: str) -> Optional[str]:
+        """Get version of stored AmoCRM integration credentials.
+
+        Args:
+            client_id: AmoCRM integration id.
+
+        Returns:
+            Credentials version.
+        """
+        return await self._repo.get_credentials_version(client_id)
+
+    async def aclose(self) -> None:
+        """Close storage."""
+        await self._repo.aclose()
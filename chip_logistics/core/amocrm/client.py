@@ -6,13 +6,14 @@ See https://www.amocrm.ru/developers for reference.
 
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from aiohttp import ClientSession
 from pydantic import BaseModel, ConfigDict
 
 from chip_logistics.core.amocrm.models import Credentials
 from chip_logistics.core.amocrm.repo import AmoCRMRepo
+from chip_logistics.utils.sessions import SessionsPool
 
 
 class AmoCRMClient(BaseModel):
@@ -39,16 +40,30 @@ class AmoCRMClient(BaseModel):
 @asynccontextmanager
 async def init_client(
     repo: AmoCRMRepo,
+    sessions_pool: Optional[SessionsPool] = None,
 ) -> AsyncGenerator[AmoCRMClient, None]:
     """Initialize AmoCRM client with credentials.
 
+    Sessions are taken from the pool, if it is provided.
+    Otherwise, new sessions are opened and closed on exit.
+
     Args:
         repo: AmoCRM client data repository.
+        sessions_pool: Shared HTTP sessions.
 
     Yields:
         AmoCRM client instance.
     """
     credentials = await repo.get_credentials()
+    if sessions_pool is not None:
+        yield AmoCRMClient(
+            credentials=credentials,
+            repo=repo,
+            api_session=sessions_pool.get_session(credentials.api_url),
+            drive_session=sessions_pool.get_session(credentials.drive_url),
+        )
+        return
+
     api_session = ClientSession(base_url=credentials.api_url)
     drive_session = ClientSession(base_url=credentials.drive_url)
     service = AmoCRMClient(
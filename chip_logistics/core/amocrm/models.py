@@ -17,6 +17,9 @@ class Credentials(BaseModel):
     refresh_token: Optional[str]
     redirect_uri: str
 
+    # Version of stored credentials, changed on each save.
+    version: Optional[str] = None
+
 
 class Contact(BaseModel):
     """AmoCRM contact model.
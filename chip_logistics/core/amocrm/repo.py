@@ -1,7 +1,7 @@
 """AmoCRM client data repository interface."""
 
 
-from typing import Protocol, runtime_checkable
+from typing import Optional, Protocol, runtime_checkable
 
 from chip_logistics.core.amocrm.models import Credentials
 from chip_logistics.utils.closing import AClosing
@@ -21,6 +21,18 @@ class AmoCRMRepo(AClosing, Protocol):
     async def save_credentials(self, credentials: Credentials) -> None:
         """Save AmoCRM integration credentials.
 
+        Credentials version is updated.
+
         Args:
             credentials: AmoCRM integration credentials.
         """
+
+    async def get_credentials_version(self, client_id: str) -> Optional[str]:
+        """Get version of stored AmoCRM integration credentials.
+
+        Args:
+            client_id: AmoCRM integration id.
+
+        Returns:
+            Credentials version. None if credentials are not versioned.
+        """
@@ -7,11 +7,11 @@ Contain following functionalities:
 
 
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
 
+from chip_logistics.core.articles.batch import calculate_items_prices
 from chip_logistics.core.articles.calcs import (
     CalculationsResults,
-    calculate_article_price,
     calculate_total_price,
 )
 from chip_logistics.core.articles.currencies import CurrenciesService
@@ -21,6 +21,7 @@ from chip_logistics.core.articles.models import (
     Currency,
 )
 from chip_logistics.core.articles.repo import ArticlesRepo
+from chip_logistics.core.articles.search import normalize_name
 
 
 async def get_article(
@@ -83,6 +84,34 @@ async def create_article(
     return await repo.put_article(article)
 
 
+async def import_articles(
+    repo: ArticlesRepo,
+    articles: Iterable[ArticleInfo],
+) -> list[ArticleInfo]:
+    """Create or update several articles at once.
+
+    Articles without ids get ids of existing articles with same names,
+    so repeated import updates articles instead of duplicating them.
+
+    Args:
+        repo: Articles storage.
+        articles: Imported articles.
+
+    Returns:
+        Created or updated articles.
+    """
+    existing_ids = {
+        normalize_name(article.name): article.id
+        async for article in repo.iter_articles()
+    }
+    return await repo.put_articles(
+        article.model_copy(update={
+            'id': article.id or existing_ids.get(normalize_name(article.name)),
+        })
+        for article in articles
+    )
+
+
 async def delete_article(
     repo: ArticlesRepo,
     article_id: str,
@@ -99,33 +128,20 @@ async def delete_article(
     return await repo.delete_article(article_id)
 
 
-async def _convert_item_to_usd(
-    currencies_service: CurrenciesService,
-    article_item: ArticleItem,
-) -> Optional[ArticleItem]:
-    """Create new item instance with price converted to USD.
+async def delete_articles(
+    repo: ArticlesRepo,
+    article_ids: Iterable[str],
+) -> set[str]:
+    """Delete several articles from repository.
 
     Args:
-        currencies_service: Currencies operation provider.
-        article_item: Item with price in some currency.
+        repo: Articles storage.
+        article_ids: Ids of articles to delete.
 
     Returns:
-        Article item with unit_price in USD if price
-        successfully converted.
+        Ids of deleted articles.
     """
-    usd_price = await currencies_service.convert_price(
-        article_item.unit_price,
-        article_item.price_currency,
-        Currency.usd,
-        use_cached=True,
-    )
-    if usd_price is None:
-        return None
-
-    usd_item = ArticleItem(**article_item.model_dump())
-    usd_item.price_currency = Currency.usd
-    usd_item.unit_price = usd_price
-    return usd_item
+    return await repo.delete_articles(article_ids)
 
 
 async def calculate_articles_price(
@@ -134,7 +150,7 @@ async def calculate_articles_price(
 ) -> tuple[CalculationsResults, Decimal]:
     """Calculate prices for all items.
 
-    All prices converted to USD.
+    All prices converted to USD with rates got at once.
 
     Args:
         currencies_service: Currencies operation provider.
@@ -143,18 +159,20 @@ async def calculate_articles_price(
     Returns:
         Items prices and total price.
     """
-    usd_articles_items = [
-        await _convert_item_to_usd(currencies_service, article_item)
-        for article_item in articles_items
-    ]
-    calculations_results = [
-        (
-            article_item,
-            calculate_article_price(article_item),
-        )
+    usd_articles_items = await currencies_service.convert_items(
+        articles_items,
+        Currency.usd,
+        use_cached=True,
+    )
+    converted_items = [
+        article_item
         for article_item in usd_articles_items
         if article_item is not None
     ]
+    calculations_results = list(zip(
+        converted_items,
+        calculate_items_prices(converted_items),
+    ))
     total_price = calculate_total_price(
         calculations_results,
     )
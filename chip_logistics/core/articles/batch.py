@@ -0,0 +1,106 @@
+"""Batch article price calculation.
+
+Prices of many articles are calculated by columns of items values.
+Calculations repeat Decimal operations of `calcs.calculate_article_price`
+in the same order, so results are identical.
+"""
+
+from decimal import ROUND_CEILING, Decimal
+from typing import Iterable, Sequence
+
+from chip_logistics.core.articles.calcs import (
+    AIR_DELIVERY_PRICE_PER_KG,
+    CUSTOM_FEE_RATIO,
+    PRICE_MARGIN_RATIO,
+    calculate_russian_delivery_price,
+)
+from chip_logistics.core.articles.models import ArticleItem
+
+# Price with fee multiplier to add margin
+PRICE_MARGIN_MULTIPLIER = 1 + PRICE_MARGIN_RATIO
+
+# Final price precision, same as `round(price, 1)`
+PRICE_QUANTUM = Decimal('0.1')
+
+# Items values by columns: counts, unit weights, unit prices, duty fee ratios
+ArticlesColumns = tuple[
+    Sequence[int],
+    Sequence[Decimal],
+    Sequence[Decimal],
+    Sequence[Decimal],
+]
+
+
+def get_articles_columns(
+    articles_items: Iterable[ArticleItem],
+) -> ArticlesColumns:
+    """Split items values by columns.
+
+    Args:
+        articles_items: Items to split.
+
+    Returns:
+        Counts, unit weights, unit prices and duty fee ratios of items.
+    """
+    counts: list[int] = []
+    unit_weights: list[Decimal] = []
+    unit_prices: list[Decimal] = []
+    duty_fee_ratios: list[Decimal] = []
+    for article_item in articles_items:
+        counts.append(article_item.count)
+        unit_weights.append(article_item.unit_weight)
+        unit_prices.append(article_item.unit_price)
+        duty_fee_ratios.append(article_item.duty_fee_ratio)
+
+    return counts, unit_weights, unit_prices, duty_fee_ratios
+
+
+def calculate_articles_prices(  # noqa: WPS210
+    articles_columns: ArticlesColumns,
+) -> list[Decimal]:
+    """Calculate the total prices for articles in one pass.
+
+    Rows are calculated in a single loop without chain
+    of per-item functions calls and models fields access.
+
+    Args:
+        articles_columns: Counts, unit weights, unit prices \
+            and duty fee ratios of items. See `get_articles_columns`.
+
+    Returns:
+        The final prices for articles including all fees.
+    """
+    prices: list[Decimal] = []
+    rows = zip(*articles_columns)
+    for count, unit_weight, unit_price, duty_fee_ratio in rows:
+        total_weight = unit_weight * count
+        total_price = unit_price * count
+        air_delivery_price = total_weight.to_integral_value(
+            ROUND_CEILING,
+        ) * AIR_DELIVERY_PRICE_PER_KG
+        price_for_custom = total_price + air_delivery_price
+        price_with_fee = price_for_custom + price_for_custom * CUSTOM_FEE_RATIO
+        price_with_fee += calculate_russian_delivery_price(
+            air_delivery_price,
+            total_weight,
+        )
+        price_with_fee += total_price * (duty_fee_ratio - 1)
+        prices.append(
+            (price_with_fee * PRICE_MARGIN_MULTIPLIER).quantize(PRICE_QUANTUM),
+        )
+
+    return prices
+
+
+def calculate_items_prices(
+    articles_items: Iterable[ArticleItem],
+) -> list[Decimal]:
+    """Calculate the total prices for articles items in one pass.
+
+    Args:
+        articles_items: The articles for which to calculate prices.
+
+    Returns:
+        The final prices for articles including all fees.
+    """
+    return calculate_articles_prices(get_articles_columns(articles_items))
@@ -0,0 +1,583 @@
+"""Articles catalog caching.
+
+Catalog is kept in memory of the process, so menus navigation
+does not wait for the storage on each click. Names are searched
+with in-memory n-grams index, built once per loaded catalog.
+Local writes update cached articles and index in place.
+"""
+
+
+import asyncio
+from bisect import bisect_left, insort
+from time import monotonic
+from typing import AsyncIterator, Iterable, Optional
+
+from pydantic import BaseModel
+
+from chip_logistics.core.articles.models import ArticleInfo, ArticlesPage
+from chip_logistics.core.articles.pages import slice_articles_page
+from chip_logistics.core.articles.repo import (
+    ArticlesNotSavedError,
+    ArticlesRepo,
+)
+from chip_logistics.core.articles.search import (
+    get_ngrams,
+    is_indexed_query,
+    match_name,
+    normalize_name,
+)
+from chip_logistics.utils.metrics import metrics_registry
+
+# Time in seconds while cached catalog is used without version check
+DEFAULT_CATALOG_TTL = 60
+
+# Articles ids by names n-grams
+NgramsIndex = dict[str, set[str]]
+
+# Catalog reads results, named as stats counters
+CACHE_HIT = 'hits'
+CACHE_MISS = 'misses'
+CACHE_REVALIDATION = 'revalidations'
+
+catalog_cache_reads = metrics_registry.counter(
+    'articles_catalog_cache_reads_total',
+    'Number of articles catalog reads by cache results',
+    labels=('result',),
+)
+
+
+class CachedCatalog(BaseModel):
+    """Articles catalog saved in the cache."""
+
+    # All articles by ids
+    articles: dict[str, ArticleInfo]
+
+    # Sorted articles ids for pagination
+    sorted_ids: list[str]
+
+    # Catalog version, when articles were loaded
+    version: Optional[str]
+
+    # Monotonic time when catalog version was checked
+    checked_at: float
+
+    # Articles ids by names n-grams
+    ngrams_index: NgramsIndex
+
+    def get_candidates_ids(self, normalized_query: str) -> list[str]:
+        """Get sorted ids of articles, which names can match query.
+
+        Ids are taken from n-grams index for long enough queries,
+        so names of other articles are not checked.
+
+        Args:
+            normalized_query: Normalized name query.
+
+        Returns:
+            Ids of articles containing all query n-grams. \
+            All ids, if query is too short for index.
+        """
+        if not is_indexed_query(normalized_query):
+            return self.sorted_ids
+
+        ngrams_ids = [
+            self.ngrams_index.get(ngram, set())
+            for ngram in get_ngrams(normalized_query)
+        ]
+        return sorted(set.intersection(*ngrams_ids))
+
+    def put_articles(self, articles: Iterable[ArticleInfo]) -> None:
+        """Add or replace articles and update index.
+
+        Args:
+            articles: Saved articles.
+        """
+        for article in articles:
+            if article.id is None:
+                continue
+
+            previous = self.articles.get(article.id)
+            if previous is None:
+                insort(self.sorted_ids, article.id)
+            else:
+                _unindex_article(self.ngrams_index, previous)
+
+            self.articles[article.id] = article
+            _index_article(self.ngrams_index, article)
+
+    def delete_articles(self, article_ids: Iterable[str]) -> None:
+        """Remove articles and their index entries.
+
+        Args:
+            article_ids: Ids of deleted articles.
+        """
+        for article_id in article_ids:
+            article = self.articles.pop(article_id, None)
+            if article is None:
+                continue
+
+            self.sorted_ids.pop(bisect_left(self.sorted_ids, article_id))
+            _unindex_article(self.ngrams_index, article)
+
+
+class CatalogCacheStats(BaseModel):
+    """Counters of catalog cache usage."""
+
+    # Number of reads served from the cache
+    hits: int = 0
+
+    # Number of reads, which loaded catalog from storage
+    misses: int = 0
+
+    # Number of catalog version checks
+    revalidations: int = 0
+
+
+class CatalogCache(object):  # noqa: WPS214
+    """Articles catalog cache.
+
+    Cache should be shared between repositories
+    to reuse catalog loaded during previous requests.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CATALOG_TTL) -> None:
+        """Initialize empty cache.
+
+        Args:
+            ttl: Time in seconds while catalog is used without version check.
+        """
+        self.ttl = ttl
+        self.stats = CatalogCacheStats()
+        self._cached: Optional[CachedCatalog] = None
+
+    def count_read(self, read_result: str) -> None:
+        """Count catalog read in cache stats and application metrics.
+
+        Args:
+            read_result: One of `CACHE_HIT`, `CACHE_MISS` \
+                and `CACHE_REVALIDATION`.
+        """
+        read_count = getattr(self.stats, read_result)
+        setattr(self.stats, read_result, read_count + 1)
+        catalog_cache_reads.inc(result=read_result)
+
+    def get(self) -> Optional[CachedCatalog]:
+        """Get cached catalog.
+
+        Returns:
+            Cached catalog. None if cache is empty.
+        """
+        return self._cached
+
+    def put(
+        self,
+        articles: list[ArticleInfo],
+        version: Optional[str],
+    ) -> CachedCatalog:
+        """Save catalog.
+
+        Args:
+            articles: All articles.
+            version: Catalog version, when articles were loaded.
+
+        Returns:
+            Cached catalog.
+        """
+        articles_by_ids = {
+            article.id: article
+            for article in articles
+            if article.id is not None
+        }
+        self._cached = CachedCatalog(
+            articles=articles_by_ids,
+            sorted_ids=sorted(articles_by_ids),
+            ngrams_index=_build_ngrams_index(articles_by_ids),
+            version=version,
+            checked_at=monotonic(),
+        )
+        return self._cached
+
+    def patch(
+        self,
+        previous_version: Optional[str],
+        saved_articles: Iterable[ArticleInfo] = (),
+        deleted_ids: Iterable[str] = (),
+    ) -> Optional[CachedCatalog]:
+        """Apply local write to the cached catalog.
+
+        Catalog is patched only if storage was not changed
+        by others since catalog was loaded, so their changes
+        are not hidden by the new version. Otherwise,
+        cache is cleared and catalog is loaded on the next read.
+
+        Args:
+            previous_version: Catalog version got along with the write.
+            saved_articles: Created or updated articles.
+            deleted_ids: Ids of deleted articles.
+
+        Returns:
+            Patched catalog. None if cache is cleared.
+        """
+        cached = self._cached
+        if cached is None or cached.version != previous_version:
+            self.clear()
+            return None
+
+        cached.put_articles(saved_articles)
+        cached.delete_articles(deleted_ids)
+        return cached
+
+    def set_version(
+        self,
+        cached: CachedCatalog,
+        version: Optional[str],
+    ) -> None:
+        """Save version of patched catalog and mark it as checked now.
+
+        Ignored, if catalog was replaced after patch.
+
+        Args:
+            cached: Patched catalog.
+            version: Catalog version after local write.
+        """
+        if self._cached is cached:
+            cached.version = version
+            cached.checked_at = monotonic()
+
+    def touch(self) -> None:
+        """Mark cached catalog as checked now."""
+        if self._cached is not None:
+            self._cached.checked_at = monotonic()
+
+    def is_fresh(self, cached: CachedCatalog) -> bool:
+        """Check that catalog can be used without version check.
+
+        Args:
+            cached: Catalog from the cache.
+
+        Returns:
+            True if catalog is checked recently.
+        """
+        return monotonic() - cached.checked_at < self.ttl
+
+    def clear(self) -> None:
+        """Remove cached catalog."""
+        self._cached = None
+
+
+class CachedArticlesRepo(ArticlesRepo):  # noqa: WPS214
+    """Articles repository with catalog cache in front of storage.
+
+    Reads are served from the cache. Local writes are applied
+    to the cached catalog, so it is not reloaded after them.
+    Catalog changed by other processes is detected
+    by version check after cache TTL is expired.
+
+    Articles are returned as copies, so callers cannot change the cache.
+    """
+
+    def __init__(self, repo: ArticlesRepo, cache: CatalogCache) -> None:
+        """Initialize repository.
+
+        Args:
+            repo: Articles storage.
+            cache: Shared catalog cache.
+        """
+        super().__init__()
+        self._repo = repo
+        self._cache = cache
+
+    async def put_article(self, article: ArticleInfo) -> ArticleInfo:
+        """Add or update article in storage and cache.
+
+        Args:
+            article: Article data.
+
+        Returns:
+            Created or updated article.
+        """
+        version, saved_article = await asyncio.gather(
+            self._repo.get_catalog_version(),
+            self._repo.put_article(article),
+        )
+        await self._refresh_version(
+            self._cache.patch(version, saved_articles=[saved_article]),
+        )
+        return saved_article
+
+    async def put_articles(
+        self,
+        articles: Iterable[ArticleInfo],
+    ) -> list[ArticleInfo]:
+        """Add or update several articles in storage and cache.
+
+        Cached catalog is removed, if some of articles are not saved.
+
+        Args:
+            articles: Articles data.
+
+        Returns:
+            Created or updated articles.
+
+        Raises:
+            ArticlesNotSavedError: If storage saved articles partially.
+        """
+        try:
+            version, saved_articles = await asyncio.gather(
+                self._repo.get_catalog_version(),
+                self._repo.put_articles(articles),
+            )
+        except ArticlesNotSavedError:
+            self._cache.clear()
+            raise
+
+        await self._refresh_version(
+            self._cache.patch(version, saved_articles=saved_articles),
+        )
+        return saved_articles
+
+    async def get_articles(self) -> list[ArticleInfo]:
+        """Get list of all cached articles.
+
+        Returns:
+            Articles info.
+        """
+        return [article async for article in self.iter_articles()]
+
+    async def iter_articles(self) -> AsyncIterator[ArticleInfo]:
+        """Iterate all cached articles.
+
+        Yields:
+            Articles info.
+        """
+        catalog = await self._get_catalog()
+        # Catalog can be changed by local writes between yields
+        for article in list(catalog.articles.values()):
+            yield article.model_copy()
+
+    async def find_articles(
+        self,
+        query: Optional[str] = None,
+    ) -> list[ArticleInfo]:
+        """Find cached articles by name.
+
+        Search is case and word position insensitive.
+
+        So, for names ['fOo', 'Bar', 'bar foo'] query
+        'foo' would find ['fOo', 'bar foo'].
+
+        Args:
+            query: Name query. If None, all articles returned.
+
+        Returns:
+            List of found articles.
+        """
+        if query is None:
+            return await self.get_articles()
+
+        normalized_query = normalize_name(query)
+        catalog = await self._get_catalog()
+        found_articles = (
+            catalog.articles[article_id]
+            for article_id in catalog.get_candidates_ids(normalized_query)
+        )
+        return [
+            article.model_copy()
+            for article in found_articles
+            if match_name(article.name, normalized_query)
+        ]
+
+    async def get_articles_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> ArticlesPage:
+        """Get page of cached articles ordered by ids.
+
+        Args:
+            limit: Max number of articles on the page.
+            after: Id of the last article of the previous page.
+            before: Id of the first article of the next page.
+
+        Returns:
+            Articles page. First page, if cursors are not specified.
+        """
+        catalog = await self._get_catalog()
+        page = slice_articles_page(
+            catalog.articles,
+            catalog.sorted_ids,
+            limit,
+            after=after,
+            before=before,
+        )
+        page.articles = [article.model_copy() for article in page.articles]
+        return page
+
+    async def get_article(self, article_id: str) -> Optional[ArticleInfo]:
+        """Get cached article by id.
+
+        Args:
+            article_id: Article identifier.
+
+        Returns:
+            Found article or None.
+        """
+        catalog = await self._get_catalog()
+        article = catalog.articles.get(article_id)
+        if article is None:
+            return None
+
+        return article.model_copy()
+
+    async def delete_article(self, article_id: str) -> bool:
+        """Delete article from storage and cache.
+
+        Existence of article is checked in the cached catalog,
+        so storage deletes it without lookup.
+
+        Args:
+            article_id: Id of article to delete.
+
+        Returns:
+            True if article deleted.
+        """
+        catalog = await self._get_catalog()
+        if article_id not in catalog.articles:
+            return False
+
+        await self.discard_articles([article_id])
+        return True
+
+    async def delete_articles(self, article_ids: Iterable[str]) -> set[str]:
+        """Delete several articles from storage and cache.
+
+        Args:
+            article_ids: Ids of articles to delete.
+
+        Returns:
+            Ids of deleted articles.
+        """
+        version, deleted_ids = await asyncio.gather(
+            self._repo.get_catalog_version(),
+            self._repo.delete_articles(article_ids),
+        )
+        await self._refresh_version(
+            self._cache.patch(version, deleted_ids=deleted_ids),
+        )
+        return deleted_ids
+
+    async def discard_articles(
+        self,
+        article_ids: Iterable[str],
+    ) -> Optional[str]:
+        """Delete articles from storage and cache without lookup.
+
+        Args:
+            article_ids: Ids of existing articles.
+
+        Returns:
+            New catalog version.
+        """
+        article_ids = list(article_ids)
+        previous_version, version = await asyncio.gather(
+            self._repo.get_catalog_version(),
+            self._repo.discard_articles(article_ids),
+        )
+        cached = self._cache.patch(previous_version, deleted_ids=article_ids)
+        if cached is not None:
+            self._cache.set_version(cached, version)
+
+        return version
+
+    async def get_catalog_version(self) -> Optional[str]:
+        """Get version of stored catalog.
+
+        Returns:
+            Catalog version.
+        """
+        return await self._repo.get_catalog_version()
+
+    async def aclose(self) -> None:
+        """Close storage."""
+        await self._repo.aclose()
+
+    async def _get_catalog(self) -> CachedCatalog:
+        """Get cached catalog, loading it from storage if necessary.
+
+        Returns:
+            Fresh or not changed cached catalog. \
+            Otherwise, catalog from storage.
+        """
+        cached = self._cache.get()
+        if cached is not None and self._cache.is_fresh(cached):
+            self._cache.count_read(CACHE_HIT)
+            return cached
+
+        if cached is not None:
+            self._cache.count_read(CACHE_REVALIDATION)
+
+        # Version is got before articles, so concurrent change
+        # makes cached version outdated and catalog is reloaded later.
+        version = await self._repo.get_catalog_version()
+        if cached is not None and version is not None:
+            if version == cached.version:
+                self._cache.count_read(CACHE_HIT)
+                self._cache.touch()
+                return cached
+
+        self._cache.count_read(CACHE_MISS)
+        return self._cache.put(await self._repo.get_articles(), version)
+
+    async def _refresh_version(self, cached: Optional[CachedCatalog]) -> None:
+        """Get catalog version after local write.
+
+        Args:
+            cached: Patched catalog. None if cache was cleared.
+        """
+        if cached is not None:
+            self._cache.set_version(
+                cached,
+                await self._repo.get_catalog_version(),
+            )
+
+
+def _build_ngrams_index(articles: dict[str, ArticleInfo]) -> NgramsIndex:
+    """Index articles ids by names n-grams.
+
+    Args:
+        articles: Articles by ids.
+
+    Returns:
+        Ids of articles containing n-gram by n-grams.
+    """
+    ngrams_index: NgramsIndex = {}
+    for article in articles.values():
+        _index_article(ngrams_index, article)
+
+    return ngrams_index
+
+
+def _index_article(ngrams_index: NgramsIndex, article: ArticleInfo) -> None:
+    """Add article id to entries of its name n-grams.
+
+    Args:
+        ngrams_index: Articles ids by names n-grams.
+        article: Article with id.
+    """
+    for ngram in get_ngrams(normalize_name(article.name)):
+        ngrams_index.setdefault(ngram, set()).add(str(article.id))
+
+
+def _unindex_article(ngrams_index: NgramsIndex, article: ArticleInfo) -> None:
+    """Remove article id from entries of its name n-grams.
+
+    Args:
+        ngrams_index: Articles ids by names n-grams.
+        article: Article with id.
+    """
+    for ngram in get_ngrams(normalize_name(article.name)):
+        ngram_ids = ngrams_index.get(ngram, set())
+        ngram_ids.discard(str(article.id))
+        if not ngram_ids:
+            ngrams_index.pop(ngram, None)
@@ -1,16 +1,226 @@
 """Currencies converting module."""
 
 
+import asyncio
 from decimal import Decimal
-from typing import Any, Optional
+from time import monotonic
+from typing import Any, Callable, Coroutine, Iterable, Optional
 
 from aiohttp import ClientResponse, ClientResponseError, ClientSession
+from pydantic import BaseModel, Field
 
-from chip_logistics.core.articles.models import Currency
+from chip_logistics.core.articles.models import ArticleItem, Currency
 from chip_logistics.utils.closing import AClosing
 
+# Base url of Fixer API provided by API Layer
+FIXER_API_URL = 'https://api.apilayer.com'
 
-class CurrenciesService(AClosing):
+# Time in seconds while cached rate is considered fresh
+DEFAULT_RATES_TTL = 60 * 60
+
+# Time in seconds after expiration while cached rate is still served
+# and refreshed in background
+DEFAULT_RATES_STALE_TTL = 6 * 60 * 60
+
+CurrenciesPair = tuple[Currency, Currency]
+
+# Base and target currencies of rates request
+RatesRequest = tuple[Currency, frozenset[Currency]]
+
+# Rates fetching tasks by base and target currencies
+PendingRates = dict[RatesRequest, 'asyncio.Task[dict[Currency, Decimal]]']
+
+# Coroutine function fetching rates from base to target currencies
+RatesFetcher = Callable[
+    [Currency, list[Currency]],
+    Coroutine[Any, Any, dict[Currency, Decimal]],
+]
+
+
+class CachedRate(BaseModel):
+    """Exchange rate saved in the cache."""
+
+    # Exchange rate value
+    rate: Decimal
+
+    # Monotonic time when rate was fetched
+    fetched_at: float
+
+
+class CachedRates(BaseModel):
+    """Exchange rates to the target currency found in the cache."""
+
+    # Usable rates by base currencies
+    rates: dict[Currency, Decimal] = Field(default_factory=dict)
+
+    # Base currencies, which rates should be refreshed in background
+    stale_currencies: set[Currency] = Field(default_factory=set)
+
+    # Base currencies, which rates should be fetched
+    missed_currencies: set[Currency] = Field(default_factory=set)
+
+
+class RatesCache(object):  # noqa: WPS214
+    """Exchange rates cache.
+
+    Cache can be shared between services to reuse rates
+    fetched during previous requests. Pending rates requests
+    are kept in the cache too, so concurrent services
+    requesting the same rates wait for one API call.
+
+    Rate of the inverse currencies pair is used,
+    if direct pair rate is missed or older.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RATES_TTL,
+        stale_ttl: float = DEFAULT_RATES_STALE_TTL,
+    ) -> None:
+        """Initialize empty cache.
+
+        Args:
+            ttl: Time in seconds while rate is fresh.
+            stale_ttl: Time in seconds after expiration while rate \
+                can be served and revalidated in background.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._rates: dict[CurrenciesPair, CachedRate] = {}
+        self._pending: PendingRates = {}
+
+    def get(
+        self,
+        from_currency: Currency,
+        to_currency: Currency,
+    ) -> Optional[CachedRate]:
+        """Get cached rate for currencies pair.
+
+        Args:
+            from_currency: Base currency.
+            to_currency: Target currency.
+
+        Returns:
+            Most recent of direct and derived from inverse pair rates.
+            None if both are missed.
+        """
+        direct = self._rates.get((from_currency, to_currency))
+        inverse = self._rates.get((to_currency, from_currency))
+        if inverse is None or not inverse.rate:
+            return direct
+
+        if direct is not None and direct.fetched_at >= inverse.fetched_at:
+            return direct
+
+        return CachedRate(
+            rate=1 / inverse.rate,
+            fetched_at=inverse.fetched_at,
+        )
+
+    def put(
+        self,
+        from_currency: Currency,
+        to_currency: Currency,
+        rate: Decimal,
+    ) -> None:
+        """Save rate for currencies pair.
+
+        Args:
+            from_currency: Base currency.
+            to_currency: Target currency.
+            rate: Exchange rate.
+        """
+        self._rates[(from_currency, to_currency)] = CachedRate(
+            rate=rate,
+            fetched_at=monotonic(),
+        )
+
+    def is_fresh(self, cached_rate: CachedRate) -> bool:
+        """Check that rate can be used without revalidation.
+
+        Args:
+            cached_rate: Rate from the cache.
+
+        Returns:
+            True if rate is not expired.
+        """
+        return monotonic() - cached_rate.fetched_at < self.ttl
+
+    def is_usable(self, cached_rate: CachedRate) -> bool:
+        """Check that rate can be served while it is revalidated.
+
+        Args:
+            cached_rate: Rate from the cache.
+
+        Returns:
+            True if rate is fresh or stale enough to be served.
+        """
+        return monotonic() - cached_rate.fetched_at < self.ttl + self.stale_ttl
+
+    def clear(self) -> None:
+        """Remove all cached rates."""
+        self._rates.clear()
+
+    def request_rates(
+        self,
+        base_currency: Currency,
+        currencies: Iterable[Currency],
+        fetch_rates: RatesFetcher,
+    ) -> 'asyncio.Task[dict[Currency, Decimal]]':
+        """Start rates fetching or join already started one.
+
+        Task is not bound to the service started it, so background
+        refresh can outlive the service.
+
+        Args:
+            base_currency: Base currency.
+            currencies: Target currencies.
+            fetch_rates: Function fetching rates and updating cache.
+
+        Returns:
+            Task resolved with fetched rates.
+        """
+        request_key = (base_currency, frozenset(currencies))
+        pending_rates = self._pending.get(request_key)
+        if pending_rates is not None:
+            return pending_rates
+
+        pending_rates = asyncio.create_task(
+            fetch_rates(base_currency, sorted(request_key[1])),
+        )
+        pending_rates.add_done_callback(
+            lambda task: self._finish_request(request_key, task),
+        )
+        self._pending[request_key] = pending_rates
+        return pending_rates
+
+    async def wait_pending(self) -> None:
+        """Wait for pending rates requests, ignoring their errors."""
+        await asyncio.gather(
+            *self._pending.values(),
+            return_exceptions=True,
+        )
+
+    def _finish_request(
+        self,
+        request_key: RatesRequest,
+        task: 'asyncio.Task[dict[Currency, Decimal]]',
+    ) -> None:
+        """Forget finished request.
+
+        Error of background refresh is retrieved, so it is not
+        reported as unhandled. Stale rate is refreshed next time.
+
+        Args:
+            request_key: Base and target currencies of request.
+            task: Finished fetching task.
+        """
+        self._pending.pop(request_key, None)
+        if not task.cancelled():
+            task.exception()
+
+
+class CurrenciesService(AClosing):  # noqa: WPS214
     """Currencies service.
 
     Provide functionality for access currencies info and convert prices.
@@ -19,25 +229,39 @@ class CurrenciesService(AClosing):
     See for reference https://apilayer.com/marketplace/fixer-api.
 
     Can reuse cached exchange rates for fast converting.
+    Expired rates are served while they are refreshed in background.
     """
 
-    def __init__(self, fixer_api_key: str) -> None:
+    def __init__(
+        self,
+        fixer_api_key: str,
+        rates_cache: Optional[RatesCache] = None,
+        session: Optional[ClientSession] = None,
+    ) -> None:
         """Initialize service.
 
-        Open session with api server and create dictionary for cached rates.
+        Open session with api server, if shared one is not provided,
+        and create cache for rates, if shared one is not provided.
 
         Args:
             fixer_api_key (str): FixerAPI key.
+            rates_cache: Exchange rates cache.
+            session: Shared session with FIXER_API_URL base url.
         """
-        self._session = ClientSession(
-            base_url='https://api.apilayer.com',
-            headers={'apikey': fixer_api_key},
-        )
-        self.last_rates: dict[tuple[Currency, Currency], Decimal] = {}
+        self._own_session = session is None
+        self._session = session or ClientSession(base_url=FIXER_API_URL)
+        self._headers = {'apikey': fixer_api_key}
+        self.rates_cache = rates_cache or RatesCache()
 
     async def aclose(self) -> None:
-        """Close session."""
-        await self._session.close()
+        """Close own session.
+
+        Background rates updates are awaited only before closing
+        own session. With shared session they outlive the service.
+        """
+        if self._own_session:
+            await self.rates_cache.wait_pending()
+            await self._session.close()
 
     async def get_exchange_rate(
         self,
@@ -55,27 +279,62 @@ class CurrenciesService(AClosing):
             use_cached: Try to get rate from cache instead of API call.
 
         Returns:
-            Converted price and used rate.
+            Exchange rate. None if cannot get rate.
         """
         if from_currency == to_currency:
             return Decimal(1)
 
-        async with self._session.get(
-            '/fixer/latest',
-            params={
-                'base': from_currency.value,
-                'symbols': to_currency.value,
-            },
-        ) as response:
-            response_data = await response.json()
-            self._raise_for_status(response, response_data)
+        if use_cached:
+            cached_rate = self._get_usable_rate(from_currency, to_currency)
+            if cached_rate is not None:
+                if not self.rates_cache.is_fresh(cached_rate):
+                    self._request_rates(from_currency, [to_currency])
 
-            rate = response_data.get('rates', {}).get(to_currency.value)
-            if rate is None:
-                return None
+                return cached_rate.rate
+
+        rates = await self._request_rates(from_currency, [to_currency])
+        return rates.get(to_currency)
+
+    async def get_exchange_rates(
+        self,
+        from_currencies: Iterable[Currency],
+        to_currency: Currency,
+        use_cached: bool,
+    ) -> dict[Currency, Decimal]:
+        """Get exchange rates from several currencies to the target one.
+
+        Rates missed in the cache are fetched with a single API call
+        as rates from the target currency and then inverted.
+
+        Args:
+            from_currencies: Base currencies.
+            to_currency: Target currency.
+            use_cached: Try to get rates from cache instead of API call.
+
+        Returns:
+            Exchange rates by base currencies. \
+            Rates that cannot be got are omitted.
+        """
+        cached_rates = self._get_cached_rates(
+            from_currencies,
+            to_currency,
+            use_cached,
+        )
+        if cached_rates.stale_currencies:
+            self._request_rates(to_currency, cached_rates.stale_currencies)
+
+        if cached_rates.missed_currencies:
+            inverse_rates = await self._request_rates(
+                to_currency,
+                cached_rates.missed_currencies,
+            )
+            cached_rates.rates.update({
+                currency: 1 / inverse_rate
+                for currency, inverse_rate in inverse_rates.items()
+                if inverse_rate
+            })
 
-            self._update_cached_rate(from_currency, to_currency, rate)
-            return Decimal(rate)
+        return cached_rates.rates
 
     async def convert_price(
         self,
@@ -105,6 +364,164 @@ class CurrenciesService(AClosing):
 
         return price * rate
 
+    async def convert_items(
+        self,
+        articles_items: list[ArticleItem],
+        to_currency: Currency,
+        use_cached: bool = True,
+    ) -> list[Optional[ArticleItem]]:
+        """Convert items prices with exchange rates.
+
+        All rates are got at once, so conversion costs
+        at most one API call regardless of items count.
+
+        Args:
+            articles_items: Items with prices in some currencies.
+            to_currency: Target currency.
+            use_cached: Try to get rates from cache instead of API call.
+
+        Returns:
+            Items with prices in target currency. \
+            None for items, which rate cannot be got.
+        """
+        rates = await self.get_exchange_rates(
+            (article_item.price_currency for article_item in articles_items),
+            to_currency,
+            use_cached,
+        )
+        converted_items: list[Optional[ArticleItem]] = []
+        for article_item in articles_items:
+            rate = rates.get(article_item.price_currency)
+            if rate is None:
+                converted_items.append(None)
+                continue
+
+            converted_items.append(article_item.model_copy(update={
+                'price_currency': to_currency,
+                'unit_price': article_item.unit_price * rate,
+            }))
+
+        return converted_items
+
+    def _get_cached_rates(
+        self,
+        from_currencies: Iterable[Currency],
+        to_currency: Currency,
+        use_cached: bool,
+    ) -> CachedRates:
+        """Split base currencies by state of their cached rates.
+
+        Args:
+            from_currencies: Base currencies.
+            to_currency: Target currency.
+            use_cached: Try to get rates from cache.
+
+        Returns:
+            Usable cached rates with stale and missed base currencies.
+        """
+        cached_rates = CachedRates()
+        currencies = set(from_currencies)
+        if to_currency in currencies:
+            currencies.remove(to_currency)
+            cached_rates.rates[to_currency] = Decimal(1)
+
+        if not use_cached:
+            cached_rates.missed_currencies = currencies
+            return cached_rates
+
+        for from_currency in currencies:
+            cached_rate = self._get_usable_rate(from_currency, to_currency)
+            if cached_rate is None:
+                cached_rates.missed_currencies.add(from_currency)
+                continue
+
+            cached_rates.rates[from_currency] = cached_rate.rate
+            if not self.rates_cache.is_fresh(cached_rate):
+                cached_rates.stale_currencies.add(from_currency)
+
+        return cached_rates
+
+    def _get_usable_rate(
+        self,
+        from_currency: Currency,
+        to_currency: Currency,
+    ) -> Optional[CachedRate]:
+        """Get cached rate if it can be served.
+
+        Args:
+            from_currency: Base currency.
+            to_currency: Target currency.
+
+        Returns:
+            Fresh or stale enough cached rate.
+        """
+        cached_rate = self.rates_cache.get(from_currency, to_currency)
+        if cached_rate is None or not self.rates_cache.is_usable(cached_rate):
+            return None
+
+        return cached_rate
+
+    def _request_rates(
+        self,
+        base_currency: Currency,
+        currencies: Iterable[Currency],
+    ) -> 'asyncio.Task[dict[Currency, Decimal]]':
+        """Start rates fetching or join already started one.
+
+        So concurrent requests of the same rates cost one API call,
+        even if they are made by different services.
+
+        Args:
+            base_currency: Base currency.
+            currencies: Target currencies.
+
+        Returns:
+            Task resolved with fetched rates.
+        """
+        return self.rates_cache.request_rates(
+            base_currency,
+            currencies,
+            self._fetch_rates,
+        )
+
+    async def _fetch_rates(
+        self,
+        base_currency: Currency,
+        currencies: list[Currency],
+    ) -> dict[Currency, Decimal]:
+        """Fetch exchange rates from base currency and update cache.
+
+        Args:
+            base_currency: Base currency.
+            currencies: Target currencies.
+
+        Returns:
+            Exchange rates provided by API.
+        """
+        async with self._session.get(
+            '/fixer/latest',
+            headers=self._headers,
+            params={
+                'base': base_currency.value,
+                'symbols': ','.join(currency.value for currency in currencies),
+            },
+        ) as response:
+            response_data = await response.json()
+            self._raise_for_status(response, response_data)
+
+        rates: dict[Currency, Decimal] = {}
+        for currency in currencies:
+            rate = response_data.get('rates', {}).get(currency.value)
+            if rate is not None:
+                rates[currency] = Decimal(rate)
+                self._update_cached_rate(
+                    base_currency,
+                    currency,
+                    rates[currency],
+                )
+
+        return rates
+
     def _update_cached_rate(
         self,
         from_currency: Currency,
@@ -118,7 +535,7 @@ class CurrenciesService(AClosing):
             to_currency: Target currency.
             rate: Exchange rate to save.
         """
-        self.last_rates[(from_currency, to_currency)] = rate
+        self.rates_cache.put(from_currency, to_currency, rate)
 
     def _raise_for_status(
         self,
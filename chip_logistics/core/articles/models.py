@@ -29,6 +29,19 @@ class ArticleInfo(BaseModel):
     duty_fee_ratio: Decimal = Field(default=1, ge=1)
 
 
+class ArticlesPage(BaseModel):
+    """Page of articles ordered by ids."""
+
+    # Page articles
+    articles: list[ArticleInfo]
+
+    # There are articles before the page
+    has_previous: bool
+
+    # There are articles after the page
+    has_next: bool
+
+
 class ArticleItem(BaseModel):
     """Data of one article item for price calculation."""
 
@@ -0,0 +1,70 @@
+"""Articles pagination.
+
+Pages are ordered by articles ids and addressed by cursors:
+id of the last article of the previous page
+or id of the first article of the next page.
+So, pages stay consistent, while articles are added or deleted.
+"""
+
+
+from bisect import bisect_left, bisect_right
+from typing import Mapping, Optional, Sequence
+
+from chip_logistics.core.articles.models import ArticleInfo, ArticlesPage
+from chip_logistics.core.articles.repo import ArticlesRepo
+
+
+async def get_articles_page(
+    repo: ArticlesRepo,
+    limit: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> ArticlesPage:
+    """Get page of articles ordered by ids.
+
+    Args:
+        repo: Articles storage.
+        limit: Max number of articles on the page.
+        after: Id of the last article of the previous page.
+        before: Id of the first article of the next page.
+
+    Returns:
+        Articles page. First page, if cursors are not specified.
+    """
+    return await repo.get_articles_page(limit, after=after, before=before)
+
+
+def slice_articles_page(
+    articles: Mapping[str, ArticleInfo],
+    sorted_ids: Sequence[str],
+    limit: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> ArticlesPage:
+    """Slice page from articles loaded in memory.
+
+    Args:
+        articles: Articles by ids.
+        sorted_ids: Sorted ids of the articles.
+        limit: Max number of articles on the page.
+        after: Id of the last article of the previous page.
+        before: Id of the first article of the next page.
+
+    Returns:
+        Articles page.
+    """
+    if after is None and before is not None:
+        stop = bisect_left(sorted_ids, before)
+        start = max(stop - limit, 0)
+    else:
+        start = 0 if after is None else bisect_right(sorted_ids, after)
+        stop = start + limit
+
+    return ArticlesPage(
+        articles=[
+            articles[article_id]
+            for article_id in sorted_ids[start:stop]
+        ],
+        has_previous=start > 0,
+        has_next=stop < len(sorted_ids),
+    )
@@ -1,17 +1,48 @@
 """Articles repository."""
 
 
-from typing import Optional, Protocol, runtime_checkable
-
-from chip_logistics.core.articles.models import ArticleInfo
+from typing import (
+    AsyncIterator,
+    Iterable,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
+
+from chip_logistics.core.articles.models import ArticleInfo, ArticlesPage
 from chip_logistics.utils.closing import AClosing
 
 
+class ArticlesNotSavedError(RuntimeError):
+    """Some of written articles are not saved by storage."""
+
+    def __init__(
+        self,
+        saved_articles: list[ArticleInfo],
+        failed_articles: list[ArticleInfo],
+    ) -> None:
+        """Initialize error with results of the write.
+
+        Args:
+            saved_articles: Created or updated articles.
+            failed_articles: Articles, which are not saved.
+        """
+        super().__init__(
+            '{count} articles are not saved'.format(
+                count=len(failed_articles),
+            ),
+        )
+        self.saved_articles = saved_articles
+        self.failed_articles = failed_articles
+
+
 @runtime_checkable
-class ArticlesRepo(AClosing, Protocol):
+class ArticlesRepo(AClosing, Protocol):  # noqa: WPS214
     """Interface of articles repository.
 
     Articles repository provide CRUD over articles info in database.
+
+    Catalog version is changed on each articles change.
     """
 
     async def put_article(self, article: ArticleInfo) -> ArticleInfo:
@@ -28,6 +59,22 @@ class ArticlesRepo(AClosing, Protocol):
             Created or updated article.
         """
 
+    async def put_articles(
+        self,
+        articles: Iterable[ArticleInfo],
+    ) -> list[ArticleInfo]:
+        """Add or update several articles in repository.
+
+        Articles are written by batches. If some of them are not
+        saved, `ArticlesNotSavedError` is raised after the write.
+
+        Args:
+            articles: Articles data.
+
+        Returns:
+            Created or updated articles.
+        """
+
     async def get_articles(self) -> list[ArticleInfo]:
         """Get list of all articles in repository.
 
@@ -35,6 +82,16 @@ class ArticlesRepo(AClosing, Protocol):
             Articles info.
         """
 
+    def iter_articles(self) -> AsyncIterator[ArticleInfo]:
+        """Iterate all articles in repository.
+
+        Articles are yielded as soon as they are loaded,
+        so processing can start before all articles are got.
+
+        Returns:
+            Async iterator over articles info.
+        """
+
     async def find_articles(
         self,
         query: Optional[str] = None,
@@ -53,6 +110,27 @@ class ArticlesRepo(AClosing, Protocol):
             List of found articles.
         """
 
+    async def get_articles_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> ArticlesPage:
+        """Get page of articles ordered by ids.
+
+        Only articles of the page are loaded, so large catalogs
+        are shown by pages without loading all articles.
+
+        Args:
+            limit: Max number of articles on the page.
+            after: Id of the last article of the previous page.
+            before: Id of the first article of the next page. \
+                Used, if `after` is not specified.
+
+        Returns:
+            Articles page. First page, if cursors are not specified.
+        """
+
     async def get_article(self, article_id: str) -> Optional[ArticleInfo]:
         """Get article from repository by id.
 
@@ -72,3 +150,38 @@ class ArticlesRepo(AClosing, Protocol):
         Returns:
             True if article deleted.
         """
+
+    async def delete_articles(self, article_ids: Iterable[str]) -> set[str]:
+        """Delete several articles from repository.
+
+        Articles are deleted concurrently.
+
+        Args:
+            article_ids: Ids of articles to delete.
+
+        Returns:
+            Ids of deleted articles.
+        """
+
+    async def discard_articles(
+        self,
+        article_ids: Iterable[str],
+    ) -> Optional[str]:
+        """Delete articles without checking that they exist.
+
+        Used when existing articles are already known,
+        so deletion does not wait for their lookup.
+
+        Args:
+            article_ids: Ids of existing articles.
+
+        Returns:
+            New catalog version. None if catalog is not versioned.
+        """
+
+    async def get_catalog_version(self) -> Optional[str]:
+        """Get version of articles catalog.
+
+        Returns:
+            Catalog version. None if catalog is not versioned.
+        """
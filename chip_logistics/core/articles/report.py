@@ -1,21 +1,35 @@
-"""CSV report generation."""
+"""CSV report generation.
+
+openpyxl is imported on report writing,
+so application starts without loading it.
+"""
 
 
 from datetime import datetime
 from decimal import Decimal
 from io import BytesIO
-from typing import Union
-
-from openpyxl import Workbook
-from openpyxl.styles import Font
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+from itertools import chain
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, Union
 
 from chip_logistics.core.articles.models import ArticleItem
 
+if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import (  # noqa: WPS436
+        WriteOnlyWorksheet,
+    )
+
 # Multiplier of content size to adjust column width
 COLUMN_WIDTH_RATIO = 1.3
 
+# Columns names of report
+REPORT_HEADER = (
+    'Клиент',
+    'Наименование',
+    'Количество',
+    'Общий вес',
+    'Цена (В долларах)',
+)
+
 
 def generate_report_name() -> str:
     """Generate report file name from current datetime.
@@ -42,78 +56,173 @@ def get_formatted_number(number: Union[float, Decimal]) -> str:
     return '{0:.1f}'.format(number)
 
 
-def add_header(sheet: Worksheet, columns_names: list[str]) -> None:
+class ColumnsWidth(object):
+    """Columns width calculated from content.
+
+    Width is updated incrementally with each row,
+    so cells do not have to be iterated again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self._contents_width: list[int] = []
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[Any]]) -> 'ColumnsWidth':
+        """Calculate columns width to fit all rows.
+
+        Args:
+            rows: Rows values.
+
+        Returns:
+            Columns width.
+        """
+        columns_width = cls()
+        for row in rows:
+            columns_width.update(row)
+
+        return columns_width
+
+    def update(self, row: Iterable[Any]) -> None:
+        """Extend columns to fit row values.
+
+        Args:
+            row: Row values.
+        """
+        for column, cell_value in enumerate(row):
+            content_width = len(str(cell_value))
+            if column == len(self._contents_width):
+                self._contents_width.append(content_width)
+            elif content_width > self._contents_width[column]:
+                self._contents_width[column] = content_width
+
+    def apply(self, sheet: 'WriteOnlyWorksheet') -> None:
+        """Set columns width of sheet.
+
+        Should be called before rows appending,
+        because write-only sheet saves columns at start.
+
+        Args:
+            sheet: Target worksheet.
+        """
+        from openpyxl.utils import get_column_letter  # noqa: WPS433
+
+        columns_width = enumerate(self._contents_width, start=1)
+        for column_num, content_width in columns_width:
+            column = sheet.column_dimensions[get_column_letter(column_num)]
+            column.width = content_width * COLUMN_WIDTH_RATIO
+
+
+def add_header(
+    sheet: 'WriteOnlyWorksheet',
+    columns_names: Iterable[str],
+) -> None:
     """Add header with bold columns names to sheet.
 
     Args:
         sheet: Target worksheet.
         columns_names: Names of columns in header.
     """
+    from openpyxl.cell import WriteOnlyCell  # noqa: WPS433
+    from openpyxl.styles import Font  # noqa: WPS433
+
     header_font = Font(bold=True)
-    for column, column_name in enumerate(columns_names):
-        cell = sheet.cell(1, column + 1, value=column_name)
+    header_cells = []
+    for column_name in columns_names:
+        cell = WriteOnlyCell(sheet, value=column_name)
         cell.font = header_font
+        header_cells.append(cell)
 
-
-def adjust_columns_width(sheet: Worksheet) -> None:
-    """Adjust columns width to content.
-
-    Args:
-        sheet: Worksheet to adjust.
-    """
-    for column_num, cells in enumerate(sheet.columns, start=1):
-        contents_width = (len(str(cell.value)) for cell in cells)
-        max_width = max(contents_width, default=0)
-        column = sheet.column_dimensions[get_column_letter(column_num)]
-        column.width = max_width * COLUMN_WIDTH_RATIO
+    sheet.append(header_cells)
 
 
-def create_calculations_report(
+def iter_items_rows(
     calculations_results: list[tuple[ArticleItem, Decimal]],
-    total_price: Decimal,
     customer_name: str,
-) -> tuple[bytes, str]:
-    """Generate Excel calculations report.
+) -> Iterator[list[Any]]:
+    """Generate report rows of calculated items.
 
     Args:
-        calculations_results: List with item sand their costs.
-        total_price: Total items price.
+        calculations_results: List with items and their costs.
         customer_name: Customer name.
 
     Returns:
-        File data and name.
+        Rows values iterator.
     """
-    workbook = Workbook()
-    sheet = workbook.active
-
-    add_header(
-        sheet,
+    return (
         [
-            'Клиент',
-            'Наименование',
-            'Количество',
-            'Общий вес',
-            'Цена (В долларах)',
-        ],
-    )
-
-    for article_item, price in calculations_results:
-        sheet.append([
             customer_name,
             article_item.name,
             article_item.count,
             article_item.unit_weight * article_item.count,
             get_formatted_number(price),
-        ])
+        ]
+        for article_item, price in calculations_results
+    )
+
+
+def write_calculations_report(
+    report_file: BinaryIO,
+    calculations_results: list[tuple[ArticleItem, Decimal]],
+    total_price: Decimal,
+    customer_name: str,
+) -> None:
+    """Write Excel calculations report to file.
+
+    Workbook is written in write-only mode, so rows are streamed
+    to the file instead of keeping cells of the whole sheet.
+
+    Args:
+        report_file: Binary file or buffer to write report.
+        calculations_results: List with items and their costs.
+        total_price: Total items price.
+        customer_name: Customer name.
+    """
+    from openpyxl import Workbook  # noqa: WPS433
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    total_rows: list[list[Any]] = [
+        [],
+        ['Общая стоимость (В долларах)', get_formatted_number(total_price)],
+    ]
+
+    ColumnsWidth.from_rows(chain(
+        [REPORT_HEADER],
+        iter_items_rows(calculations_results, customer_name),
+        total_rows,
+    )).apply(sheet)
+
+    add_header(sheet, REPORT_HEADER)
+    for item_row in iter_items_rows(calculations_results, customer_name):
+        sheet.append(item_row)
 
-    sheet.append([])
-    sheet.append([
-        'Общая стоимость (В долларах)',
-        get_formatted_number(total_price),
-    ])
+    for total_row in total_rows:
+        sheet.append(total_row)
 
-    adjust_columns_width(sheet)
+    workbook.save(report_file)
 
+
+def create_calculations_report(
+    calculations_results: list[tuple[ArticleItem, Decimal]],
+    total_price: Decimal,
+    customer_name: str,
+) -> tuple[memoryview, str]:
+    """Generate Excel calculations report.
+
+    Args:
+        calculations_results: List with item sand their costs.
+        total_price: Total items price.
+        customer_name: Customer name.
+
+    Returns:
+        File data view without copying and file name.
+    """
     file_buffer = BytesIO()
-    workbook.save(file_buffer)
-    return file_buffer.getvalue(), generate_report_name()
+    write_calculations_report(
+        file_buffer,
+        calculations_results,
+        total_price,
+        customer_name,
+    )
+    return file_buffer.getbuffer(), generate_report_name()
@@ -0,0 +1,68 @@
+"""Articles names search helpers.
+
+Names are normalized and split to n-grams, so storages can
+index articles by n-grams and answer name queries
+without scanning the whole catalog.
+"""
+
+
+# Length of indexed names substrings
+NGRAM_SIZE = 3
+
+
+def normalize_name(name: str) -> str:
+    """Normalize article name for search.
+
+    Name is case folded and whitespaces are collapsed to single spaces.
+
+    Args:
+        name: Article name or name query.
+
+    Returns:
+        Normalized name.
+    """
+    return ' '.join(name.casefold().split())
+
+
+def get_ngrams(normalized_name: str) -> set[str]:
+    """Get n-grams of normalized name.
+
+    Names shorter than NGRAM_SIZE have no n-grams.
+
+    Args:
+        normalized_name: Normalized article name or name query.
+
+    Returns:
+        Unique substrings of NGRAM_SIZE length.
+    """
+    return {
+        normalized_name[index:index + NGRAM_SIZE]
+        for index in range(len(normalized_name) - NGRAM_SIZE + 1)
+    }
+
+
+def is_indexed_query(normalized_query: str) -> bool:
+    """Check that query can be answered with n-grams index.
+
+    Args:
+        normalized_query: Normalized name query.
+
+    Returns:
+        True if query is not shorter than NGRAM_SIZE.
+    """
+    return len(normalized_query) >= NGRAM_SIZE
+
+
+def match_name(name: str, normalized_query: str) -> bool:
+    """Check that article name matches query.
+
+    Search is case and word position insensitive.
+
+    Args:
+        name: Article name.
+        normalized_query: Normalized name query.
+
+    Returns:
+        True if query is substring of normalized name.
+    """
+    return normalized_query in normalize_name(name)
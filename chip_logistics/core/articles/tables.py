@@ -0,0 +1,199 @@
+"""Articles tables import and export.
+
+Tables are CSV or XLSX files with header row.
+Columns are matched by header names, `id` column is optional.
+openpyxl is imported only for XLSX tables.
+"""
+
+
+import csv
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from io import TextIOWrapper
+from itertools import chain
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Sequence
+
+from chip_logistics.core.articles.models import ArticleInfo
+
+# Columns names of articles table
+ARTICLES_TABLE_HEADER = ('id', 'name', 'duty_fee_ratio')
+
+# Encoding of CSV tables. BOM is skipped, so tables from Excel are read.
+CSV_ENCODING = 'utf-8-sig'
+
+TableRow = Sequence[Any]
+
+
+class TableFormat(str, Enum):  # noqa: WPS600
+    """Supported articles tables formats."""
+
+    csv = 'csv'
+    xlsx = 'xlsx'
+
+
+class TableRowError(ValueError):
+    """Articles table row is invalid."""
+
+    def __init__(self, row_number: int) -> None:
+        """Initialize error with row number.
+
+        Args:
+            row_number: Number of invalid row counting from 1.
+        """
+        super().__init__(
+            'Invalid article in row {row_number}'.format(
+                row_number=row_number,
+            ),
+        )
+        self.row_number = row_number
+
+
+def read_articles_table(
+    table_file: BinaryIO,
+    table_format: TableFormat,
+) -> list[ArticleInfo]:
+    """Read articles from table.
+
+    Articles without id get None id. Empty rows are skipped.
+    TableRowError is raised for rows with invalid articles.
+
+    Args:
+        table_file: Table file opened in binary mode.
+        table_format: Table format.
+
+    Returns:
+        Articles from table rows.
+    """
+    rows = _iter_table_rows(table_file, table_format)
+    header = [str(column_name).strip() for column_name in next(rows, ())]
+    rows_articles = [
+        _parse_row(header, row, row_number)
+        for row_number, row in enumerate(rows, start=2)
+    ]
+    return [article for article in rows_articles if article is not None]
+
+
+def write_articles_table(
+    table_file: BinaryIO,
+    articles: Iterable[ArticleInfo],
+    table_format: TableFormat,
+) -> None:
+    """Write articles to table.
+
+    Args:
+        table_file: Table file opened in binary mode.
+        articles: Articles to write.
+        table_format: Table format.
+    """
+    rows = chain(
+        [ARTICLES_TABLE_HEADER],
+        (
+            (article.id, article.name, article.duty_fee_ratio)
+            for article in articles
+        ),
+    )
+    if table_format == TableFormat.csv:
+        text_file = TextIOWrapper(
+            table_file,
+            encoding=CSV_ENCODING,
+            newline='',
+        )
+        csv.writer(text_file).writerows(rows)
+        text_file.flush()
+        text_file.detach()
+        return
+
+    from openpyxl import Workbook  # noqa: WPS433
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+
+    workbook.save(table_file)
+
+
+def _iter_table_rows(
+    table_file: BinaryIO,
+    table_format: TableFormat,
+) -> Iterator[TableRow]:
+    """Iterate table rows including header.
+
+    Args:
+        table_file: Table file opened in binary mode.
+        table_format: Table format.
+
+    Yields:
+        Rows values.
+    """
+    if table_format == TableFormat.csv:
+        text_file = TextIOWrapper(
+            table_file,
+            encoding=CSV_ENCODING,
+            newline='',
+        )
+        yield from csv.reader(text_file)
+        text_file.detach()
+        return
+
+    from openpyxl import load_workbook  # noqa: WPS433
+
+    workbook = load_workbook(table_file, read_only=True, data_only=True)
+    yield from workbook.active.iter_rows(values_only=True)
+    workbook.close()
+
+
+def _parse_row(
+    header: list[str],
+    row: TableRow,
+    row_number: int,
+) -> Optional[ArticleInfo]:
+    """Parse article from table row.
+
+    Args:
+        header: Columns names.
+        row: Row values.
+        row_number: Number of row counting from 1.
+
+    Returns:
+        Article info. None if row is empty.
+
+    Raises:
+        TableRowError: If row contains invalid article.
+    """
+    row_data = {
+        column_name: '' if row_value is None else str(row_value).strip()
+        for column_name, row_value in zip(header, row)
+        if column_name in ARTICLES_TABLE_HEADER
+    }
+    if not any(row_data.values()):
+        return None
+
+    try:
+        return _parse_article(row_data)
+    except (ValueError, InvalidOperation) as error:
+        raise TableRowError(row_number) from error
+
+
+def _parse_article(row_data: dict[str, str]) -> ArticleInfo:
+    """Parse article from row values by columns names.
+
+    Args:
+        row_data: Stripped row values by columns names.
+
+    Returns:
+        Article info.
+
+    Raises:
+        ValueError: If article name is empty.
+    """
+    name = row_data.get('name')
+    if not name:
+        raise ValueError('Article name is empty')
+
+    duty_fee_ratio = row_data.get('duty_fee_ratio') or '1'
+    return ArticleInfo(
+        id=row_data.get('id') or None,
+        name=name,
+        duty_fee_ratio=Decimal(duty_fee_ratio.replace(',', '.')),
+    )
@@ -1,7 +1,8 @@
 """AmoCRMRepo implementation based on Deta Base."""
 
 
-from typing import Any
+from secrets import token_hex
+from typing import Any, Optional
 
 from deta import Deta
 
@@ -40,14 +41,33 @@ class DetaAmoCRMRepo(AmoCRMRepo):
 
         Client id field is used as key to achieve idempotency of get operation.
 
+        New random version is assigned to credentials,
+        so other processes can detect that they are changed.
+
         Args:
             credentials: AmoCRM integration credentials.
         """
+        credentials.version = token_hex(8)
         await self._base.put(
             data=credentials.model_dump(),
             key=credentials.client_id,
         )
 
+    async def get_credentials_version(self, client_id: str) -> Optional[str]:
+        """Get version of credentials from the `amocrm` base.
+
+        Args:
+            client_id: AmoCRM integration id.
+
+        Returns:
+            Credentials version. None if credentials are not found.
+        """
+        credentials_item = await self._base.get(client_id)
+        if credentials_item is None:
+            return None
+
+        return credentials_item.get('version')  # type: ignore
+
     async def aclose(self) -> None:
         """Close Deta Base connection."""
         await self._base.close()
@@ -0,0 +1,190 @@
+"""Articles names index based on Deta Base."""
+
+
+import asyncio
+from secrets import token_hex
+from typing import Any, Iterable, Sequence
+
+from deta import Deta
+
+from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.search import get_ngrams, normalize_name
+from chip_logistics.deta.fetch import iter_records
+from chip_logistics.utils.concurrency import gather_limited
+
+# Max number of items in one `put_many` call, limited by Deta
+PUT_MANY_LIMIT = 25
+
+# Max number of simultaneous requests of bulk operations
+REQUESTS_CONCURRENCY = 10
+
+# Max number of articles indexed by one batch of index records
+INDEX_BATCH_SIZE = 1000
+
+# Separator of n-gram and batch id in index keys
+KEY_SEPARATOR = ':'
+
+IndexRecord = dict[str, Any]
+
+
+class DetaArticlesIndex(object):
+    """Index of articles names n-grams.
+
+    Index is stored in the `articles_index` base. Articles are indexed
+    by batches: for each n-gram of batch articles names there is
+    a record with `{ngram}:{batch_id}` key and ids of articles,
+    so ids of articles containing n-gram are fetched
+    with key prefix query.
+
+    Records are only added on writes, so writes cost depends on
+    the number of distinct n-grams of written names. Ids of renamed
+    and deleted articles are left until `rebuild`, so found ids
+    should be checked against articles names.
+    """
+
+    def __init__(self, deta: Deta) -> None:
+        """Connect index base.
+
+        Args:
+            deta: Deta API.
+        """
+        self._base = deta.AsyncBase('articles_index')
+
+    async def add_articles(self, articles: Sequence[ArticleInfo]) -> None:
+        """Index new or updated articles.
+
+        Args:
+            articles: Saved articles with ids.
+        """
+        await self._put_records(_get_index_records(articles))
+
+    async def find_ids(self, normalized_query: str) -> set[str]:
+        """Find ids of articles, which names can contain query.
+
+        Ids of all query n-grams are fetched concurrently.
+
+        Args:
+            normalized_query: Normalized name query \
+                not shorter than n-gram.
+
+        Returns:
+            Ids of articles indexed by all query n-grams.
+        """
+        ngrams_ids = await asyncio.gather(*(
+            self._fetch_ngram_ids(ngram)
+            for ngram in get_ngrams(normalized_query)
+        ))
+        return set.intersection(*ngrams_ids)
+
+    async def rebuild(self, articles: Sequence[ArticleInfo]) -> None:
+        """Index all articles and delete previous index records.
+
+        Used to index articles created before the index
+        and to remove ids of renamed and deleted articles.
+
+        Args:
+            articles: All articles.
+        """
+        previous_keys = [
+            record['key'] async for record in iter_records(self._base)
+        ]
+        await self._put_records(_get_index_records(articles))
+        await gather_limited(
+            (self._base.delete(key) for key in previous_keys),
+            REQUESTS_CONCURRENCY,
+        )
+
+    async def aclose(self) -> None:
+        """Close index base."""
+        await self._base.close()
+
+    async def _fetch_ngram_ids(self, ngram: str) -> set[str]:
+        """Fetch ids of articles indexed by n-gram.
+
+        Args:
+            ngram: Name n-gram.
+
+        Returns:
+            Articles ids.
+        """
+        key_prefix = '{ngram}{separator}'.format(
+            ngram=ngram,
+            separator=KEY_SEPARATOR,
+        )
+        ngram_ids: set[str] = set()
+        async for record in iter_records(self._base, {'key?pfx': key_prefix}):
+            ngram_ids.update(record['ids'])
+
+        return ngram_ids
+
+    async def _put_records(self, records: list[IndexRecord]) -> None:
+        """Save index records by chunks concurrently.
+
+        Args:
+            records: Index records.
+        """
+        await gather_limited(
+            (
+                self._base.put_many(records[index:index + PUT_MANY_LIMIT])
+                for index in range(0, len(records), PUT_MANY_LIMIT)
+            ),
+            REQUESTS_CONCURRENCY,
+        )
+
+
+def _get_index_records(articles: Sequence[ArticleInfo]) -> list[IndexRecord]:
+    """Get index records of articles by batches.
+
+    Args:
+        articles: Articles with ids.
+
+    Returns:
+        Record for each n-gram of each batch.
+    """
+    return [
+        record
+        for index in range(0, len(articles), INDEX_BATCH_SIZE)
+        for record in _get_batch_records(
+            articles[index:index + INDEX_BATCH_SIZE],
+        )
+    ]
+
+
+def _get_batch_records(articles: Iterable[ArticleInfo]) -> list[IndexRecord]:
+    """Get index records of articles batch.
+
+    Args:
+        articles: Articles with ids.
+
+    Returns:
+        Record with articles ids for each n-gram of their names.
+    """
+    batch_id = token_hex(8)
+    return [
+        {
+            'key': '{ngram}{separator}{batch_id}'.format(
+                ngram=ngram,
+                separator=KEY_SEPARATOR,
+                batch_id=batch_id,
+            ),
+            'ids': article_ids,
+        }
+        for ngram, article_ids in sorted(_group_ids(articles).items())
+    ]
+
+
+def _group_ids(articles: Iterable[ArticleInfo]) -> dict[str, list[str]]:
+    """Group articles ids by names n-grams.
+
+    Args:
+        articles: Articles with ids.
+
+    Returns:
+        Ids of articles containing n-gram by n-grams.
+    """
+    ngrams_ids: dict[str, list[str]] = {}
+    for article in articles:
+        for ngram in get_ngrams(normalize_name(article.name)):
+            ngrams_ids.setdefault(ngram, []).append(str(article.id))
+
+    return ngrams_ids
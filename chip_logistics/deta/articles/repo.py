@@ -1,21 +1,44 @@
 """ArticlesRepo based on Deta Base."""
 
 
-from secrets import choice
+import asyncio
+from secrets import choice, token_hex
 from string import ascii_letters, digits
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional
 
 from deta import Deta
 
-from chip_logistics.core.articles.models import ArticleInfo
-from chip_logistics.core.articles.repo import ArticlesRepo
+from chip_logistics.core.articles.models import ArticleInfo, ArticlesPage
+from chip_logistics.core.articles.repo import (
+    ArticlesNotSavedError,
+    ArticlesRepo,
+)
+from chip_logistics.core.articles.search import (
+    is_indexed_query,
+    match_name,
+    normalize_name,
+)
+from chip_logistics.deta.articles.index import (
+    PUT_MANY_LIMIT,
+    REQUESTS_CONCURRENCY,
+    DetaArticlesIndex,
+)
+from chip_logistics.deta.fetch import fetch_records, iter_records
 from chip_logistics.deta.models import model_dump
+from chip_logistics.utils.concurrency import gather_limited
 
+# Key of catalog metadata record
+CATALOG_KEY = 'catalog'
 
-class DetaArticlesRepo(ArticlesRepo):
+
+class DetaArticlesRepo(ArticlesRepo):  # noqa: WPS214
     """ArticlesRepobased on Deta Base.
 
     Articles are stored in the `articles` base.
+
+    Articles names are indexed in the `articles_index` base.
+
+    Catalog version is stored in the `articles_meta` base.
     """
 
     def __init__(self, deta: Deta) -> None:
@@ -26,6 +49,8 @@ class DetaArticlesRepo(ArticlesRepo):
         """
         super().__init__()
         self._base = deta.AsyncBase('articles')
+        self._meta_base = deta.AsyncBase('articles_meta')
+        self._index = DetaArticlesIndex(deta)
 
     async def put_article(self, article: ArticleInfo) -> ArticleInfo:
         """Add article to base.
@@ -39,16 +64,46 @@ class DetaArticlesRepo(ArticlesRepo):
 
         Returns:
             Created or updated article.
+            `ArticlesNotSavedError` is raised, if it is not saved.
         """
-        if article.id is None:
-            article = ArticleInfo(**article.model_dump())
-            article.id = _generate_id()
+        saved_articles = await self.put_articles([article])
+        return saved_articles[0]
 
-        article_data = await self._base.put(
-            data=model_dump(article),
-            key=article.id,
-        )
-        return ArticleInfo(**article_data)
+    async def put_articles(
+        self,
+        articles: Iterable[ArticleInfo],
+    ) -> list[ArticleInfo]:
+        """Add or update several articles in base.
+
+        Articles are put by chunks of PUT_MANY_LIMIT concurrently,
+        existing articles are not requested before writing.
+        Names index is updated at the same time. Catalog version
+        is changed even if some articles are not saved.
+
+        Args:
+            articles: Articles data.
+
+        Returns:
+            Created or updated articles.
+
+        Raises:
+            ArticlesNotSavedError: If Deta failed to save some articles.
+        """
+        articles_with_ids = _assign_ids(articles)
+        if not articles_with_ids:
+            return []
+
+        try:
+            saved_articles, _ = await asyncio.gather(
+                self._put_many(articles_with_ids),
+                self._index.add_articles(articles_with_ids),
+            )
+        except ArticlesNotSavedError:
+            await self._update_catalog_version()
+            raise
+
+        await self._update_catalog_version()
+        return saved_articles
 
     async def get_articles(self) -> list[ArticleInfo]:
         """Get list of all articles in base.
@@ -56,11 +111,18 @@ class DetaArticlesRepo(ArticlesRepo):
         Returns:
             Articles info.
         """
-        articles_result = await self._base.fetch()
-        return [
-            ArticleInfo(**article_data)
-            for article_data in articles_result.items
-        ]
+        return [article async for article in self.iter_articles()]
+
+    async def iter_articles(self) -> AsyncIterator[ArticleInfo]:
+        """Iterate all articles in base page by page.
+
+        Next page is requested while current one is processed.
+
+        Yields:
+            Articles info.
+        """
+        async for article_data in iter_records(self._base):
+            yield ArticleInfo(**article_data)
 
     async def find_articles(
         self,
@@ -73,21 +135,73 @@ class DetaArticlesRepo(ArticlesRepo):
         So, for names ['fOo', 'Bar', 'bar foo'] query
         'foo' would find ['fOo', 'bar foo'].
 
+        Ids of articles are found with names index,
+        then only found articles are got. Queries shorter
+        than indexed n-grams are answered by scanning all articles.
+
         Args:
             query: Name query. If None, all articles returned.
 
         Returns:
-            List of found articles.
+            List of found articles ordered by ids.
         """
-        articles = await self.get_articles()
         if query is None:
-            return articles
-
+            return await self.get_articles()
+
+        normalized_query = normalize_name(query)
+        if not is_indexed_query(normalized_query):
+            return [
+                article
+                async for article in self.iter_articles()
+                if match_name(article.name, normalized_query)
+            ]
+
+        found_ids = await self._index.find_ids(normalized_query)
+        found_articles = await gather_limited(
+            (self.get_article(article_id) for article_id in sorted(found_ids)),
+            REQUESTS_CONCURRENCY,
+        )
+        # Index can contain ids of deleted and renamed articles
         return [
-            article for article in articles
-            if query.lower() in article.name.lower()
+            article
+            for article in filter(None, found_articles)
+            if match_name(article.name, normalized_query)
         ]
 
+    async def get_articles_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> ArticlesPage:
+        """Get page of articles ordered by ids.
+
+        Pages after the cursor are fetched by keys, so only
+        the page records are loaded. Deta Base fetches records in
+        ascending order only, so pages before the cursor are scanned.
+
+        Args:
+            limit: Max number of articles on the page.
+            after: Id of the last article of the previous page.
+            before: Id of the first article of the next page.
+
+        Returns:
+            Articles page. First page, if cursors are not specified.
+        """
+        if after is None and before is not None:
+            return await self._get_page_before(limit, before)
+
+        # One more record is fetched to check that next page exists
+        articles_data = await fetch_records(self._base, limit + 1, last=after)
+        return ArticlesPage(
+            articles=[
+                ArticleInfo(**article_data)
+                for article_data in articles_data[:limit]
+            ],
+            has_previous=after is not None,
+            has_next=len(articles_data) > limit,
+        )
+
     async def get_article(self, article_id: str) -> Optional[ArticleInfo]:
         """Get article from base by id.
 
@@ -106,19 +220,177 @@ class DetaArticlesRepo(ArticlesRepo):
     async def delete_article(self, article_id: str) -> bool:
         """Delete article from base.
 
+        Article is got before deletion to report whether it existed.
+        Use `discard_articles` to delete known article without lookup.
+
         Args:
             article_id: Id of article to delete.
 
         Returns:
             True if article deleted.
         """
-        article = await self.get_article(article_id)
-        await self._base.delete(article_id)
-        return article is not None
+        return article_id in await self.delete_articles([article_id])
+
+    async def delete_articles(self, article_ids: Iterable[str]) -> set[str]:
+        """Delete several articles from base.
+
+        Deta Base delete does not report whether key existed,
+        so articles are got first. Then found articles are discarded.
+
+        Args:
+            article_ids: Ids of articles to delete.
+
+        Returns:
+            Ids of deleted articles.
+        """
+        unique_ids = list(set(article_ids))
+        found_articles = await gather_limited(
+            (self.get_article(article_id) for article_id in unique_ids),
+            REQUESTS_CONCURRENCY,
+        )
+        deleted_ids = {
+            article_id
+            for article_id, article in zip(unique_ids, found_articles)
+            if article is not None
+        }
+        if deleted_ids:
+            await self.discard_articles(deleted_ids)
+
+        return deleted_ids
+
+    async def discard_articles(
+        self,
+        article_ids: Iterable[str],
+    ) -> Optional[str]:
+        """Delete articles without checking that they exist.
+
+        Articles are deleted and catalog version is updated concurrently.
+
+        Args:
+            article_ids: Ids of existing articles.
+
+        Returns:
+            New catalog version.
+        """
+        version_update = asyncio.ensure_future(self._update_catalog_version())
+        await asyncio.gather(
+            gather_limited(
+                (self._base.delete(article_id) for article_id in article_ids),
+                REQUESTS_CONCURRENCY,
+            ),
+            version_update,
+        )
+        return version_update.result()
+
+    async def get_catalog_version(self) -> Optional[str]:
+        """Get catalog version from the `articles_meta` base.
+
+        Returns:
+            Catalog version. None if articles were not changed yet.
+        """
+        catalog_data = await self._meta_base.get(CATALOG_KEY)
+        if catalog_data is None:
+            return None
+
+        return str(catalog_data['version'])
+
+    async def rebuild_index(self) -> None:
+        """Index all articles and remove obsolete index records."""
+        await self._index.rebuild(await self.get_articles())
 
     async def aclose(self) -> None:
-        """Close base and clean resources."""
+        """Close bases and clean resources."""
         await self._base.close()
+        await self._meta_base.close()
+        await self._index.aclose()
+
+    async def _get_page_before(
+        self,
+        limit: int,
+        before: str,
+    ) -> ArticlesPage:
+        """Get page of articles preceding the cursor.
+
+        Args:
+            limit: Max number of articles on the page.
+            before: Id of the first article of the next page.
+
+        Returns:
+            Articles page.
+        """
+        # One more record is kept to check that previous page exists
+        articles_data = []
+        async for record in iter_records(self._base):
+            if record['key'] >= before:
+                break
+
+            articles_data.append(record)
+            if len(articles_data) > limit + 1:
+                articles_data.pop(0)
+
+        has_previous = len(articles_data) > limit
+        if has_previous:
+            articles_data.pop(0)
+
+        return ArticlesPage(
+            articles=[
+                ArticleInfo(**article_data)
+                for article_data in articles_data
+            ],
+            has_previous=has_previous,
+            has_next=True,
+        )
+
+    async def _put_many(
+        self,
+        articles: list[ArticleInfo],
+    ) -> list[ArticleInfo]:
+        """Put articles by chunks concurrently.
+
+        Args:
+            articles: Articles data with ids.
+
+        Returns:
+            Saved articles.
+
+        Raises:
+            ArticlesNotSavedError: If Deta reported failed articles.
+        """
+        records = [
+            {**model_dump(article), 'key': article.id}
+            for article in articles
+        ]
+        put_results = await gather_limited(
+            (
+                self._base.put_many(records[index:index + PUT_MANY_LIMIT])
+                for index in range(0, len(records), PUT_MANY_LIMIT)
+            ),
+            REQUESTS_CONCURRENCY,
+        )
+        saved_articles = [
+            ArticleInfo(**article_data)
+            for put_result in put_results
+            for article_data in put_result['processed']['items']
+        ]
+        failed_articles = [
+            ArticleInfo(**article_data)
+            for put_result in put_results
+            for article_data in put_result.get('failed', {}).get('items', [])
+        ]
+        if failed_articles:
+            raise ArticlesNotSavedError(saved_articles, failed_articles)
+
+        return saved_articles
+
+    async def _update_catalog_version(self) -> str:
+        """Assign new random version to the catalog.
+
+        Returns:
+            New catalog version.
+        """
+        version = token_hex(8)
+        await self._meta_base.put(data={'version': version}, key=CATALOG_KEY)
+        return version
 
 
 def _generate_id() -> str:
@@ -130,3 +402,24 @@ def _generate_id() -> str:
     length = 12
     alphabet = ascii_letters + digits
     return ''.join(choice(alphabet) for _ in range(length))
+
+
+def _assign_ids(articles: Iterable[ArticleInfo]) -> list[ArticleInfo]:
+    """Copy articles with generated ids instead of missed ones.
+
+    Articles with same ids are deduplicated, last one is kept.
+
+    Args:
+        articles: Articles data.
+
+    Returns:
+        Articles with ids.
+    """
+    articles_by_ids = {}
+    for article in articles:
+        article_id = article.id or _generate_id()
+        articles_by_ids[article_id] = article.model_copy(
+            update={'id': article_id},
+        )
+
+    return list(articles_by_ids.values())
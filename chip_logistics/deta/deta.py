@@ -1,7 +1,83 @@
 """Deta API instance factory."""
 
+from functools import partial
+from inspect import iscoroutinefunction
+from typing import Any, Awaitable, Callable, Optional
+
 from deta import Deta
 
+from chip_logistics.utils.outbound import track_outbound_call
+
+# Service name of Deta Base outbound calls. SDK sessions are not traced,
+# so calls are named by API host like traced HTTP requests.
+DETA_SERVICE = 'database.deta.sh'
+
+
+class TrackedAsyncBase(object):
+    """Deta Base proxy, which measures requests as outbound calls."""
+
+    def __init__(self, base: Any) -> None:
+        """Wrap base.
+
+        Args:
+            base: Deta Base client.
+        """
+        self._base = base
+
+    def __getattr__(self, name: str) -> Any:
+        """Get base attribute. Requests methods are measured.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            Attribute of wrapped base.
+        """
+        base_attr = getattr(self._base, name)
+        if name == 'close' or not iscoroutinefunction(base_attr):
+            return base_attr
+
+        return partial(_track_request, base_attr)
+
+
+class TrackedDeta(object):
+    """Deta API proxy, which bases measure requests."""
+
+    def __init__(self, deta: Deta) -> None:
+        """Wrap Deta API.
+
+        Args:
+            deta: Deta API.
+        """
+        self._deta = deta
+
+    def __getattr__(self, name: str) -> Any:
+        """Get Deta API attribute.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            Attribute of wrapped Deta API.
+        """
+        return getattr(self._deta, name)
+
+    def AsyncBase(  # noqa: N802
+        self,
+        name: str,
+        host: Optional[str] = None,
+    ) -> Any:
+        """Open async Deta Base client.
+
+        Args:
+            name: Base name.
+            host: Deta Base API host. Default one is used if None.
+
+        Returns:
+            Tracked base client.
+        """
+        return TrackedAsyncBase(self._deta.AsyncBase(name, host=host))
+
 
 async def get_deta() -> Deta:
     """Get Deta API instance.
@@ -9,4 +85,23 @@ async def get_deta() -> Deta:
     Returns:
         Deta API for current runtime.
     """
-    return Deta()
+    return TrackedDeta(Deta())
+
+
+async def _track_request(
+    request: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Make Deta Base request as outbound call.
+
+    Args:
+        request: Base request method.
+        args: Request positional arguments.
+        kwargs: Request keyword arguments.
+
+    Returns:
+        Request result.
+    """
+    async with track_outbound_call(DETA_SERVICE):
+        return await request(*args, **kwargs)
@@ -0,0 +1,107 @@
+"""Paginated fetching from Deta Base."""
+
+
+import asyncio
+from contextlib import ExitStack
+from typing import Any, AsyncIterator, Optional, Protocol, Union
+
+# Deta Base record
+Record = dict[str, Any]
+
+# Fields conditions joined by AND
+Conditions = dict[str, Any]
+
+# Deta Base query: conditions or list of them joined by OR
+DetaQuery = Union[Conditions, list[Conditions]]
+
+
+class FetchResponse(Protocol):
+    """Page of Deta Base fetch results."""
+
+    # Key of the last record, if there are more pages
+    last: Optional[str]
+
+    # Page records
+    items: list[Record]  # noqa: WPS110
+
+
+class FetchingBase(Protocol):
+    """Deta Base supporting paginated fetch."""
+
+    async def fetch(
+        self,
+        query: Optional[DetaQuery] = None,
+        limit: int = 1000,
+        last: Optional[str] = None,
+    ) -> FetchResponse:
+        """Fetch page of records matching query.
+
+        Args:
+            query: Records query.
+            limit: Max page size.
+            last: Key of the last record of previous page.
+        """
+
+
+async def fetch_records(
+    base: FetchingBase,
+    limit: int,
+    last: Optional[str] = None,
+) -> list[Record]:
+    """Fetch records following the key.
+
+    Deta Base can return less records than requested,
+    so more pages are fetched until limit is reached.
+
+    Args:
+        base: Deta Base.
+        limit: Max number of records.
+        last: Key of the record before the first fetched one.
+
+    Returns:
+        Records ordered by keys.
+    """
+    records: list[Record] = []
+    while len(records) < limit:
+        page = await base.fetch(limit=limit - len(records), last=last)
+        records.extend(page.items)
+        if page.last is None:
+            break
+
+        last = page.last
+
+    return records
+
+
+async def iter_records(
+    base: FetchingBase,
+    query: Optional[DetaQuery] = None,
+) -> AsyncIterator[Record]:
+    """Iterate all records matching query page by page.
+
+    Next page is requested before records of current one are yielded,
+    so network round trip overlaps with records processing.
+    Pending request is cancelled, if iteration is stopped.
+
+    Args:
+        base: Deta Base.
+        query: Records query. All records by default.
+
+    Yields:
+        Matched records ordered by keys.
+    """
+    with ExitStack() as pending_pages:
+        first_page = asyncio.ensure_future(base.fetch(query))
+        pending_pages.callback(first_page.cancel)
+        next_page: Optional['asyncio.Future[FetchResponse]'] = first_page
+        while next_page is not None:
+            page = await next_page
+            next_page = None
+            if page.last is not None:
+                next_page = asyncio.ensure_future(
+                    base.fetch(query, last=page.last),
+                )
+                pending_pages.callback(next_page.cancel)
+
+            for record in page.items:
+                yield record
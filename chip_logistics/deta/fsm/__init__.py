@@ -0,0 +1 @@
+"""Implementations of FSM related interfaces."""
@@ -0,0 +1,92 @@
+"""FSMRecordsRepo implementation based on Deta Base."""
+
+
+from typing import Any, Optional
+
+import pydantic_core
+from deta import Deta
+
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.bot.fsm.repo import FSMRecordsRepo
+
+
+class DetaFSMRecordsRepo(FSMRecordsRepo):
+    """FSM records repository based on Deta Base.
+
+    Changes of existing records are written by one update request
+    with changed fields and appended values only.
+    """
+
+    def __init__(self, deta: Deta) -> None:
+        """Initialize repo and connect deta base.
+
+        Args:
+            deta: Deta API instance.
+        """
+        super().__init__()
+
+        self._base = deta.AsyncBase('fsm')
+
+    async def get_record(self, key: str) -> Optional[FSMRecord]:
+        """Get FSM record from the `fsm` base.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Found record or None.
+        """
+        record_item = await self._base.get(key)
+        if record_item is None:
+            return None
+
+        return FSMRecord.model_validate(record_item)
+
+    async def apply_changes(self, key: str, changes: FSMRecordChanges) -> None:
+        """Write FSM record changes to the `fsm` base.
+
+        New and replaced records are put entirely.
+
+        Args:
+            key: Record key.
+            changes: Record changes.
+        """
+        if changes.is_new or changes.is_replaced:
+            await self._base.put(
+                data=changes.record.model_dump(mode='json'),
+                key=key,
+            )
+            return
+
+        await self._base.update(self._get_updates(changes), key=key)
+
+    async def aclose(self) -> None:
+        """Close Deta Base connection."""
+        await self._base.close()
+
+    def _get_updates(self, changes: FSMRecordChanges) -> dict[str, Any]:
+        """Get update request of record fields.
+
+        Args:
+            changes: Record changes.
+
+        Returns:
+            Updates of record fields by their paths.
+        """
+        updates: dict[str, Any] = {}
+        if changes.is_state_changed:
+            updates['state'] = changes.record.state
+
+        for field, field_value in changes.fields.items():
+            updates['data.{field}'.format(field=field)] = (
+                pydantic_core.to_jsonable_python(field_value)
+            )
+
+        for list_field, appended_values in changes.appends.items():
+            updates['data.{field}'.format(field=list_field)] = (
+                self._base.util.append(
+                    pydantic_core.to_jsonable_python(appended_values),
+                )
+            )
+
+        return updates
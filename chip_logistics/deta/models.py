@@ -1,7 +1,6 @@
 """Utilities ofr working with pydantic models."""
 
 
-import json
 from typing import Any
 
 from pydantic import BaseModel
@@ -10,10 +9,13 @@ from pydantic import BaseModel
 def model_dump(model: BaseModel) -> dict[str, Any]:
     """Dump model to suitable format for deta requests.
 
+    Model is dumped in JSON mode, so values like decimals
+    are converted without JSON string round trip.
+
     Args:
         model: Pydantic model object.
 
     Returns:
         JSON-serializable dict for deta requests.
     """
-    return json.loads(model.model_dump_json())  # type: ignore
+    return model.model_dump(mode='json')
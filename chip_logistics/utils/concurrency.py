@@ -0,0 +1,33 @@
+"""Concurrent execution helpers."""
+
+
+import asyncio
+from typing import Awaitable, Iterable, TypeVar
+
+ResultT = TypeVar('ResultT')
+
+
+async def gather_limited(
+    awaitables: Iterable[Awaitable[ResultT]],
+    limit: int,
+) -> list[ResultT]:
+    """Run awaitables concurrently with limited parallelism.
+
+    Args:
+        awaitables: Awaitables to run. Iterated at once.
+        limit: Max number of simultaneously running awaitables.
+
+    Returns:
+        Results in order of awaitables.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_limited(  # noqa: WPS430
+        awaitable: Awaitable[ResultT],
+    ) -> ResultT:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(
+        run_limited(awaitable) for awaitable in awaitables
+    ))
@@ -0,0 +1,112 @@
+"""Lazy initialized resources."""
+
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from chip_logistics.utils.closing import AClosing
+
+ResourceT = TypeVar('ResourceT')
+
+# Function returning context manager of resource
+ResourceFactory = Callable[[], AsyncContextManager[Any]]
+
+# Lazy services by names
+LazyServicesMap = dict[str, 'Lazy[Any]']
+
+
+class Lazy(AClosing, Generic[ResourceT]):
+    """Resource provider, that opens resource on first access.
+
+    Resource is opened once and closed with the provider.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], AsyncContextManager[ResourceT]],
+    ) -> None:
+        """Initialize provider without opening resource.
+
+        Args:
+            factory: Function returning context manager of resource.
+        """
+        self._factory = factory
+        self._resource: Optional[ResourceT] = None
+        self._opened = False
+        self._lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
+
+    @property
+    def opened(self) -> bool:
+        """Check that resource was opened.
+
+        Returns:
+            True if resource was accessed.
+        """
+        return self._opened
+
+    async def get(self) -> ResourceT:
+        """Get resource, opening it on first access.
+
+        Returns:
+            Resource instance.
+        """
+        async with self._lock:
+            if not self._opened:
+                self._resource = await self._exit_stack.enter_async_context(
+                    self._factory(),
+                )
+                self._opened = True
+
+        return self._resource  # type: ignore
+
+    async def aclose(self) -> None:
+        """Close resource, if it was opened."""
+        await self._exit_stack.aclose()
+        self._resource = None
+        self._opened = False
+
+
+class LazyServices(object):
+    """Named resources factories, opened lazily for each unit of work.
+
+    Factories do not depend on the request, so services
+    can be opened outside of request handling too.
+    """
+
+    def __init__(
+        self,
+        factories: Mapping[str, ResourceFactory],
+    ) -> None:
+        """Initialize services without opening them.
+
+        Args:
+            factories: Functions returning context managers of resources \
+                by services names.
+        """
+        self._factories = factories
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[LazyServicesMap]:
+        """Create providers of services.
+
+        Services accessed through providers are closed on exit.
+
+        Yields:
+            Lazy services by names.
+        """
+        async with AsyncExitStack() as exit_stack:
+            yield {
+                name: await exit_stack.enter_async_context(Lazy(factory))
+                for name, factory in self._factories.items()
+            }
@@ -0,0 +1,336 @@
+"""In-process metrics in Prometheus text format.
+
+See https://prometheus.io/docs/instrumenting/exposition_formats/
+"""
+
+
+from bisect import bisect_left
+from typing import Iterator, Sequence
+
+# Histogram buckets for durations in seconds
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+)
+
+# Metric labels values in order of labels names
+LabelsValues = tuple[str, ...]
+
+
+class Metric(object):
+    """Metric with values by labels."""
+
+    # Prometheus metric type
+    metric_type = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+    ) -> None:
+        """Initialize metric without values.
+
+        Args:
+            name: Metric name.
+            description: Metric help text.
+            labels: Labels names.
+        """
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+
+    def render(self) -> Iterator[str]:
+        """Render metric in text format.
+
+        Yields:
+            Metric help, type and values lines.
+        """
+        yield '# HELP {name} {description}'.format(
+            name=self.name,
+            description=self.description,
+        )
+        yield '# TYPE {name} {metric_type}'.format(
+            name=self.name,
+            metric_type=self.metric_type,
+        )
+        yield from self.render_values()
+
+    def render_values(self) -> Iterator[str]:
+        """Render metric values.
+
+        Returns:
+            Values lines iterator.
+        """
+        return iter(())
+
+    def get_labels_values(self, labels: dict[str, str]) -> LabelsValues:
+        """Order labels values by labels names.
+
+        Args:
+            labels: Labels values by names.
+
+        Returns:
+            Labels values.
+        """
+        return tuple(labels[label] for label in self.labels)
+
+    def format_labels(
+        self,
+        labels_values: LabelsValues,
+        **extra_labels: str,
+    ) -> str:
+        """Format labels of value line.
+
+        Args:
+            labels_values: Labels values.
+            extra_labels: Labels added to metric ones.
+
+        Returns:
+            Labels in braces. Empty string if metric has no labels.
+        """
+        labels = [*zip(self.labels, labels_values), *extra_labels.items()]
+        if not labels:
+            return ''
+
+        return '{{{labels}}}'.format(labels=','.join(
+            '{name}="{label_value}"'.format(
+                name=name,
+                label_value=_escape_label_value(label_value),
+            )
+            for name, label_value in labels
+        ))
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    metric_type = 'counter'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+    ) -> None:
+        """Initialize counter without values.
+
+        Args:
+            name: Metric name.
+            description: Metric help text.
+            labels: Labels names.
+        """
+        super().__init__(name, description, labels)
+        self._counters: dict[LabelsValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase counter.
+
+        Args:
+            amount: Value to add.
+            labels: Labels values by names.
+        """
+        labels_values = self.get_labels_values(labels)
+        self._counters[labels_values] = (
+            self._counters.get(labels_values, 0) + amount
+        )
+
+    def render_values(self) -> Iterator[str]:
+        """Render counter values.
+
+        Yields:
+            Values lines.
+        """
+        yield from (
+            '{name}{labels} {counter_value}'.format(
+                name=self.name,
+                labels=self.format_labels(labels_values),
+                counter_value=counter_value,
+            )
+            for labels_values, counter_value in self._counters.items()
+        )
+
+
+class HistogramValue(object):
+    """Observations of histogram with the same labels."""
+
+    def __init__(self, buckets_count: int) -> None:
+        """Initialize empty observations.
+
+        Args:
+            buckets_count: Number of buckets including +Inf one.
+        """
+        self.buckets_counts = [0 for _ in range(buckets_count)]
+        self.total: float = 0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Distribution of observed values by buckets."""
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> None:
+        """Initialize histogram without observations.
+
+        Args:
+            name: Metric name.
+            description: Metric help text.
+            labels: Labels names.
+            buckets: Sorted upper bounds of buckets. +Inf is added.
+        """
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+        self._observations: dict[LabelsValues, HistogramValue] = {}
+
+    def observe(self, observed: float, **labels: str) -> None:
+        """Add observation.
+
+        Args:
+            observed: Observed value.
+            labels: Labels values by names.
+        """
+        labels_values = self.get_labels_values(labels)
+        histogram_value = self._observations.get(labels_values)
+        if histogram_value is None:
+            histogram_value = HistogramValue(len(self.buckets) + 1)
+            self._observations[labels_values] = histogram_value
+
+        bucket = bisect_left(self.buckets, observed)
+        histogram_value.buckets_counts[bucket] += 1
+        histogram_value.total += observed
+        histogram_value.count += 1
+
+    def render_values(self) -> Iterator[str]:
+        """Render cumulative buckets, sum and count of observations.
+
+        Yields:
+            Values lines.
+        """
+        for labels_values, histogram_value in self._observations.items():
+            yield from self._render_buckets(labels_values, histogram_value)
+            labels = self.format_labels(labels_values)
+            yield '{name}_sum{labels} {total}'.format(
+                name=self.name,
+                labels=labels,
+                total=histogram_value.total,
+            )
+            yield '{name}_count{labels} {count}'.format(
+                name=self.name,
+                labels=labels,
+                count=histogram_value.count,
+            )
+
+    def _render_buckets(
+        self,
+        labels_values: LabelsValues,
+        histogram_value: HistogramValue,
+    ) -> Iterator[str]:
+        """Render cumulative buckets counts.
+
+        Args:
+            labels_values: Labels values of observations.
+            histogram_value: Observations.
+
+        Yields:
+            Buckets lines.
+        """
+        bounds = [*(str(bound) for bound in self.buckets), '+Inf']
+        cumulative_count = 0
+        for bound, bucket_count in zip(bounds, histogram_value.buckets_counts):
+            cumulative_count += bucket_count
+            yield '{name}_bucket{labels} {count}'.format(
+                name=self.name,
+                labels=self.format_labels(labels_values, le=bound),
+                count=cumulative_count,
+            )
+
+
+class MetricsRegistry(object):
+    """Collection of application metrics."""
+
+    def __init__(self) -> None:
+        """Initialize empty registry."""
+        self._metrics: list[Metric] = []
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+    ) -> Counter:
+        """Create and register counter.
+
+        Args:
+            name: Metric name.
+            description: Metric help text.
+            labels: Labels names.
+
+        Returns:
+            Registered counter.
+        """
+        counter = Counter(name, description, labels)
+        self._metrics.append(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> Histogram:
+        """Create and register histogram.
+
+        Args:
+            name: Metric name.
+            description: Metric help text.
+            labels: Labels names.
+            buckets: Sorted upper bounds of buckets.
+
+        Returns:
+            Registered histogram.
+        """
+        histogram = Histogram(name, description, labels, buckets)
+        self._metrics.append(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Render all metrics in text format.
+
+        Returns:
+            Metrics text.
+        """
+        lines = [
+            line
+            for metric in self._metrics
+            for line in metric.render()
+        ]
+        return '\n'.join([*lines, ''])
+
+
+# Registry of application metrics
+metrics_registry = MetricsRegistry()
+
+
+def _escape_label_value(label_value: str) -> str:
+    """Escape label value for text format.
+
+    Args:
+        label_value: Label value.
+
+    Returns:
+        Value with escaped backslashes, quotes and line feeds.
+    """
+    return label_value.replace(
+        '\\', r'\\',
+    ).replace(
+        '"', r'\"',
+    ).replace(
+        '\n', r'\n',
+    )
@@ -0,0 +1,91 @@
+"""Outbound calls tracking.
+
+Calls to external services are measured and added to the
+collector of the current unit of work, e.g. bot update.
+"""
+
+
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import AsyncIterator, Iterator, Optional
+
+from chip_logistics.utils.metrics import metrics_registry
+
+outbound_call_seconds = metrics_registry.histogram(
+    'outbound_call_duration_seconds',
+    'Duration of calls to external services',
+    labels=('service',),
+)
+
+
+class OutboundCalls(object):
+    """Outbound calls made during unit of work."""
+
+    def __init__(self) -> None:
+        """Initialize empty collector."""
+        self.counts: dict[str, int] = {}
+        self.durations: dict[str, float] = {}
+
+    def add(self, service: str, duration: float) -> None:
+        """Add finished call.
+
+        Args:
+            service: Called service.
+            duration: Call duration in seconds.
+        """
+        self.counts[service] = self.counts.get(service, 0) + 1
+        self.durations[service] = self.durations.get(service, 0) + duration
+
+
+# Collector of current unit of work.
+# Tasks started during the work share the same collector.
+current_outbound_calls: ContextVar[Optional[OutboundCalls]] = ContextVar(
+    'current_outbound_calls',
+    default=None,
+)
+
+
+@contextmanager
+def collect_outbound_calls() -> Iterator[OutboundCalls]:
+    """Collect outbound calls made inside the block.
+
+    Yields:
+        Calls collector.
+    """
+    outbound_calls = OutboundCalls()
+    token = current_outbound_calls.set(outbound_calls)
+    try:
+        yield outbound_calls
+    finally:
+        current_outbound_calls.reset(token)
+
+
+def record_outbound_call(service: str, duration: float) -> None:
+    """Record finished outbound call.
+
+    Args:
+        service: Called service.
+        duration: Call duration in seconds.
+    """
+    outbound_call_seconds.observe(duration, service=service)
+    outbound_calls = current_outbound_calls.get()
+    if outbound_calls is not None:
+        outbound_calls.add(service, duration)
+
+
+@asynccontextmanager
+async def track_outbound_call(service: str) -> AsyncIterator[None]:
+    """Measure outbound call made inside the block.
+
+    Args:
+        service: Called service.
+
+    Yields:
+        Nothing, call is recorded on exit.
+    """
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        record_outbound_call(service, perf_counter() - started_at)
@@ -0,0 +1,82 @@
+"""Shared HTTP sessions.
+
+Sessions are created once per application and reuse
+connections to the same hosts between requests.
+"""
+
+
+from typing import Sequence
+
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+
+from chip_logistics.utils.closing import AClosing
+
+# Max number of simultaneous connections
+CONNECTIONS_LIMIT = 100
+
+# Max number of simultaneous connections to the same host
+CONNECTIONS_LIMIT_PER_HOST = 20
+
+# Time in seconds to keep idle connection open
+KEEPALIVE_TIMEOUT = 60
+
+# Time in seconds to cache resolved hosts addresses
+DNS_CACHE_TTL = 10 * 60
+
+
+class SessionsPool(AClosing):
+    """Pool of HTTP sessions.
+
+    All sessions share one connector with keep-alive, per-host
+    connections limit and DNS caching.
+
+    Session is created on first request for its base url.
+    """
+
+    def __init__(self, trace_configs: Sequence[TraceConfig] = ()) -> None:
+        """Create shared connector.
+
+        Should be called from running event loop.
+
+        Args:
+            trace_configs: Trace configs of all sessions.
+        """
+        self._connector = TCPConnector(
+            limit=CONNECTIONS_LIMIT,
+            limit_per_host=CONNECTIONS_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self._trace_configs = list(trace_configs)
+        self._sessions: dict[str, ClientSession] = {}
+
+    def get_session(self, base_url: str) -> ClientSession:
+        """Get session for base url.
+
+        Session is owned by pool and should not be closed by caller.
+
+        Args:
+            base_url: Base url of session requests.
+
+        Returns:
+            Shared session.
+        """
+        session = self._sessions.get(base_url)
+        if session is None:
+            session = ClientSession(
+                base_url=base_url,
+                connector=self._connector,
+                connector_owner=False,
+                trace_configs=self._trace_configs,
+            )
+            self._sessions[base_url] = session
+
+        return session
+
+    async def aclose(self) -> None:
+        """Close all sessions and connections."""
+        for session in self._sessions.values():
+            await session.close()
+
+        self._sessions.clear()
+        await self._connector.close()
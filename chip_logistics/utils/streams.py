@@ -0,0 +1,105 @@
+"""Binary data reading helpers.
+
+Allow to process bytes-like objects, file objects and async streams
+part by part without copying the whole content.
+"""
+
+
+from io import SEEK_END
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Union
+
+# Binary content in memory, in file or streamed
+BinaryData = Union[
+    bytes,
+    bytearray,
+    memoryview,
+    BinaryIO,
+    AsyncIterable[bytes],
+]
+
+# Part of binary content
+BinaryPart = Union[bytes, memoryview]
+
+
+def get_size(binary_data: BinaryData) -> int:
+    """Get size of binary data.
+
+    Size of file object is counted from current position.
+
+    Args:
+        binary_data: Bytes-like object or seekable file object.
+
+    Returns:
+        Size in bytes.
+
+    Raises:
+        ValueError: If data is async iterator, so size is unknown.
+    """
+    if isinstance(binary_data, (bytes, bytearray, memoryview)):
+        return memoryview(binary_data).nbytes
+
+    if isinstance(binary_data, AsyncIterable):
+        raise ValueError('Size of async iterator is unknown')
+
+    position = binary_data.tell()
+    end_position = binary_data.seek(0, SEEK_END)
+    binary_data.seek(position)
+    return end_position - position
+
+
+async def iter_parts(
+    binary_data: BinaryData,
+    part_size: int,
+) -> AsyncIterator[BinaryPart]:
+    """Split binary data to parts of fixed size.
+
+    Only the last part may be smaller.
+    Bytes-like objects are sliced by memory views without copying.
+    Other sources are read part by part,
+    so only one part is kept in memory.
+
+    Args:
+        binary_data: Binary content.
+        part_size: Size of part in bytes.
+
+    Yields:
+        Data parts.
+    """
+    if isinstance(binary_data, (bytes, bytearray, memoryview)):
+        data_view = memoryview(binary_data).cast('B')
+        for offset in range(0, data_view.nbytes, part_size):
+            yield data_view[offset:offset + part_size]
+
+    elif isinstance(binary_data, AsyncIterable):
+        async for stream_part in _iter_stream_parts(binary_data, part_size):
+            yield stream_part
+
+    else:
+        file_part = binary_data.read(part_size)
+        while file_part:
+            yield file_part
+            file_part = binary_data.read(part_size)
+
+
+async def _iter_stream_parts(
+    stream: AsyncIterable[bytes],
+    part_size: int,
+) -> AsyncIterator[bytes]:
+    """Regroup chunks of async stream to parts of fixed size.
+
+    Args:
+        stream: Async iterator of bytes chunks.
+        part_size: Size of part in bytes.
+
+    Yields:
+        Data parts.
+    """
+    part_buffer = bytearray()
+    async for chunk in stream:
+        part_buffer += chunk
+        while len(part_buffer) >= part_size:
+            yield bytes(part_buffer[:part_size])
+            del part_buffer[:part_size]  # noqa: WPS420
+
+    if part_buffer:
+        yield bytes(part_buffer)
@@ -0,0 +1,411 @@
+"""HTTP client requests tracing.
+
+Shared trace config measures phases of requests made by aiohttp
+sessions: waiting for free connection, DNS resolving, connection
+creation, time to the first byte of response and body reading.
+
+aiohttp does not signal TLS handshake separately,
+so it is included to the connection creation phase.
+"""
+
+
+import logging
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import aiohttp
+from yarl import URL
+
+from chip_logistics.utils.metrics import metrics_registry
+from chip_logistics.utils.outbound import record_outbound_call
+
+logger = logging.getLogger(__name__)
+
+# Min length of path segment with digits, which is treated as identifier
+ID_SEGMENT_MIN_LENGTH = 16
+
+# Params of finished or failed request
+FinishedRequestParams = Union[
+    aiohttp.TraceRequestEndParams,
+    aiohttp.TraceRequestExceptionParams,
+]
+
+request_phase_seconds = metrics_registry.histogram(
+    'http_client_phase_duration_seconds',
+    'Duration of outbound HTTP requests phases',
+    labels=('host', 'endpoint', 'phase'),
+)
+
+
+class RequestsTracer(object):  # noqa: WPS214
+    """Trace config callbacks measuring requests phases.
+
+    Phases durations are saved to the request trace context
+    and recorded, when response headers are received.
+    Body reading is recorded, when whole body is read.
+    """
+
+    def __init__(self, slow_request_seconds: Optional[float] = None) -> None:
+        """Initialize tracer.
+
+        Args:
+            slow_request_seconds: Requests waiting for response longer \
+                are logged with phases. Logging is disabled if None.
+        """
+        self.slow_request_seconds = slow_request_seconds
+
+    async def on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        """Start request measurement.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Request params.
+        """
+        trace_context.started_at = perf_counter()
+        trace_context.phases = {}
+
+    async def on_connection_queued_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceConnectionQueuedStartParams,
+    ) -> None:
+        """Start waiting for free connection.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Empty params.
+        """
+        trace_context.queued_at = perf_counter()
+
+    async def on_connection_queued_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceConnectionQueuedEndParams,
+    ) -> None:
+        """Finish waiting for free connection.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Empty params.
+        """
+        trace_context.phases['queue'] = (
+            perf_counter() - trace_context.queued_at
+        )
+
+    async def on_dns_resolvehost_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceDnsResolveHostStartParams,
+    ) -> None:
+        """Start host resolving.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Params with resolved host.
+        """
+        trace_context.resolving_at = perf_counter()
+
+    async def on_dns_resolvehost_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceDnsResolveHostEndParams,
+    ) -> None:
+        """Finish host resolving.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Params with resolved host.
+        """
+        trace_context.phases['dns'] = (
+            perf_counter() - trace_context.resolving_at
+        )
+
+    async def on_connection_create_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceConnectionCreateStartParams,
+    ) -> None:
+        """Start connection creation.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Empty params.
+        """
+        trace_context.connecting_at = perf_counter()
+
+    async def on_connection_create_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        """Finish connection creation.
+
+        Host is resolved during connection creation,
+        so DNS phase is excluded.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Empty params.
+        """
+        connecting = perf_counter() - trace_context.connecting_at
+        resolving = trace_context.phases.get('dns', 0)
+        trace_context.phases['connect'] = connecting - resolving
+
+    async def on_request_headers_sent(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.tracing.TraceRequestHeadersSentParams,
+    ) -> None:
+        """Save time when request is sent.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Request params.
+        """
+        trace_context.sent_at = perf_counter()
+
+    async def on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        """Record phases, when response headers are received.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Request params with url.
+        """
+        sent_at = getattr(trace_context, 'sent_at', trace_context.started_at)
+        trace_context.received_at = perf_counter()
+        trace_context.phases['ttfb'] = trace_context.received_at - sent_at
+        self._record_request(trace_context, request_params)
+
+    async def on_request_exception(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceRequestExceptionParams,
+    ) -> None:
+        """Record phases of failed request.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Request params with url.
+        """
+        self._record_request(trace_context, request_params)
+
+    async def on_response_chunk_received(
+        self,
+        session: aiohttp.ClientSession,
+        trace_context: SimpleNamespace,
+        request_params: aiohttp.TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Record body reading, when whole body is read.
+
+        Args:
+            session: Requesting session.
+            trace_context: Request trace context.
+            request_params: Request params with url.
+        """
+        request_phase_seconds.observe(
+            perf_counter() - trace_context.received_at,
+            host=request_params.url.host or '',
+            endpoint=get_endpoint(request_params.url),
+            phase='body',
+        )
+
+    def _record_request(
+        self,
+        trace_context: SimpleNamespace,
+        request_params: FinishedRequestParams,
+    ) -> None:
+        """Record outbound call and its phases.
+
+        Args:
+            trace_context: Request trace context.
+            request_params: Request params with url.
+        """
+        host = request_params.url.host or ''
+        endpoint = get_endpoint(request_params.url)
+        duration = perf_counter() - trace_context.started_at
+        record_outbound_call(host, duration)
+        for phase, phase_duration in trace_context.phases.items():
+            request_phase_seconds.observe(
+                phase_duration,
+                host=host,
+                endpoint=endpoint,
+                phase=phase,
+            )
+
+        if self.slow_request_seconds and duration > self.slow_request_seconds:
+            logger.warning(
+                'Slow request %s %s%s took %.3f s, phases: %s',  # noqa: WPS323
+                request_params.method,
+                host,
+                endpoint,
+                duration,
+                trace_context.phases,
+            )
+
+
+def create_trace_config(
+    slow_request_seconds: Optional[float] = None,
+) -> aiohttp.TraceConfig:
+    """Create trace config measuring requests.
+
+    Config should be shared by all application sessions.
+
+    Args:
+        slow_request_seconds: Requests waiting for response longer \
+            are logged. Logging is disabled if None.
+
+    Returns:
+        Frozen trace config.
+    """
+    tracer = RequestsTracer(slow_request_seconds)
+    trace_config = aiohttp.TraceConfig()
+    _trace_connections(trace_config, tracer)
+    _trace_requests(trace_config, tracer)
+    trace_config.freeze()
+    return trace_config
+
+
+def _trace_connections(
+    trace_config: aiohttp.TraceConfig,
+    tracer: RequestsTracer,
+) -> None:
+    """Add tracer callbacks of connection phases to trace config.
+
+    Args:
+        trace_config: Not frozen trace config.
+        tracer: Requests tracer.
+    """
+    _add_callback(
+        trace_config.on_connection_queued_start,
+        tracer.on_connection_queued_start,
+    )
+    _add_callback(
+        trace_config.on_connection_queued_end,
+        tracer.on_connection_queued_end,
+    )
+    _add_callback(
+        trace_config.on_dns_resolvehost_start,
+        tracer.on_dns_resolvehost_start,
+    )
+    _add_callback(
+        trace_config.on_dns_resolvehost_end,
+        tracer.on_dns_resolvehost_end,
+    )
+    _add_callback(
+        trace_config.on_connection_create_start,
+        tracer.on_connection_create_start,
+    )
+    _add_callback(
+        trace_config.on_connection_create_end,
+        tracer.on_connection_create_end,
+    )
+
+
+def _trace_requests(
+    trace_config: aiohttp.TraceConfig,
+    tracer: RequestsTracer,
+) -> None:
+    """Add tracer callbacks of request and response to trace config.
+
+    Args:
+        trace_config: Not frozen trace config.
+        tracer: Requests tracer.
+    """
+    _add_callback(trace_config.on_request_start, tracer.on_request_start)
+    _add_callback(
+        trace_config.on_request_headers_sent,
+        tracer.on_request_headers_sent,
+    )
+    _add_callback(trace_config.on_request_end, tracer.on_request_end)
+    _add_callback(
+        trace_config.on_request_exception,
+        tracer.on_request_exception,
+    )
+    _add_callback(
+        trace_config.on_response_chunk_received,
+        tracer.on_response_chunk_received,
+    )
+
+
+def _add_callback(
+    signal: Any,
+    callback: Callable[..., Awaitable[None]],
+) -> None:
+    """Add callback to trace config signal.
+
+    Signal is not typed, because its annotation in aiohttp
+    does not match generic `Signal` of newer aiosignal versions.
+
+    Args:
+        signal: Trace config signal.
+        callback: Async callback with session, trace context and params.
+    """
+    signal.append(callback)
+
+
+def get_endpoint(url: URL) -> str:
+    """Get endpoint label of request url.
+
+    Identifiers and secrets in path are masked,
+    e.g. Bot API token and AmoCRM entities ids.
+
+    Args:
+        url: Request url.
+
+    Returns:
+        Url path with masked segments.
+    """
+    return '/'.join(
+        _mask_path_segment(segment)
+        for segment in url.path.split('/')
+    )
+
+
+def _mask_path_segment(segment: str) -> str:
+    """Mask path segment, if it is identifier or secret.
+
+    Args:
+        segment: Url path segment.
+
+    Returns:
+        `{secret}` for segments with colon, `{id}` for numbers \
+        and long segments with digits. Otherwise, segment itself.
+    """
+    if ':' in segment:
+        return '{secret}'
+
+    is_long = len(segment) >= ID_SEGMENT_MIN_LENGTH
+    has_digits = any(char.isdigit() for char in segment)
+    if segment.isdigit() or (is_long and has_digits):
+        return '{id}'
+
+    return segment
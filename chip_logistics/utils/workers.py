@@ -0,0 +1,86 @@
+"""Background jobs workers.
+
+Jobs with the same key are run one by one in submission order.
+Jobs with different keys are run concurrently by several workers.
+"""
+
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+from chip_logistics.utils.closing import AClosing
+
+logger = logging.getLogger(__name__)
+
+# Function starting background job
+Job = Callable[[], Awaitable[Any]]
+
+
+class KeyedWorkersPool(AClosing):
+    """Bounded pool of workers running jobs ordered by keys.
+
+    Each key is assigned to one worker, so jobs with the same key
+    never overlap. Every worker has bounded queue of pending jobs.
+
+    Should be created from running event loop.
+    """
+
+    def __init__(self, workers_count: int, queue_size: int) -> None:
+        """Start workers.
+
+        Args:
+            workers_count: Number of concurrently running jobs.
+            queue_size: Max number of pending jobs of one worker.
+        """
+        self._queues: list['asyncio.Queue[Job]'] = [
+            asyncio.Queue(maxsize=queue_size)
+            for _ in range(workers_count)
+        ]
+        self._workers = [
+            asyncio.create_task(self._run_worker(queue))
+            for queue in self._queues
+        ]
+
+    def submit(self, key: Hashable, job: Job) -> None:
+        """Add job to the queue of key worker.
+
+        Args:
+            key: Ordering key. Jobs with the same key are run in order.
+            job: Function starting the job.
+
+        Raises:
+            QueueFull: If worker has too many pending jobs.
+        """
+        queue = self._queues[hash(key) % len(self._queues)]
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise asyncio.QueueFull(
+                'Too many pending jobs with key {key}'.format(key=key),
+            )
+
+    async def aclose(self) -> None:
+        """Wait for pending jobs and stop workers."""
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def _run_worker(self, queue: 'asyncio.Queue[Job]') -> None:
+        """Run jobs from queue one by one.
+
+        Failed jobs are logged and do not stop the worker.
+
+        Args:
+            queue: Worker jobs queue.
+        """
+        while True:  # noqa: WPS457
+            job = await queue.get()
+            try:
+                await job()
+            except Exception:
+                logger.exception('Background job failed')
+            finally:
+                queue.task_done()
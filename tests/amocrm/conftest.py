@@ -2,11 +2,13 @@
 
 
 from os import environ
+from typing import Optional
 
 import pytest
 from dotenv import load_dotenv
 
 from chip_logistics.core.amocrm.models import Credentials
+from chip_logistics.core.amocrm.repo import AmoCRMRepo
 
 load_dotenv('./tests/amocrm/.env')
 
@@ -39,3 +41,52 @@ def credentials() -> Credentials:
         access_token=None,
         refresh_token=None,
     )
+
+
+class CountingAmoCRMRepo(AmoCRMRepo):
+    """Repository stub counting storage reads."""
+
+    def __init__(self) -> None:
+        """Initialize repository with test credentials."""
+        self.credentials = Credentials(
+            api_url='https://test.amocrm.ru',
+            drive_url='https://drive-b.amocrm.ru',
+            client_id='client-id',
+            client_secret='client-secret',  # noqa: S106
+            access_token='access-token',
+            refresh_token='refresh-token',
+            redirect_uri='https://test.com',
+            version='1',
+        )
+        self.reads = 0
+        self.version_checks = 0
+
+    async def get_credentials(self) -> Credentials:
+        """Get copy of stored credentials.
+
+        Returns:
+            Stored credentials.
+        """
+        self.reads += 1
+        return self.credentials.model_copy()
+
+    async def save_credentials(self, credentials: Credentials) -> None:
+        """Save credentials with new version.
+
+        Args:
+            credentials: Credentials to save.
+        """
+        credentials.version = str(int(self.credentials.version or 0) + 1)
+        self.credentials = credentials.model_copy()
+
+    async def get_credentials_version(self, client_id: str) -> Optional[str]:
+        """Get version of stored credentials.
+
+        Args:
+            client_id: AmoCRM integration id.
+
+        Returns:
+            Credentials version.
+        """
+        self.version_checks += 1
+        return self.credentials.version
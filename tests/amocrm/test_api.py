@@ -1,16 +1,16 @@
 """Test AMOCrm API module."""
 
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 import pytest
 
 from chip_logistics.core.amocrm.api import (
     attach_file_to_contact,
-    authorize,
     find_contacts,
     upload_file,
 )
+from chip_logistics.core.amocrm.auth import authorize
 from chip_logistics.core.amocrm.client import AmoCRMClient, init_client
 from chip_logistics.core.amocrm.models import Credentials
 from chip_logistics.core.amocrm.repo import AmoCRMRepo
@@ -43,6 +43,17 @@ class MockAmoCRMRepo(AmoCRMRepo):
         """
         self._credentials = credentials
 
+    async def get_credentials_version(self, client_id: str) -> Optional[str]:
+        """Get version of saved credentials.
+
+        Args:
+            client_id: AmoCRM integration id.
+
+        Returns:
+            Credentials version.
+        """
+        return self._credentials.version
+
     async def aclose(self) -> None:
         """Delete credentials."""
         self._credentials = None  # type: ignore
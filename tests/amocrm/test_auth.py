@@ -0,0 +1,101 @@
+"""Test AmoCRM tokens refreshing."""
+
+
+import asyncio
+from http import HTTPStatus
+from typing import AsyncGenerator
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from chip_logistics.core.amocrm.api import find_contacts
+from chip_logistics.core.amocrm.client import init_client
+from chip_logistics.core.amocrm.models import Credentials
+from tests.amocrm.conftest import CountingAmoCRMRepo
+
+REQUESTS_COUNT = 5
+
+REFRESHED_TOKEN = 'refreshed-access-token'  # noqa: S105
+
+
+class FakeAmoCRMServer(object):
+    """AmoCRM API accepting only refreshed token."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.refreshes = 0
+
+    async def refresh_token(self, request: web.Request) -> web.Response:
+        """Issue refreshed token.
+
+        Args:
+            request: Token request.
+
+        Returns:
+            New tokens.
+        """
+        self.refreshes += 1
+        await asyncio.sleep(0)
+        return web.json_response({
+            'token_type': 'Bearer',  # noqa: S105
+            'expires_in': 86400,
+            'access_token': REFRESHED_TOKEN,
+            'refresh_token': 'refreshed-refresh-token',  # noqa: S105
+        })
+
+    async def get_contacts(self, request: web.Request) -> web.Response:
+        """Return contacts if token is valid.
+
+        Args:
+            request: Contacts request.
+
+        Returns:
+            Contacts list or 401.
+        """
+        expected_auth = 'Bearer {token}'.format(token=REFRESHED_TOKEN)
+        if request.headers.get('Authorization') != expected_auth:
+            return web.Response(status=HTTPStatus.UNAUTHORIZED)
+
+        return web.json_response({
+            '_page': 1,
+            '_embedded': {'contacts': [{'id': 1, 'name': 'John'}]},
+        })
+
+
+@pytest.fixture
+async def server() -> AsyncGenerator[tuple[FakeAmoCRMServer, str], None]:
+    """Run fake AmoCRM API.
+
+    Yields:
+        Fake API and its url.
+    """
+    fake_server = FakeAmoCRMServer()
+    app = web.Application()
+    app.router.add_post('/oauth2/access_token', fake_server.refresh_token)
+    app.router.add_get('/api/v4/contacts', fake_server.get_contacts)
+    async with TestServer(app) as test_server:
+        yield fake_server, str(test_server.make_url(''))
+
+
+async def test_single_refresh(server: tuple[FakeAmoCRMServer, str]) -> None:
+    """Test that concurrent requests share one token refresh.
+
+    Args:
+        server: Fake AmoCRM API and its url.
+    """
+    fake_server, api_url = server
+    repo = CountingAmoCRMRepo()
+    repo.credentials = Credentials(
+        **repo.credentials.model_dump(exclude={'api_url'}),
+        api_url=api_url,
+    )
+    async with init_client(repo) as client:
+        contacts_lists = await asyncio.gather(*[
+            find_contacts(client)
+            for _ in range(REQUESTS_COUNT)
+        ])
+
+    assert all(len(contacts) == 1 for contacts in contacts_lists)
+    assert fake_server.refreshes == 1
+    assert repo.credentials.access_token == REFRESHED_TOKEN
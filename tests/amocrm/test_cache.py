@@ -0,0 +1,73 @@
+"""Test AmoCRM credentials cache."""
+
+
+import pytest
+
+from chip_logistics.core.amocrm.cache import CachedAmoCRMRepo, CredentialsCache
+from tests.amocrm.conftest import CountingAmoCRMRepo
+
+READS_COUNT = 10
+
+
+@pytest.fixture
+def storage() -> CountingAmoCRMRepo:
+    """Get repository stub.
+
+    Returns:
+        Repository stub.
+    """
+    return CountingAmoCRMRepo()
+
+
+async def test_cached_credentials(storage: CountingAmoCRMRepo) -> None:
+    """Test that credentials are read from storage once.
+
+    Args:
+        storage: Repository stub.
+    """
+    cache = CredentialsCache()
+    for _ in range(READS_COUNT):
+        async with CachedAmoCRMRepo(storage, cache) as repo:
+            credentials = await repo.get_credentials()
+            assert credentials == storage.credentials
+
+    assert storage.reads == 1
+    assert storage.version_checks == 0
+
+
+async def test_write_through(storage: CountingAmoCRMRepo) -> None:
+    """Test that saved credentials are served from cache.
+
+    Args:
+        storage: Repository stub.
+    """
+    repo = CachedAmoCRMRepo(storage, CredentialsCache())
+    credentials = await repo.get_credentials()
+    credentials.access_token = 'new-access-token'  # noqa: S105
+    await repo.save_credentials(credentials)
+
+    cached_credentials = await repo.get_credentials()
+    assert cached_credentials.access_token == 'new-access-token'  # noqa: S105
+    assert cached_credentials.version == storage.credentials.version
+    assert storage.reads == 1
+
+
+async def test_version_check(storage: CountingAmoCRMRepo) -> None:
+    """Test that credentials are reloaded only if version is changed.
+
+    Args:
+        storage: Repository stub.
+    """
+    repo = CachedAmoCRMRepo(storage, CredentialsCache(ttl=0))
+    await repo.get_credentials()
+    await repo.get_credentials()
+    assert storage.reads == 1
+    assert storage.version_checks == 1
+
+    storage.credentials = storage.credentials.model_copy(update={
+        'access_token': 'external-access-token',  # noqa: S105
+        'version': '2',
+    })
+    credentials = await repo.get_credentials()
+    assert credentials.access_token == 'external-access-token'  # noqa: S105
+    assert storage.reads == 2
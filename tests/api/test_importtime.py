@@ -0,0 +1,67 @@
+"""Tests for application import time.
+
+Application is imported by `python -X importtime` in a new process.
+Frameworks are imported before it, so only time of application modules
+and libraries imported by them is checked.
+"""
+
+
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+pytest.importorskip('deta')
+
+# Libraries required to serve the first request
+PRELOADED_MODULES = ('fastapi', 'aiogram.types', 'pydantic', 'aiohttp')
+
+# Code importing application after preloaded libraries
+IMPORT_CODE = 'import {preloaded}; import chip_logistics.main'.format(
+    preloaded=', '.join(PRELOADED_MODULES),
+)
+
+# Modules, which should be imported on first use, not on startup
+LAZY_MODULES = (
+    'openpyxl',
+    'chip_logistics.core.amocrm.api',
+    'chip_logistics.bot.routers.root',
+)
+
+# Max import time of application in microseconds
+IMPORT_TIME_BUDGET = 500000
+
+
+def import_app() -> dict[str, int]:
+    """Import application in a new process.
+
+    Returns:
+        Cumulative import time in microseconds by imported modules.
+    """
+    import_process = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_CODE],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules_times: dict[str, int] = {}
+    for line in import_process.stderr.splitlines():
+        _, cumulative_time, module_name = line.split('|')
+        if cumulative_time.strip().isdigit():
+            modules_times[module_name.strip()] = int(cumulative_time)
+
+    return modules_times
+
+
+def test_lazy_modules() -> None:
+    """Test that heavy modules are not imported on startup."""
+    modules_times = import_app()
+    assert 'chip_logistics.main' in modules_times
+    for module_name in LAZY_MODULES:
+        assert module_name not in modules_times
+
+
+def test_import_time() -> None:
+    """Test that application is imported within time budget."""
+    modules_times = import_app()
+    assert modules_times['chip_logistics.main'] < IMPORT_TIME_BUDGET
@@ -4,13 +4,23 @@
 # List of articles and them costs
 from decimal import Decimal
 from random import randint
+from typing import AsyncGenerator
 
+import pytest
+
+from chip_logistics.core.articles.currencies import (
+    CurrenciesService,
+    RatesCache,
+)
 from chip_logistics.core.articles.models import ArticleItem, Currency
+from tests.articles.stubs import VersionedArticlesRepo
 
 ARTICLE_NAME_PREFIX = 'Article'
 
 DEFAULT_DUTY_FEE_RATIO = Decimal('1')
 
+USD_TO_CNY_RATE = Decimal('7.3')
+
 
 def gen_article_name() -> str:
     """Generate random article name.
@@ -147,3 +157,66 @@ test_articles = (
         Decimal('2884.9'),
     ),
 )
+
+
+class CurrenciesServiceStub(CurrenciesService):
+    """Currencies service with fake Fixer API.
+
+    Counts API calls.
+    """
+
+    def __init__(self, rates_cache: RatesCache) -> None:
+        """Initialize service with fake API key.
+
+        Args:
+            rates_cache: Exchange rates cache.
+        """
+        super().__init__('fixer-api-key', rates_cache)
+        self.api_calls = 0
+
+    async def _fetch_rates(
+        self,
+        base_currency: Currency,
+        currencies: list[Currency],
+    ) -> dict[Currency, Decimal]:
+        """Return USD to CNY rate and its inverse.
+
+        Args:
+            base_currency: Base currency.
+            currencies: Target currencies.
+
+        Returns:
+            Exchange rates.
+        """
+        self.api_calls += 1
+        rates: dict[Currency, Decimal] = {}
+        for currency in currencies:
+            if base_currency == Currency.usd:
+                rates[currency] = USD_TO_CNY_RATE
+            else:
+                rates[currency] = 1 / USD_TO_CNY_RATE
+
+            self._update_cached_rate(base_currency, currency, rates[currency])
+
+        return rates
+
+
+@pytest.fixture
+async def service() -> AsyncGenerator[CurrenciesServiceStub, None]:
+    """Get currencies service with fake API.
+
+    Yields:
+        Currencies service stub.
+    """
+    async with CurrenciesServiceStub(RatesCache()) as service:
+        yield service
+
+
+@pytest.fixture
+def storage() -> VersionedArticlesRepo:
+    """Get repository stub.
+
+    Returns:
+        Repository stub.
+    """
+    return VersionedArticlesRepo()
@@ -0,0 +1,282 @@
+"""Stubs of articles storages."""
+
+
+from decimal import Decimal
+from random import choices
+from string import ascii_letters, digits
+from typing import AsyncIterator, Iterable, Optional
+
+from chip_logistics.core.articles.models import ArticleInfo, ArticlesPage
+from chip_logistics.core.articles.pages import slice_articles_page
+from chip_logistics.core.articles.repo import ArticlesRepo
+from chip_logistics.utils.closing import AClosing
+
+# Id of the article, which versioned repository is initialized with
+ARTICLE_ID = 'article-id'
+
+
+class ArticlesRepoStub(ArticlesRepo, AClosing):
+    """Stub of articles repository.
+
+    Articles stored in the dictionary.
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with empty articles dict."""
+        super().__init__()
+        self._articles: dict[str, ArticleInfo] = {}
+        self._changes = 0
+
+    async def put_article(self, article: ArticleInfo) -> ArticleInfo:
+        """Put article to the dict.
+
+        Args:
+            article: Article data.
+
+        Returns:
+            Created or updated article.
+        """
+        if article.id is None:
+            article.id = self._gen_article_id()
+
+        self._articles[article.id] = article
+        self._changes += 1
+        return article
+
+    async def put_articles(
+        self,
+        articles: Iterable[ArticleInfo],
+    ) -> list[ArticleInfo]:
+        """Put several articles to the dict.
+
+        Args:
+            articles: Articles data.
+
+        Returns:
+            Created or updated articles.
+        """
+        return [await self.put_article(article) for article in articles]
+
+    async def delete_article(self, article_id: str) -> bool:
+        """Delete article from dict.
+
+        Args:
+            article_id: Id of article to delete.
+
+        Returns:
+            True if article deleted.
+        """
+        if article_id in self._articles:
+            self._articles.pop(article_id)
+            self._changes += 1
+            return True
+
+        return False
+
+    async def delete_articles(self, article_ids: Iterable[str]) -> set[str]:
+        """Delete several articles from dict.
+
+        Args:
+            article_ids: Ids of articles to delete.
+
+        Returns:
+            Ids of deleted articles.
+        """
+        return {
+            article_id
+            for article_id in set(article_ids)
+            if await self.delete_article(article_id)
+        }
+
+    async def discard_articles(
+        self,
+        article_ids: Iterable[str],
+    ) -> Optional[str]:
+        """Delete several articles from dict without lookup.
+
+        Args:
+            article_ids: Ids of existing articles.
+
+        Returns:
+            Catalog version.
+        """
+        for article_id in article_ids:
+            self._articles.pop(article_id, None)
+
+        self._changes += 1
+        return str(self._changes)
+
+    async def get_catalog_version(self) -> Optional[str]:
+        """Get catalog version.
+
+        Returns:
+            Number of articles changes.
+        """
+        return str(self._changes)
+
+    async def get_articles_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> ArticlesPage:
+        """Get page of articles from dict.
+
+        Args:
+            limit: Max number of articles on the page.
+            after: Id of the last article of the previous page.
+            before: Id of the first article of the next page.
+
+        Returns:
+            Articles page.
+        """
+        return slice_articles_page(
+            self._articles,
+            sorted(self._articles),
+            limit,
+            after=after,
+            before=before,
+        )
+
+    async def get_article(self, article_id: str) -> Optional[ArticleInfo]:
+        """Ger article from dict.
+
+        Args:
+            article_id: Article identifier.
+
+        Returns:
+            Found article or None.
+        """
+        return self._articles.get(article_id)
+
+    async def get_articles(self) -> list[ArticleInfo]:
+        """Get all articles from dict.
+
+        Returns:
+            Articles info.
+        """
+        return list(self._articles.values())
+
+    async def iter_articles(self) -> AsyncIterator[ArticleInfo]:
+        """Iterate all articles from dict.
+
+        Yields:
+            Articles info.
+        """
+        for article in list(self._articles.values()):
+            yield article
+
+    async def find_articles(
+        self,
+        query: Optional[str] = None,
+    ) -> list[ArticleInfo]:
+        """Find articles by name.
+
+        Search is case and word position insensitive.
+
+        So, for names ['fOo', 'Bar', 'bar foo'] query
+        'foo' would find ['fOo', 'bar foo'].
+
+        Args:
+            query: Name query. If None, all articles returned.
+
+        Returns:
+            List of found articles.
+        """
+        articles = await self.get_articles()
+        if query is None:
+            return articles
+
+        return [
+            article for article in articles
+            if query.lower() in article.name.lower()
+        ]
+
+    async def aclose(self) -> None:
+        """Close repository and clean resources."""
+        self._articles = {}
+
+    def _gen_article_id(self) -> str:
+        """Generate random article id.
+
+        Returns:
+            12-chars random string.
+        """
+        size = 12
+        return ''.join(choices(ascii_letters + digits, k=size))  # noqa: S311
+
+
+class VersionedArticlesRepo(ArticlesRepoStub):
+    """Repository stub counting storage reads and versioning catalog."""
+
+    def __init__(self) -> None:
+        """Initialize repository with single article."""
+        super().__init__()
+        self._articles = {
+            ARTICLE_ID: ArticleInfo(
+                id=ARTICLE_ID,
+                name='Article',
+                duty_fee_ratio=Decimal(1),
+            ),
+        }
+        self.version = 1
+        self.reads = 0
+        self.version_checks = 0
+
+    async def get_articles(self) -> list[ArticleInfo]:
+        """Get all articles and count read.
+
+        Returns:
+            Articles info.
+        """
+        self.reads += 1
+        return await super().get_articles()
+
+    async def put_article(self, article: ArticleInfo) -> ArticleInfo:
+        """Put article and change catalog version.
+
+        Args:
+            article: Article data.
+
+        Returns:
+            Created or updated article.
+        """
+        self.version += 1
+        return await super().put_article(article)
+
+    async def delete_article(self, article_id: str) -> bool:
+        """Delete article and change catalog version.
+
+        Args:
+            article_id: Id of article to delete.
+
+        Returns:
+            True if article deleted.
+        """
+        self.version += 1
+        return await super().delete_article(article_id)
+
+    async def discard_articles(
+        self,
+        article_ids: Iterable[str],
+    ) -> Optional[str]:
+        """Delete articles without lookup and change catalog version.
+
+        Args:
+            article_ids: Ids of existing articles.
+
+        Returns:
+            Catalog version.
+        """
+        self.version += 1
+        await super().discard_articles(article_ids)
+        return str(self.version)
+
+    async def get_catalog_version(self) -> Optional[str]:
+        """Get catalog version and count check.
+
+        Returns:
+            Catalog version.
+        """
+        self.version_checks += 1
+        return str(self.version)
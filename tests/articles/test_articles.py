@@ -2,125 +2,24 @@
 
 
 from decimal import Decimal
-from random import choices
-from string import ascii_letters, digits
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator
 
 import pytest
 
 from chip_logistics.core.articles.articles import (
     create_article,
     delete_article,
+    delete_articles,
     find_articles,
 )
 from chip_logistics.core.articles.models import ArticleInfo
 from chip_logistics.core.articles.repo import ArticlesRepo
-from chip_logistics.utils.closing import AClosing
 from tests.articles.conftest import (
     ARTICLE_NAME_PREFIX,
     gen_article_name,
     test_articles,
 )
-
-
-class ArticlesRepoStub(ArticlesRepo, AClosing):
-    """Stub of articles repository.
-
-    Articles stored in the dictionary.
-    """
-
-    def __init__(self) -> None:
-        """Initialize repository with empty articles dict."""
-        super().__init__()
-        self._articles: dict[str, ArticleInfo] = {}
-
-    async def put_article(self, article: ArticleInfo) -> ArticleInfo:
-        """Put article to the dict.
-
-        Args:
-            article: Article data.
-
-        Returns:
-            Created or updated article.
-        """
-        if article.id is None:
-            article.id = self._gen_article_id()
-
-        self._articles[article.id] = article
-        return article
-
-    async def delete_article(self, article_id: str) -> bool:
-        """Delete article from dict.
-
-        Args:
-            article_id: Id of article to delete.
-
-        Returns:
-            True if article deleted.
-        """
-        if article_id in self._articles:
-            self._articles.pop(article_id)
-            return True
-
-        return False
-
-    async def get_article(self, article_id: str) -> Optional[ArticleInfo]:
-        """Ger article from dict.
-
-        Args:
-            article_id: Article identifier.
-
-        Returns:
-            Found article or None.
-        """
-        return self._articles.get(article_id)
-
-    async def get_articles(self) -> list[ArticleInfo]:
-        """Get all articles from dict.
-
-        Returns:
-            Articles info.
-        """
-        return list(self._articles.values())
-
-    async def find_articles(
-        self,
-        query: Optional[str] = None,
-    ) -> list[ArticleInfo]:
-        """Find articles by name.
-
-        Search is case and word position insensitive.
-
-        So, for names ['fOo', 'Bar', 'bar foo'] query
-        'foo' would find ['fOo', 'bar foo'].
-
-        Args:
-            query: Name query. If None, all articles returned.
-
-        Returns:
-            List of found articles.
-        """
-        articles = await self.get_articles()
-        if query is None:
-            return articles
-
-        return [
-            article for article in articles
-            if query.lower() in article.name.lower()
-        ]
-
-    async def aclose(self) -> None:
-        """Close repository and clean resources."""
-        self._articles = {}
-
-    def _gen_article_id(self) -> str:
-        """Generate random article id.
-
-        Returns:
-            12-chars random string.
-        """
-        size = 12
-        return ''.join(choices(ascii_letters + digits, k=size))  # noqa: S311
+from tests.articles.stubs import ArticlesRepoStub
 
 
 @pytest.fixture
@@ -195,3 +94,15 @@ async def test_delete_article(repo: ArticlesRepo) -> None:
     deleted = await delete_article(repo, article.id)
     assert deleted is True
     assert await repo.get_article(article.id) is None
+
+
+async def test_delete_articles(repo: ArticlesRepo) -> None:
+    """Test that only existing articles are reported as deleted.
+
+    Args:
+        repo: Mocked articles storage.
+    """
+    article_ids = [article.id for article in await repo.get_articles()]
+    deleted_ids = await delete_articles(repo, [*article_ids, 'missed-id'])
+    assert deleted_ids == set(article_ids)
+    assert not await repo.get_articles()
@@ -0,0 +1,73 @@
+"""Tests for batch article price calculations."""
+
+
+from decimal import Decimal
+from random import Random
+
+from chip_logistics.core.articles.batch import (
+    calculate_articles_prices,
+    calculate_items_prices,
+    get_articles_columns,
+)
+from chip_logistics.core.articles.calcs import calculate_article_price
+from chip_logistics.core.articles.models import ArticleItem, Currency
+from tests.articles.conftest import test_articles
+
+RANDOM_ITEMS_COUNT = 1000
+
+# Upper bounds of random items values
+MAX_COUNT = 5000
+MAX_UNIT_WEIGHT_GRAMS = 100000
+MAX_UNIT_PRICE_CENTS = 100000
+MAX_DUTY_FEE_PERCENTS = 200
+
+
+def generate_items(items_count: int) -> list[ArticleItem]:
+    """Generate items with random values.
+
+    Weights cover all Russian delivery tiers.
+
+    Args:
+        items_count: Number of items.
+
+    Returns:
+        Random items.
+    """
+    random = Random(items_count)  # noqa: S311
+    return [
+        ArticleItem(
+            name='Article',
+            count=random.randint(0, MAX_COUNT),  # noqa: S311
+            unit_weight=Decimal(
+                random.randint(0, MAX_UNIT_WEIGHT_GRAMS),  # noqa: S311
+            ) / 1000,
+            unit_price=Decimal(
+                random.randint(1, MAX_UNIT_PRICE_CENTS),  # noqa: S311
+            ) / 100,
+            duty_fee_ratio=Decimal(
+                random.randint(100, MAX_DUTY_FEE_PERCENTS),  # noqa: S311
+            ) / 100,
+            price_currency=Currency.usd,
+        )
+        for _ in range(items_count)
+    ]
+
+
+def test_items_prices() -> None:
+    """Test batch calculation of test articles prices."""
+    articles_items = [article_item for article_item, _ in test_articles]
+    expected_prices = [price for _, price in test_articles]
+    assert calculate_items_prices(articles_items) == expected_prices
+
+
+def test_identical_to_single_item() -> None:
+    """Test that batch results are identical to per-item calculation."""
+    articles_items = generate_items(RANDOM_ITEMS_COUNT)
+    prices = calculate_articles_prices(get_articles_columns(articles_items))
+    expected_prices = [
+        calculate_article_price(article_item)
+        for article_item in articles_items
+    ]
+    assert [str(price) for price in prices] == [
+        str(price) for price in expected_prices
+    ]
@@ -0,0 +1,180 @@
+"""Test articles catalog cache."""
+
+
+from decimal import Decimal
+
+import pytest
+
+from chip_logistics.core.articles.cache import CachedArticlesRepo, CatalogCache
+from chip_logistics.core.articles.models import ArticleInfo
+from tests.articles.conftest import DEFAULT_DUTY_FEE_RATIO
+from tests.articles.stubs import ARTICLE_ID, VersionedArticlesRepo
+
+READS_COUNT = 10
+
+CHIP_ARTICLE_ID = 'chip-art'
+
+
+async def test_cached_catalog(storage: VersionedArticlesRepo) -> None:
+    """Test that catalog is read from storage once.
+
+    Args:
+        storage: Repository stub.
+    """
+    cache = CatalogCache()
+    for _ in range(READS_COUNT):
+        async with CachedArticlesRepo(storage, cache) as repo:
+            assert await repo.get_article(ARTICLE_ID) is not None
+            assert len(await repo.find_articles('ARTICLE')) == 1
+
+    assert storage.reads == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == READS_COUNT * 2 - 1
+
+
+async def test_returned_copies(storage: VersionedArticlesRepo) -> None:
+    """Test that changes of returned articles do not affect cache.
+
+    Args:
+        storage: Repository stub.
+    """
+    repo = CachedArticlesRepo(storage, CatalogCache())
+    article = await repo.get_article(ARTICLE_ID)
+    assert article is not None
+    article.name = 'Changed'
+
+    cached_article = await repo.get_article(ARTICLE_ID)
+    assert cached_article is not None
+    assert cached_article.name == 'Article'
+
+
+async def test_write_patching(storage: VersionedArticlesRepo) -> None:
+    """Test that local writes are applied to cache without reload.
+
+    Args:
+        storage: Repository stub.
+    """
+    cache = CatalogCache(ttl=0)
+    repo = CachedArticlesRepo(storage, cache)
+    await repo.get_articles()
+    await repo.put_articles([
+        ArticleInfo(
+            id=None,
+            name='New',
+            duty_fee_ratio=DEFAULT_DUTY_FEE_RATIO,
+        ),
+        ArticleInfo(
+            id=ARTICLE_ID,
+            name='Renamed',
+            duty_fee_ratio=DEFAULT_DUTY_FEE_RATIO,
+        ),
+    ])
+    assert not await repo.find_articles('article')
+
+    await repo.delete_articles([ARTICLE_ID])
+    found_articles = await repo.find_articles('e')
+    assert [article.name for article in found_articles] == ['New']
+    assert storage.reads == 1
+    assert cache.stats.misses == 1
+
+
+async def test_delete_cached_article(storage: VersionedArticlesRepo) -> None:
+    """Test that existence of deleted article is checked in the cache.
+
+    Args:
+        storage: Repository stub.
+    """
+    repo = CachedArticlesRepo(storage, CatalogCache())
+    await repo.get_articles()
+    assert not await repo.delete_article('missed-id')
+    assert await repo.delete_article(ARTICLE_ID)
+    assert not await repo.get_articles()
+
+    # Version is checked with catalog load and along with the delete
+    assert storage.version_checks == 2
+    assert storage.reads == 1
+
+
+async def test_external_write_before_local(
+    storage: VersionedArticlesRepo,
+) -> None:
+    """Test that catalog changed by others is reloaded after local write.
+
+    Args:
+        storage: Repository stub.
+    """
+    repo = CachedArticlesRepo(storage, CatalogCache())
+    await repo.get_articles()
+    await storage.put_article(
+        ArticleInfo(
+            id=None,
+            name='External',
+            duty_fee_ratio=DEFAULT_DUTY_FEE_RATIO,
+        ),
+    )
+    await repo.put_article(
+        ArticleInfo(
+            id=None,
+            name='Local',
+            duty_fee_ratio=DEFAULT_DUTY_FEE_RATIO,
+        ),
+    )
+
+    assert len(await repo.get_articles()) == 3
+    assert storage.reads == 2
+
+
+async def test_revalidation(storage: VersionedArticlesRepo) -> None:
+    """Test that catalog is reloaded only if version is changed.
+
+    Args:
+        storage: Repository stub.
+    """
+    cache = CatalogCache(ttl=0)
+    repo = CachedArticlesRepo(storage, cache)
+    await repo.get_articles()
+    await repo.get_articles()
+    assert storage.reads == 1
+    assert cache.stats.revalidations == 1
+
+    await storage.put_article(
+        ArticleInfo(id=None, name='External', duty_fee_ratio=Decimal(1)),
+    )
+    assert len(await repo.get_articles()) == 2
+    assert storage.reads == 2
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.parametrize(('query', 'found_ids'), [
+    ('art', {ARTICLE_ID, CHIP_ARTICLE_ID}),
+    ('CHIP  art', {CHIP_ARTICLE_ID}),
+    ('ar', {ARTICLE_ID, CHIP_ARTICLE_ID, 'bar'}),
+    ('article chip', set()),
+])
+async def test_indexed_search(
+    storage: VersionedArticlesRepo,
+    query: str,
+    found_ids: set[str],
+) -> None:
+    """Test that queries are answered from the cached catalog index.
+
+    Args:
+        storage: Repository stub.
+        query: Name query.
+        found_ids: Expected found articles ids.
+    """
+    await storage.put_articles([
+        ArticleInfo(
+            id=CHIP_ARTICLE_ID,
+            name='Chip Art',
+            duty_fee_ratio=Decimal(1),
+        ),
+        ArticleInfo(id='bar', name='Bar', duty_fee_ratio=Decimal(1)),
+    ])
+
+    repo = CachedArticlesRepo(storage, CatalogCache())
+    await repo.find_articles(query)
+    found_articles = await repo.find_articles(query)
+    found_articles_ids = {article.id for article in found_articles}
+    assert found_articles_ids == found_ids
+    assert storage.reads == 1
@@ -0,0 +1,159 @@
+"""Tests for currencies service."""
+
+
+import asyncio
+from decimal import Decimal
+
+from chip_logistics.core.articles.currencies import RatesCache
+from chip_logistics.core.articles.models import Currency
+from tests.articles.conftest import (
+    USD_TO_CNY_RATE,
+    CurrenciesServiceStub,
+    test_articles,
+)
+
+ITEMS_COUNT = 30
+
+
+async def test_cached_rate(service: CurrenciesServiceStub) -> None:
+    """Test that cached rate is reused.
+
+    Args:
+        service: Currencies service stub.
+    """
+    for _ in range(ITEMS_COUNT):
+        price = await service.convert_price(
+            Decimal(10),
+            Currency.cyn,
+            Currency.usd,
+            use_cached=True,
+        )
+        assert price == Decimal(10) / USD_TO_CNY_RATE
+
+    assert service.api_calls == 1
+
+
+async def test_not_cached_rate(service: CurrenciesServiceStub) -> None:
+    """Test that cache is bypassed if `use_cached` is False.
+
+    Args:
+        service: Currencies service stub.
+    """
+    await service.get_exchange_rate(
+        Currency.cyn,
+        Currency.usd,
+        use_cached=False,
+    )
+    await service.get_exchange_rate(
+        Currency.cyn,
+        Currency.usd,
+        use_cached=False,
+    )
+    assert service.api_calls == 2
+
+
+async def test_inverse_rate(service: CurrenciesServiceStub) -> None:
+    """Test that rate is derived from the inverse pair.
+
+    Args:
+        service: Currencies service stub.
+    """
+    await service.get_exchange_rate(
+        Currency.usd,
+        Currency.cyn,
+        use_cached=True,
+    )
+    rate = await service.get_exchange_rate(
+        Currency.cyn,
+        Currency.usd,
+        use_cached=True,
+    )
+    assert rate == 1 / USD_TO_CNY_RATE
+    assert service.api_calls == 1
+
+
+async def test_stale_rate() -> None:
+    """Test that stale rate is served and revalidated in background."""
+    stub = CurrenciesServiceStub(RatesCache(ttl=0))
+    async with stub as service:
+        await service.get_exchange_rate(
+            Currency.usd,
+            Currency.cyn,
+            use_cached=True,
+        )
+        rate = await service.get_exchange_rate(
+            Currency.usd,
+            Currency.cyn,
+            use_cached=True,
+        )
+        assert rate == USD_TO_CNY_RATE
+
+    assert stub.api_calls == 2
+
+
+async def test_expired_rate() -> None:
+    """Test that expired rate is fetched again."""
+    rates_cache = RatesCache(ttl=0, stale_ttl=0)
+    async with CurrenciesServiceStub(rates_cache) as service:
+        await service.get_exchange_rate(
+            Currency.usd,
+            Currency.cyn,
+            use_cached=True,
+        )
+        await service.get_exchange_rate(
+            Currency.usd,
+            Currency.cyn,
+            use_cached=True,
+        )
+        assert service.api_calls == 2
+
+
+async def test_shared_pending_rates() -> None:
+    """Test that services sharing cache wait for the same API call."""
+    rates_cache = RatesCache()
+    first_stub = CurrenciesServiceStub(rates_cache)
+    second_stub = CurrenciesServiceStub(rates_cache)
+    async with first_stub:
+        async with second_stub:
+            rates = await asyncio.gather(
+                first_stub.get_exchange_rate(
+                    Currency.usd,
+                    Currency.cyn,
+                    use_cached=True,
+                ),
+                second_stub.get_exchange_rate(
+                    Currency.usd,
+                    Currency.cyn,
+                    use_cached=True,
+                ),
+            )
+
+    assert rates == [USD_TO_CNY_RATE, USD_TO_CNY_RATE]
+    assert first_stub.api_calls + second_stub.api_calls == 1
+
+
+async def test_convert_items(service: CurrenciesServiceStub) -> None:
+    """Test that items of all currencies are converted with one API call.
+
+    Args:
+        service: Currencies service stub.
+    """
+    articles_items = [article_item for article_item, _ in test_articles]
+    articles_items += [
+        article_item.model_copy(update={'price_currency': Currency.cyn})
+        for article_item in articles_items
+    ]
+
+    usd_items = await service.convert_items(articles_items, Currency.usd)
+    assert service.api_calls == 1
+
+    for article_item, usd_item in zip(articles_items, usd_items):
+        assert usd_item is not None
+        assert usd_item.price_currency == Currency.usd
+        assert usd_item.unit_price == await service.convert_price(
+            article_item.unit_price,
+            article_item.price_currency,
+            Currency.usd,
+        )
+
+    assert service.api_calls == 1
@@ -0,0 +1,100 @@
+"""Tests for articles pagination."""
+
+
+from typing import Optional
+
+import pytest
+
+from chip_logistics.core.articles.cache import CachedArticlesRepo, CatalogCache
+from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.pages import get_articles_page
+from chip_logistics.core.articles.repo import ArticlesRepo
+from tests.articles.stubs import ArticlesRepoStub
+
+ARTICLES_COUNT = 7
+
+PAGE_SIZE = 3
+
+# Cursors indexes, expected page slice and neighbour pages existence
+PAGES_CASES_FIELDS = (
+    'after',
+    'before',
+    'page_slice',
+    'has_previous',
+    'has_next',
+)
+
+PAGES_CASES = (
+    (None, None, slice(0, PAGE_SIZE), False, True),
+    (2, None, slice(3, 6), True, True),
+    (5, None, slice(6, None), True, False),
+    (None, 4, slice(1, 4), True, True),
+    (None, 2, slice(0, 2), False, True),
+)
+
+
+async def fill_repo(repo: ArticlesRepo) -> list[str]:
+    """Put articles with ordered ids to repository.
+
+    Args:
+        repo: Articles storage.
+
+    Returns:
+        Sorted articles ids.
+    """
+    articles = await repo.put_articles(
+        ArticleInfo(
+            id='article-{number}'.format(number=number),
+            name='Article {number}'.format(number=number),
+        )
+        for number in range(ARTICLES_COUNT)
+    )
+    return sorted(str(article.id) for article in articles)
+
+
+def get_ids(articles: list[ArticleInfo]) -> list[Optional[str]]:
+    """Get articles ids.
+
+    Args:
+        articles: Articles.
+
+    Returns:
+        Ids of articles.
+    """
+    return [article.id for article in articles]
+
+
+@pytest.mark.parametrize('cached', [False, True])
+@pytest.mark.parametrize(PAGES_CASES_FIELDS, PAGES_CASES)
+async def test_pages_navigation(  # noqa: WPS211
+    cached: bool,
+    after: Optional[int],
+    before: Optional[int],
+    page_slice: slice,
+    has_previous: bool,
+    has_next: bool,
+) -> None:
+    """Test that pages are walked forward and backward by cursors.
+
+    Args:
+        cached: Use catalog cache in front of repository.
+        after: Index of cursor article for next page.
+        before: Index of cursor article for previous page.
+        page_slice: Expected page slice of sorted articles.
+        has_previous: Expected existence of previous page.
+        has_next: Expected existence of next page.
+    """
+    repo: ArticlesRepo = ArticlesRepoStub()
+    if cached:
+        repo = CachedArticlesRepo(repo, CatalogCache())
+
+    articles_ids = await fill_repo(repo)
+    page = await get_articles_page(
+        repo,
+        PAGE_SIZE,
+        after=None if after is None else articles_ids[after],
+        before=None if before is None else articles_ids[before],
+    )
+    assert get_ids(page.articles) == articles_ids[page_slice]
+    assert page.has_previous == has_previous
+    assert page.has_next == has_next
@@ -0,0 +1,74 @@
+"""Tests for calculations report generation."""
+
+
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from openpyxl import load_workbook
+from openpyxl.worksheet.worksheet import Worksheet
+
+from chip_logistics.core.articles.report import (
+    COLUMN_WIDTH_RATIO,
+    REPORT_HEADER,
+    create_calculations_report,
+)
+from tests.articles.conftest import test_articles
+
+CUSTOMER_NAME = 'Customer'
+
+TOTAL_PRICE = Decimal('100.25')
+
+
+@pytest.fixture(scope='module')
+def report_sheet() -> Worksheet:
+    """Generate report of test articles and load its sheet.
+
+    Returns:
+        Report worksheet.
+    """
+    report_data, _ = create_calculations_report(
+        list(test_articles),
+        TOTAL_PRICE,
+        CUSTOMER_NAME,
+    )
+    return load_workbook(BytesIO(report_data)).active
+
+
+def test_report_rows(report_sheet: Worksheet) -> None:
+    """Test that report contains header, items and total price.
+
+    Args:
+        report_sheet: Report worksheet.
+    """
+    rows = list(report_sheet.iter_rows(values_only=True))
+    assert rows[0] == REPORT_HEADER
+    assert report_sheet['A1'].font.bold
+    assert rows[1:-2] == [
+        (
+            CUSTOMER_NAME,
+            article_item.name,
+            article_item.count,
+            pytest.approx(
+                float(article_item.unit_weight * article_item.count),
+            ),
+            '{0:.1f}'.format(price),
+        )
+        for article_item, price in test_articles
+    ]
+    assert rows[-1][:2] == ('Общая стоимость (В долларах)', '100.2')
+
+
+def test_columns_width(report_sheet: Worksheet) -> None:
+    """Test that columns are fit to content.
+
+    Args:
+        report_sheet: Report worksheet.
+    """
+    names_width = [len(REPORT_HEADER[1])] + [
+        len(article_item.name) for article_item, _ in test_articles
+    ]
+    column_width = report_sheet.column_dimensions['B'].width
+    assert column_width == pytest.approx(
+        max(names_width) * COLUMN_WIDTH_RATIO,
+    )
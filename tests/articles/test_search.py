@@ -0,0 +1,52 @@
+"""Tests for articles names search helpers."""
+
+
+import pytest
+
+from chip_logistics.core.articles.search import (
+    get_ngrams,
+    is_indexed_query,
+    match_name,
+    normalize_name,
+)
+
+NAMES = ('fOo', 'Bar', 'bar  foo', 'Чип FOO-1')
+
+
+def test_normalize_name() -> None:
+    """Test that name is case folded and whitespaces are collapsed."""
+    assert normalize_name('  Чип \t FOO-1 ') == 'чип foo-1'
+
+
+def test_get_ngrams() -> None:
+    """Test that n-grams cover all name substrings."""
+    assert get_ngrams('bar foo') == {'bar', 'ar ', 'r f', ' fo', 'foo'}
+    assert get_ngrams('ab') == set()
+
+
+@pytest.mark.parametrize(('query', 'found_names'), [
+    ('foo', {'fOo', 'bar  foo', 'Чип FOO-1'}),
+    ('BAR FOO', {'bar  foo'}),
+    ('чип', {'Чип FOO-1'}),
+    ('endofunctor', set()),
+])
+def test_match_name(query: str, found_names: set[str]) -> None:
+    """Test that names are matched by substring of any word position.
+
+    Args:
+        query: Name query.
+        found_names: Expected matched names.
+    """
+    normalized_query = normalize_name(query)
+    assert is_indexed_query(normalized_query)
+    matched_names = {
+        name
+        for name in NAMES
+        if match_name(name, normalized_query)
+    }
+    assert matched_names == found_names
+
+    # Every matched name contains all query n-grams,
+    # so index lookup by any n-gram does not miss articles.
+    for name in found_names:
+        assert get_ngrams(normalized_query) <= get_ngrams(normalize_name(name))
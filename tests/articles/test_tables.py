@@ -0,0 +1,71 @@
+"""Tests for articles tables import and export."""
+
+
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+
+from chip_logistics.core.articles.articles import import_articles
+from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.tables import (
+    TableFormat,
+    TableRowError,
+    read_articles_table,
+    write_articles_table,
+)
+from tests.articles.stubs import ArticlesRepoStub
+
+ARTICLES = (
+    ArticleInfo(id='article-1', name='Чип', duty_fee_ratio=Decimal('1.5')),
+    ArticleInfo(id='article-2', name='Relay', duty_fee_ratio=Decimal(1)),
+)
+
+
+@pytest.mark.parametrize('table_format', list(TableFormat))
+def test_tables_round_trip(table_format: TableFormat) -> None:
+    """Test that exported articles are imported back.
+
+    Args:
+        table_format: Table format.
+    """
+    table_file = BytesIO()
+    write_articles_table(table_file, ARTICLES, table_format)
+    table_file.seek(0)
+    assert read_articles_table(table_file, table_format) == list(ARTICLES)
+
+
+def test_read_csv_columns() -> None:
+    """Test that columns are matched by names and empty rows skipped."""
+    table_text = ''.join((
+        '\ufeffduty_fee_ratio,name,comment\n',
+        '"1,5",Чип,new\n',
+        ',,\n',
+        ',Relay,\n',
+    ))
+    table_file = BytesIO(table_text.encode())
+    articles = read_articles_table(table_file, TableFormat.csv)
+    assert articles == [
+        ArticleInfo(id=None, name='Чип', duty_fee_ratio=Decimal('1.5')),
+        ArticleInfo(id=None, name='Relay', duty_fee_ratio=Decimal(1)),
+    ]
+
+
+def test_invalid_row() -> None:
+    """Test that invalid row number is reported."""
+    table_file = BytesIO(b'name,duty_fee_ratio\nRelay,1\n,2\n')
+    with pytest.raises(TableRowError, match='row 3'):
+        read_articles_table(table_file, TableFormat.csv)
+
+
+async def test_import_existing_names() -> None:
+    """Test that imported articles update articles with same names."""
+    async with ArticlesRepoStub() as repo:
+        await repo.put_articles(ARTICLES)
+        imported_articles = await import_articles(repo, [
+            ArticleInfo(id=None, name='ЧИП', duty_fee_ratio=Decimal(2)),
+            ArticleInfo(id=None, name='Fuse', duty_fee_ratio=Decimal(1)),
+        ])
+
+        assert imported_articles[0].id == 'article-1'
+        assert len(await repo.get_articles()) == len(ARTICLES) + 1
@@ -0,0 +1 @@
+"""Bot tests."""
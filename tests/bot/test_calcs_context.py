@@ -0,0 +1,108 @@
+"""Tests for calculations FSM context."""
+
+
+from decimal import Decimal
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from chip_logistics.bot.states.calcs_context import (
+    ITEMS_FIELD,
+    CalculationsContext,
+    append_item,
+    decode_item,
+    encode_item,
+    get_calculations_context,
+)
+from chip_logistics.core.articles.models import ArticleItem, Currency
+from chip_logistics.deta.models import model_dump
+
+STORAGE_KEY = StorageKey(bot_id=1, chat_id=1, user_id=1)
+
+ARTICLE_ITEM = ArticleItem(
+    name='foo',
+    count=3,
+    unit_weight=Decimal('0.5'),
+    unit_price=Decimal('10.25'),
+    price_currency=Currency.usd,
+    duty_fee_ratio=Decimal('1.2'),
+)
+
+
+class AppendingMemoryStorage(MemoryStorage):
+    """Memory storage, that can append value to list in data."""
+
+    def __init__(self) -> None:
+        """Initialize storage."""
+        super().__init__()
+        self.appended_values: list[Any] = []
+
+    async def append_data(
+        self,
+        key: StorageKey,
+        field: str,
+        field_value: Any,
+    ) -> None:
+        """Append value to list in data field.
+
+        Args:
+            key: Storage key.
+            field: Data field with list.
+            field_value: Value to append.
+        """
+        self.appended_values.append(field_value)
+        self.storage[key].data.setdefault(field, []).append(field_value)
+
+
+def test_item_encoding() -> None:
+    """Test that item is decoded from row and from old dict format."""
+    item_row = encode_item(ARTICLE_ITEM)
+    assert decode_item(item_row) == ARTICLE_ITEM
+    assert decode_item(model_dump(ARTICLE_ITEM)) == ARTICLE_ITEM
+
+
+def test_build_incomplete_item() -> None:
+    """Test that item is not built without entered fields."""
+    context = CalculationsContext(name='foo', count=3)
+    assert context.build_item(Decimal('10.25')) is None
+
+
+async def test_append_item() -> None:
+    """Test that item is added to context data."""
+    state = FSMContext(MemoryStorage(), STORAGE_KEY)
+    await state.update_data(
+        name='foo',
+        count=3,
+        unit_weight='0.5',
+        price_currency=Currency.usd,
+        duty_fee_ratio='1.2',
+    )
+
+    context = await get_calculations_context(state)
+    article_item = context.build_item(Decimal('10.25'))
+    assert article_item is not None
+    await append_item(state, context, article_item)
+    await append_item(state, context, article_item)
+    assert context.get_items() == [ARTICLE_ITEM, ARTICLE_ITEM]
+
+    stored_context = await get_calculations_context(state)
+    assert stored_context.get_items() == [ARTICLE_ITEM, ARTICLE_ITEM]
+
+
+async def test_append_item_incrementally() -> None:
+    """Test that only new row is written to appendable storage."""
+    storage = AppendingMemoryStorage()
+    state = FSMContext(storage, STORAGE_KEY)
+    await state.update_data(customer_name='bar')
+
+    context = await get_calculations_context(state)
+    await append_item(state, context, ARTICLE_ITEM)
+    assert storage.appended_values == [encode_item(ARTICLE_ITEM)]
+
+    stored_data = await state.get_data()
+    assert stored_data == {
+        'customer_name': 'bar',
+        ITEMS_FIELD: [encode_item(ARTICLE_ITEM)],
+    }
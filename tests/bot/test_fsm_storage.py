@@ -0,0 +1,127 @@
+"""Tests for FSM storage with coalesced writes."""
+
+
+from pathlib import Path
+from typing import Optional
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+
+from chip_logistics.bot.fsm.memory import MemoryFSMRecordsRepo
+from chip_logistics.bot.fsm.models import FSMRecord, FSMRecordChanges
+from chip_logistics.bot.fsm.sqlite import SQLiteFSMRecordsRepo
+from chip_logistics.bot.fsm.storage import CoalescingStorage, get_record_key
+from chip_logistics.bot.states.calcs import CalculationsState
+from chip_logistics.bot.states.calcs_context import ITEMS_FIELD
+
+STORAGE_KEY = StorageKey(bot_id=1, chat_id=2, user_id=3)
+
+NAME_FIELD = 'name'
+
+ITEM_NAME = 'foo'
+
+ITEM_ROW = (ITEM_NAME, 3)
+
+
+class CountingRecordsRepo(MemoryFSMRecordsRepo):
+    """Memory records repository, that counts requests."""
+
+    def __init__(self) -> None:
+        """Initialize repository."""
+        super().__init__()
+        self.reads = 0
+        self.writes: list[FSMRecordChanges] = []
+
+    async def get_record(self, key: str) -> Optional[FSMRecord]:
+        """Get FSM record and count read.
+
+        Args:
+            key: Record key.
+
+        Returns:
+            Found record or None.
+        """
+        self.reads += 1
+        return await super().get_record(key)
+
+    async def apply_changes(self, key: str, changes: FSMRecordChanges) -> None:
+        """Save record and remember changes.
+
+        Args:
+            key: Record key.
+            changes: Record changes.
+        """
+        self.writes.append(changes.model_copy(deep=True))
+        await super().apply_changes(key, changes)
+
+
+async def test_coalesced_writes() -> None:
+    """Test that changes of one update are written once."""
+    repo = CountingRecordsRepo()
+    storage = CoalescingStorage(repo)
+    state = FSMContext(storage, STORAGE_KEY)
+    async with storage.coalesce():
+        assert await state.get_state() is None
+        await state.update_data(name=ITEM_NAME)
+        await state.update_data(count=3)
+        await state.set_state(CalculationsState.wait_item_unit_weight)
+
+    assert repo.reads == 1
+    assert len(repo.writes) == 1
+    assert repo.writes[0].is_new
+    assert await state.get_state() == CalculationsState.wait_item_unit_weight
+
+
+async def test_coalesced_appends() -> None:
+    """Test that only changed fields and appended values are written."""
+    repo = CountingRecordsRepo()
+    storage = CoalescingStorage(repo)
+    await storage.set_data(STORAGE_KEY, {NAME_FIELD: ITEM_NAME})
+    async with storage.coalesce():
+        await storage.update_data(STORAGE_KEY, {'count': 3})
+        await storage.append_data(STORAGE_KEY, ITEMS_FIELD, ITEM_ROW)
+        await storage.append_data(STORAGE_KEY, ITEMS_FIELD, ITEM_ROW)
+
+    changes = repo.writes[-1]
+    assert not changes.is_new
+    assert changes.fields == {'count': 3}
+    assert changes.appends == {ITEMS_FIELD: [ITEM_ROW, ITEM_ROW]}
+    assert await storage.get_data(STORAGE_KEY) == {
+        NAME_FIELD: ITEM_NAME,
+        'count': 3,
+        ITEMS_FIELD: [ITEM_ROW, ITEM_ROW],
+    }
+
+
+async def test_not_coalesced_writes() -> None:
+    """Test that changes outside coalesce block are written immediately."""
+    repo = CountingRecordsRepo()
+    state = FSMContext(CoalescingStorage(repo), STORAGE_KEY)
+    await state.get_state()
+    assert not repo.writes
+
+    await state.set_data({ITEMS_FIELD: [ITEM_ROW]})
+    await state.update_data({ITEMS_FIELD: []})
+    assert len(repo.writes) == 2
+    assert repo.writes[-1].fields == {ITEMS_FIELD: []}
+
+
+async def test_sqlite_records_repo(tmp_path: Path) -> None:
+    """Test that records are saved to SQLite database.
+
+    Args:
+        tmp_path: Temporary directory.
+    """
+    database_path = str(tmp_path / 'fsm.sqlite3')
+    async with SQLiteFSMRecordsRepo(database_path) as repo:
+        storage = CoalescingStorage(repo)
+        await storage.set_state(STORAGE_KEY, CalculationsState.wait_item_name)
+        await storage.update_data(STORAGE_KEY, {NAME_FIELD: ITEM_NAME})
+
+    async with SQLiteFSMRecordsRepo(database_path) as reopened_repo:
+        record = await reopened_repo.get_record(get_record_key(STORAGE_KEY))
+
+    assert record == FSMRecord(
+        state=CalculationsState.wait_item_name.state,
+        data={NAME_FIELD: ITEM_NAME},
+    )
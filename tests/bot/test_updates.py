@@ -0,0 +1,70 @@
+"""Tests for Telegram updates processing helpers."""
+
+
+from datetime import datetime
+
+import pytest
+from aiogram.types import (
+    CallbackQuery,
+    Chat,
+    InlineQuery,
+    Message,
+    Update,
+    User,
+)
+
+from chip_logistics.bot.updates import get_update_chat_id
+
+UPDATE_ID = 1
+
+CHAT_ID = -100
+
+USER_ID = 42
+
+USER = User(id=USER_ID, is_bot=False, first_name='User')
+
+MESSAGE = Message(
+    message_id=1,
+    date=datetime.now(),
+    chat=Chat(id=CHAT_ID, type='group'),
+    from_user=USER,
+    text='text',
+)
+
+
+@pytest.mark.parametrize(('update', 'chat_id'), [
+    (Update(update_id=UPDATE_ID, message=MESSAGE), CHAT_ID),
+    (
+        Update(
+            update_id=UPDATE_ID,
+            callback_query=CallbackQuery(
+                id='1',
+                from_user=USER,
+                chat_instance='1',
+                message=MESSAGE,
+            ),
+        ),
+        CHAT_ID,
+    ),
+    (
+        Update(
+            update_id=UPDATE_ID,
+            inline_query=InlineQuery(
+                id='1',
+                from_user=USER,
+                query='query',
+                offset='',
+            ),
+        ),
+        USER_ID,
+    ),
+    (Update(update_id=UPDATE_ID), UPDATE_ID),
+])
+def test_update_chat_id(update: Update, chat_id: int) -> None:
+    """Test that updates are keyed by chat, user or update itself.
+
+    Args:
+        update: Telegram update.
+        chat_id: Expected key of update.
+    """
+    assert get_update_chat_id(update) == chat_id
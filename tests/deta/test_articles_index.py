@@ -0,0 +1,94 @@
+"""Tests for articles names index based on Deta Base."""
+
+
+from decimal import Decimal
+from typing import AsyncGenerator
+
+import pytest
+
+from benchmarks.stubs import LocalDeta
+from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.search import get_ngrams
+
+pytest.importorskip('deta')
+
+from chip_logistics.deta.articles.repo import DetaArticlesRepo  # noqa: E402
+
+QUERY = 'chip'
+
+ARTICLES = (
+    ArticleInfo(id='chip-foo', name='Chip Foo', duty_fee_ratio=Decimal(1)),
+    ArticleInfo(id='chip-bar', name='CHIP  bar', duty_fee_ratio=Decimal(1)),
+    ArticleInfo(id='relay', name='Relay', duty_fee_ratio=Decimal(1)),
+)
+
+
+@pytest.fixture
+def deta() -> LocalDeta:
+    """Get Deta stand-in.
+
+    Returns:
+        Empty in-memory Deta.
+    """
+    return LocalDeta()
+
+
+@pytest.fixture
+async def repo(deta: LocalDeta) -> AsyncGenerator[DetaArticlesRepo, None]:
+    """Get repository filled with articles.
+
+    Args:
+        deta: Deta stand-in.
+
+    Yields:
+        Articles repository.
+    """
+    async with DetaArticlesRepo(deta) as repo:  # type: ignore
+        await repo.put_articles(ARTICLES)
+        yield repo
+
+
+async def test_indexed_search(
+    deta: LocalDeta,
+    repo: DetaArticlesRepo,
+) -> None:
+    """Test that only articles of query n-grams are got.
+
+    Args:
+        deta: Deta stand-in.
+        repo: Articles repository.
+    """
+    calls = deta.calls
+    found_articles = await repo.find_articles(QUERY)
+    assert [article.id for article in found_articles] == [
+        'chip-bar',
+        'chip-foo',
+    ]
+
+    # One index fetch per query n-gram and one get per found article
+    expected_calls = len(get_ngrams(QUERY)) + len(found_articles)
+    assert deta.calls - calls == expected_calls
+
+
+async def test_obsolete_index_records(
+    deta: LocalDeta,
+    repo: DetaArticlesRepo,
+) -> None:
+    """Test that renamed and deleted articles are not found by old names.
+
+    Args:
+        deta: Deta stand-in.
+        repo: Articles repository.
+    """
+    await repo.put_article(ARTICLES[0].model_copy(update={'name': 'Foo'}))
+    await repo.delete_article('chip-bar')
+    assert not await repo.find_articles(QUERY)
+
+    await repo.rebuild_index()
+    index_records = await deta.AsyncBase('articles_index').fetch()
+    indexed_ids = {
+        article_id
+        for record in index_records.items
+        for article_id in record['ids']
+    }
+    assert indexed_ids == {'chip-foo', 'relay'}
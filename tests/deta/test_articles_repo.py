@@ -0,0 +1,47 @@
+"""Tests for articles repository based on Deta Base."""
+
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from benchmarks.stubs import LocalBase, LocalDeta
+from chip_logistics.core.articles.models import ArticleInfo
+from chip_logistics.core.articles.repo import ArticlesNotSavedError
+
+pytest.importorskip('deta')
+
+from chip_logistics.deta.articles.repo import DetaArticlesRepo  # noqa: E402
+
+ARTICLES = (
+    ArticleInfo(id='chip', name='Chip', duty_fee_ratio=Decimal(1)),
+    ArticleInfo(id='relay', name='Relay', duty_fee_ratio=Decimal(1)),
+)
+
+
+async def test_failed_articles(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that articles failed by Deta are raised with saved ones.
+
+    Args:
+        monkeypatch: Patching fixture.
+    """
+    put_many = LocalBase.put_many
+
+    async def put_many_failing_last(  # noqa: WPS430
+        base: LocalBase,
+        items: list[dict[str, Any]],  # noqa: WPS110
+    ) -> dict[str, Any]:
+        put_result = await put_many(base, items[:-1])
+        return {**put_result, 'failed': {'items': items[-1:]}}
+
+    monkeypatch.setattr(LocalBase, 'put_many', put_many_failing_last)
+    async with DetaArticlesRepo(LocalDeta()) as repo:  # type: ignore
+        with pytest.raises(ArticlesNotSavedError, match='1 articles'):
+            await repo.put_articles(ARTICLES)
+
+        assert await repo.get_catalog_version() is not None
+        assert await repo.get_articles() == [ARTICLES[0]]
+
+        with pytest.raises(ArticlesNotSavedError):
+            await repo.put_article(ARTICLES[1])
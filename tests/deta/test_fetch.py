@@ -0,0 +1,104 @@
+"""Tests for paginated fetching from Deta Base."""
+
+
+import asyncio
+from typing import Optional
+
+from pydantic import BaseModel
+
+from chip_logistics.deta.fetch import DetaQuery, Record, iter_records
+
+RECORDS_COUNT = 25
+
+PAGE_SIZE = 10
+
+
+class FetchResponseStub(BaseModel):
+    """Page of fetch results."""
+
+    # Key of the last record, if there are more pages
+    last: Optional[str]
+
+    # Page records
+    items: list[Record]  # noqa: WPS110
+
+
+class PagedBaseStub(object):
+    """Base returning records by small pages.
+
+    Tracks fetches started before previous page records are consumed.
+    """
+
+    def __init__(self) -> None:
+        """Fill base with records."""
+        self.records = [
+            {'key': '{index:03}'.format(index=index)}
+            for index in range(RECORDS_COUNT)
+        ]
+        self.fetches: list[Optional[str]] = []
+        self.cancelled = 0
+
+    async def fetch(
+        self,
+        query: Optional[DetaQuery] = None,
+        limit: int = 1000,
+        last: Optional[str] = None,
+    ) -> FetchResponseStub:
+        """Fetch page of records after last key.
+
+        Args:
+            query: Ignored records query.
+            limit: Ignored max page size.
+            last: Key of the last record of previous page.
+
+        Returns:
+            Page of records.
+
+        Raises:
+            asyncio.CancelledError: If fetch is cancelled.
+        """
+        self.fetches.append(last)
+        try:
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        page = [
+            record
+            for record in self.records
+            if last is None or record['key'] > last
+        ][:PAGE_SIZE]
+        return FetchResponseStub(
+            last=page[-1]['key'] if len(page) == PAGE_SIZE else None,
+            items=page,
+        )
+
+
+async def test_iter_all_pages() -> None:
+    """Test that all pages are fetched and next one is requested early."""
+    base = PagedBaseStub()
+    records = []
+    async for record in iter_records(base):
+        if not records:
+            # Second page is requested while first one is processed
+            await asyncio.sleep(0)
+            assert len(base.fetches) == 2
+
+        records.append(record)
+
+    assert records == base.records
+    assert base.fetches == [None, '009', '019']
+
+
+async def test_stop_iteration() -> None:
+    """Test that pending page request is cancelled on break."""
+    base = PagedBaseStub()
+    records = iter_records(base)
+    await records.__anext__()  # noqa: WPS609
+    await asyncio.sleep(0)
+
+    await records.aclose()  # type: ignore
+    await asyncio.sleep(0)
+    assert base.fetches == [None, '009']
+    assert base.cancelled == 1
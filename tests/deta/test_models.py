@@ -0,0 +1,38 @@
+"""Tests for pydantic models dumping."""
+
+
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from chip_logistics.core.articles.models import (
+    ArticleInfo,
+    ArticleItem,
+    Currency,
+)
+from chip_logistics.deta.models import model_dump
+
+
+@pytest.mark.parametrize('model', [
+    ArticleInfo(id='article-id', name='Чип', duty_fee_ratio=Decimal('1.5')),
+    ArticleInfo(id=None, name='Relay', duty_fee_ratio=Decimal(1)),
+    ArticleItem(
+        name='Fuse',
+        count=10,
+        unit_weight=Decimal('0.0002'),
+        unit_price=Decimal('11.12'),
+        duty_fee_ratio=Decimal('1.2'),
+        price_currency=Currency.cyn,
+    ),
+])
+def test_model_dump(model: BaseModel) -> None:
+    """Test that dumped model is same as parsed model JSON.
+
+    Args:
+        model: Pydantic model object.
+    """
+    model_data = model_dump(model)
+    assert model_data == json.loads(model.model_dump_json())
+    assert model.model_validate(model_data) == model
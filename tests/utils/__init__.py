@@ -0,0 +1 @@
+"""Tests for utils package."""
@@ -0,0 +1,45 @@
+"""Tests for concurrent execution helpers."""
+
+
+import asyncio
+
+from chip_logistics.utils.concurrency import gather_limited
+
+TASKS_COUNT = 20
+
+CONCURRENCY_LIMIT = 3
+
+
+class ConcurrencyCounter(object):
+    """Counter of simultaneously running tasks."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.running = 0
+        self.max_running = 0
+
+    async def run(self, task_number: int) -> int:
+        """Run task and track concurrency.
+
+        Args:
+            task_number: Task number.
+
+        Returns:
+            Task number.
+        """
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return task_number
+
+
+async def test_gather_limited() -> None:
+    """Test that results are ordered and concurrency is limited."""
+    counter = ConcurrencyCounter()
+    task_results = await gather_limited(
+        (counter.run(task_number) for task_number in range(TASKS_COUNT)),
+        CONCURRENCY_LIMIT,
+    )
+    assert task_results == list(range(TASKS_COUNT))
+    assert counter.max_running == CONCURRENCY_LIMIT
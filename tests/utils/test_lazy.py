@@ -0,0 +1,57 @@
+"""Tests for lazy resources."""
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+from chip_logistics.utils.lazy import Lazy
+
+
+class ResourceFactory(object):
+    """Factory counting opened and closed resources."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.opened = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncGenerator[int, None]:
+        """Open resource.
+
+        Yields:
+            Number of opened resources.
+        """
+        self.opened += 1
+        await asyncio.sleep(0)
+        try:
+            yield self.opened
+        finally:
+            self.closed += 1
+
+
+async def test_not_accessed() -> None:
+    """Test that resource is not opened without access."""
+    factory = ResourceFactory()
+    async with Lazy(factory.open) as lazy_resource:
+        assert not lazy_resource.opened
+
+    assert factory.opened == 0
+    assert factory.closed == 0
+
+
+async def test_opened_once() -> None:
+    """Test that concurrent accesses open resource once."""
+    factory = ResourceFactory()
+    async with Lazy(factory.open) as lazy_resource:
+        resources = await asyncio.gather(
+            lazy_resource.get(),
+            lazy_resource.get(),
+            lazy_resource.get(),
+        )
+        assert resources == [1, 1, 1]
+        assert lazy_resource.opened
+
+    assert factory.opened == 1
+    assert factory.closed == 1
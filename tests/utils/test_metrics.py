@@ -0,0 +1,88 @@
+"""Tests for in-process metrics."""
+
+
+from chip_logistics.core.articles.cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_REVALIDATION,
+    CachedArticlesRepo,
+    CatalogCache,
+)
+from chip_logistics.utils.metrics import MetricsRegistry, metrics_registry
+from chip_logistics.utils.outbound import (
+    collect_outbound_calls,
+    record_outbound_call,
+)
+from tests.articles.stubs import VersionedArticlesRepo
+
+DETA = 'deta'
+
+TELEGRAM = 'telegram'
+
+CACHE_READS_PREFIX = 'articles_catalog_cache_reads_total{{result="{result}"}} '
+
+HISTOGRAM_LINES = (
+    '# HELP duration_seconds Duration',
+    '# TYPE duration_seconds histogram',
+    'duration_seconds_bucket{step="a",le="0.1"} 1',
+    'duration_seconds_bucket{step="a",le="1"} 2',
+    'duration_seconds_bucket{step="a",le="+Inf"} 3',
+    'duration_seconds_sum{step="a"} 5.6',
+    'duration_seconds_count{step="a"} 3',
+)
+
+
+def test_histogram() -> None:
+    """Test that buckets are cumulative and bounds are inclusive."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        'duration_seconds',
+        'Duration',
+        labels=('step',),
+        buckets=(0.1, 1),
+    )
+    for observed in (0.1, 0.5, 5):
+        histogram.observe(observed, step='a')
+
+    assert registry.render().splitlines() == list(HISTOGRAM_LINES)
+
+
+def test_counter() -> None:
+    """Test that counters are rendered by labels with escaped values."""
+    registry = MetricsRegistry()
+    counter = registry.counter('results_total', 'Results', labels=('name',))
+    counter.inc(name='a"b')
+    counter.inc(amount=2, name='a"b')
+    counter.inc(name='c\\')
+
+    assert registry.render().splitlines()[2:] == [
+        r'results_total{name="a\"b"} 3',
+        r'results_total{name="c\\"} 1',
+    ]
+
+
+def test_collect_outbound_calls() -> None:
+    """Test that calls are collected only inside the block."""
+    record_outbound_call(DETA, 1)
+    with collect_outbound_calls() as outbound_calls:
+        record_outbound_call(DETA, 1)
+        record_outbound_call(DETA, 2)
+        record_outbound_call(TELEGRAM, 1)
+        counts = outbound_calls.counts
+        durations = outbound_calls.durations
+
+    record_outbound_call(TELEGRAM, 1)
+    assert counts == {DETA: 2, TELEGRAM: 1}
+    assert durations == {DETA: 3, TELEGRAM: 1}
+
+
+async def test_catalog_cache_metrics() -> None:
+    """Test that catalog cache reads are rendered by application registry."""
+    repo = CachedArticlesRepo(VersionedArticlesRepo(), CatalogCache(ttl=0))
+    await repo.get_articles()
+    await repo.get_articles()
+
+    rendered_metrics = metrics_registry.render()
+    for read_result in (CACHE_HIT, CACHE_MISS, CACHE_REVALIDATION):
+        metric_prefix = CACHE_READS_PREFIX.format(result=read_result)
+        assert metric_prefix in rendered_metrics
@@ -0,0 +1,56 @@
+"""Tests for binary data reading helpers."""
+
+
+from io import BytesIO
+from typing import AsyncIterator
+
+import pytest
+
+from chip_logistics.utils.streams import get_size, iter_parts
+
+PART_SIZE = 4
+
+TEST_DATA = b'abcdefghij'
+
+EXPECTED_PARTS = (b'abcd', b'efgh', b'ij')
+
+HEADER = b'header'
+
+
+async def stream_chunks() -> AsyncIterator[bytes]:
+    """Stream test data by chunks not aligned with parts.
+
+    Yields:
+        Test data chunks.
+    """
+    for offset in range(0, len(TEST_DATA), 3):
+        yield TEST_DATA[offset:offset + 3]
+
+
+async def test_bytes_parts() -> None:
+    """Test that bytes are split by views of the same buffer."""
+    parts = [part async for part in iter_parts(TEST_DATA, PART_SIZE)]
+    assert tuple(bytes(part) for part in parts) == EXPECTED_PARTS
+    assert all(
+        isinstance(part, memoryview) and part.obj is TEST_DATA
+        for part in parts
+    )
+
+
+async def test_file_parts() -> None:
+    """Test that file object is read by parts from current position."""
+    file_object = BytesIO(b''.join((HEADER, TEST_DATA)))
+    file_object.seek(len(HEADER))
+    assert get_size(file_object) == len(TEST_DATA)
+
+    parts = [part async for part in iter_parts(file_object, PART_SIZE)]
+    assert tuple(parts) == EXPECTED_PARTS
+
+
+async def test_stream_parts() -> None:
+    """Test that stream chunks are regrouped to parts."""
+    with pytest.raises(ValueError, match='unknown'):
+        get_size(stream_chunks())
+
+    parts = [part async for part in iter_parts(stream_chunks(), PART_SIZE)]
+    assert tuple(parts) == EXPECTED_PARTS
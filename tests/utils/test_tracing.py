@@ -0,0 +1,107 @@
+"""Tests for HTTP client requests tracing."""
+
+
+import logging
+
+import pytest
+from aiohttp import ClientSession, TraceConfig, web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from chip_logistics.utils.metrics import metrics_registry
+from chip_logistics.utils.outbound import collect_outbound_calls
+from chip_logistics.utils.tracing import create_trace_config, get_endpoint
+
+TEST_HOST = 'localhost'
+
+ITEM_PATH = '/items/12345'
+
+# Any request is slower
+SLOW_REQUEST_SECONDS = 1e-9
+
+REQUEST_PHASES = ('dns', 'connect', 'ttfb', 'body')
+
+PHASES_COUNTS_PREFIX = (
+    'http_client_phase_duration_seconds_count{host="localhost",'
+)
+
+PHASE_LABELS_PATTERN = 'endpoint="/items/{{id}}",phase="{phase}"}}'
+
+
+async def send_body(request: web.Request) -> web.Response:
+    """Respond with body.
+
+    Args:
+        request: Test request.
+
+    Returns:
+        Response with text body.
+    """
+    return web.Response(text='body')
+
+
+@pytest.mark.parametrize(('path', 'endpoint'), [
+    ('/bot123:abc/sendMessage', '/{secret}/sendMessage'),
+    ('/api/v4/contacts/12345', '/api/v4/contacts/{id}'),
+    (
+        '/v1.0/sessions/3fa85f64-5717-4562-b3fc-2c963f66afa6',
+        '/v1.0/sessions/{id}',
+    ),
+])
+def test_endpoint(path: str, endpoint: str) -> None:
+    """Test that identifiers and secrets are masked in endpoints.
+
+    Args:
+        path: Request url path.
+        endpoint: Expected endpoint.
+    """
+    assert get_endpoint(URL('https://example.com').with_path(path)) == (
+        endpoint
+    )
+
+
+async def request_item(trace_config: TraceConfig) -> dict[str, int]:
+    """Request item from test server by host name.
+
+    Args:
+        trace_config: Client session trace config.
+
+    Returns:
+        Outbound calls counts by hosts.
+    """
+    item_app = web.Application()
+    item_app.router.add_get(ITEM_PATH, send_body)
+    async with TestServer(item_app, host=TEST_HOST) as server:
+        async with ClientSession(trace_configs=[trace_config]) as session:
+            with collect_outbound_calls() as outbound_calls:
+                async with session.get(
+                    server.make_url(ITEM_PATH).with_host(TEST_HOST),
+                ) as response:
+                    assert await response.text() == 'body'
+
+                return outbound_calls.counts
+
+
+async def test_request_phases(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that phases are recorded and slow request is logged.
+
+    Args:
+        caplog: Logs capture.
+    """
+    trace_config = create_trace_config(SLOW_REQUEST_SECONDS)
+    assert await request_item(trace_config) == {TEST_HOST: 1}
+
+    phases_labels = {
+        metric_line.removeprefix(PHASES_COUNTS_PREFIX).split(' ')[0]
+        for metric_line in metrics_registry.render().splitlines()
+        if metric_line.startswith(PHASES_COUNTS_PREFIX)
+    }
+    for phase in REQUEST_PHASES:
+        assert PHASE_LABELS_PATTERN.format(phase=phase) in phases_labels
+
+    slow_records = [
+        log_record
+        for log_record in caplog.records
+        if log_record.levelno == logging.WARNING
+    ]
+    assert len(slow_records) == 1
@@ -0,0 +1,73 @@
+"""Tests for background jobs workers."""
+
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from chip_logistics.utils.workers import KeyedWorkersPool
+
+KEYS_COUNT = 5
+
+JOBS_PER_KEY = 10
+
+
+class JobsLog(object):
+    """Log of finished jobs."""
+
+    def __init__(self) -> None:
+        """Initialize empty log."""
+        self.finished: list[tuple[int, int]] = []
+
+    async def run(self, key: int, job_number: int) -> None:
+        """Run job, switching context before finishing.
+
+        Args:
+            key: Job key.
+            job_number: Number of job with the key.
+        """
+        await asyncio.sleep(0)
+        self.finished.append((key, job_number))
+
+    def finished_by_keys(self) -> list[tuple[int, int]]:
+        """Get finished jobs grouped by keys in order of finishing.
+
+        Returns:
+            Finished jobs keys and numbers.
+        """
+        return sorted(self.finished, key=lambda finished_job: finished_job[0])
+
+
+async def fail() -> None:
+    """Run failing job.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    raise RuntimeError('Job failed')
+
+
+async def test_keys_order() -> None:
+    """Test that jobs of each key are finished in submission order."""
+    jobs_log = JobsLog()
+    async with KeyedWorkersPool(3, JOBS_PER_KEY * KEYS_COUNT * 2) as pool:
+        for job_number in range(JOBS_PER_KEY):
+            for key in range(KEYS_COUNT):
+                pool.submit(key, fail)
+                pool.submit(key, partial(jobs_log.run, key, job_number))
+
+    # Pending jobs are finished on close, failed ones are skipped.
+    assert len(jobs_log.finished) == JOBS_PER_KEY * KEYS_COUNT
+    assert sorted(jobs_log.finished) == jobs_log.finished_by_keys()
+
+
+async def test_queue_full() -> None:
+    """Test that jobs above queue size are rejected."""
+    jobs_log = JobsLog()
+    async with KeyedWorkersPool(1, 1) as pool:
+        pool.submit(0, partial(jobs_log.run, 0, 0))
+        with pytest.raises(asyncio.QueueFull):
+            pool.submit(0, partial(jobs_log.run, 0, 1))
+
+    assert jobs_log.finished == [(0, 0)]